@@ -8,78 +8,167 @@ Exports to FBX format for Roblox import.
 """
 
 import bpy
+import bmesh
 import os
 import math
+import numpy as np
+from contextlib import contextmanager
 from mathutils import Vector
 
 
-def clear_scene():
-    """Remove all objects from the scene."""
-    bpy.ops.object.select_all(action='SELECT')
-    bpy.ops.object.delete()
-
-    # Clear orphan data
-    for block in bpy.data.meshes:
-        if block.users == 0:
-            bpy.data.meshes.remove(block)
-    for block in bpy.data.materials:
-        if block.users == 0:
-            bpy.data.materials.remove(block)
-
+@contextmanager
+def fast_build():
+    """Suppress undo bookkeeping while bulk-building assets.
 
-def create_material(name: str, color: tuple, emission: float = 0.0) -> bpy.types.Material:
+    The few operators left in the pipeline (exporters, mainly) each push
+    an undo step covering the whole file. Nothing in a headless batch
+    run ever undoes, so turn global undo off for the duration and
+    restore the user's setting afterwards.
     """
-    Create a simple material with color and optional emission.
+    prefs = bpy.context.preferences.edit
+    saved = prefs.use_global_undo
+    prefs.use_global_undo = False
+    try:
+        yield
+    finally:
+        prefs.use_global_undo = saved
 
-    Args:
-        name: Material name
-        color: RGB or RGBA tuple (0-1 range)
-        emission: Emission strength (0 = no glow)
-    """
-    mat = bpy.data.materials.new(name=name)
+
+def clear_scene():
+    """Remove all objects from the scene."""
+    # Low-level batch removal: no operator dispatch or selection rewrite,
+    # and one scene update instead of one per deleted object
+    bpy.data.batch_remove(tuple(bpy.data.objects))
+
+    # Clear orphan data in one batch as well
+    orphans = [block for block in bpy.data.meshes if block.users == 0]
+    orphans += [block for block in bpy.data.materials if block.users == 0]
+    if orphans:
+        bpy.data.batch_remove(orphans)
+
+
+# Materials already built this session, keyed by (name, rgba, emission).
+# The asset scripts recreate identical materials dozens of times, and every
+# miss allocates a fresh shader node tree.
+_MATERIAL_CACHE = {}
+
+# Prototype flat-color material; new materials copy its node tree and
+# overwrite inputs instead of rebuilding nodes and links from scratch
+_MATERIAL_TEMPLATE = None
+
+
+def _material_template() -> bpy.types.Material:
+    """Get (or build once) the Principled-BSDF prototype material."""
+    global _MATERIAL_TEMPLATE
+    if _MATERIAL_TEMPLATE is not None:
+        try:
+            _MATERIAL_TEMPLATE.name
+            return _MATERIAL_TEMPLATE
+        except ReferenceError:
+            _MATERIAL_TEMPLATE = None
+
+    mat = bpy.data.materials.new(name="FlatColorTemplate")
     mat.use_nodes = True
+    mat.use_fake_user = True
 
     nodes = mat.node_tree.nodes
     links = mat.node_tree.links
-
-    # Clear default nodes
     nodes.clear()
 
-    # Create nodes
     output = nodes.new('ShaderNodeOutputMaterial')
     output.location = (300, 0)
 
     principled = nodes.new('ShaderNodeBsdfPrincipled')
     principled.location = (0, 0)
 
+    links.new(principled.outputs['BSDF'], output.inputs['Surface'])
+
+    _MATERIAL_TEMPLATE = mat
+    return mat
+
+
+def create_material(name: str, color: tuple, emission: float = 0.0) -> bpy.types.Material:
+    """
+    Create a simple material with color and optional emission.
+
+    Results are cached by (name, color, emission), so repeat calls with
+    the same arguments return the existing material instead of rebuilding
+    its node tree.
+
+    Args:
+        name: Material name
+        color: RGB or RGBA tuple (0-1 range)
+        emission: Emission strength (0 = no glow)
+    """
     # Handle both RGB (3 values) and RGBA (4 values)
     if len(color) == 3:
         rgba = (*color, 1.0)
     else:
-        rgba = color[:4]  # Take first 4 values
-
+        rgba = tuple(color[:4])  # Take first 4 values
+
+    key = (name, rgba, emission)
+    cached = _MATERIAL_CACHE.get(key)
+    if cached is not None:
+        try:
+            cached.name  # Raises ReferenceError if the datablock was removed
+            return cached
+        except ReferenceError:
+            del _MATERIAL_CACHE[key]
+
+    # Copy the prototype's node tree and only touch the inputs that
+    # differ; the copy keeps fake_user, so the cache entry survives
+    # clear_scene's orphan purge
+    mat = _material_template().copy()
+    mat.name = name
+
+    principled = mat.node_tree.nodes['Principled BSDF']
     principled.inputs['Base Color'].default_value = rgba
 
     if emission > 0:
         principled.inputs['Emission Color'].default_value = rgba
         principled.inputs['Emission Strength'].default_value = emission
 
-    links.new(principled.outputs['BSDF'], output.inputs['Surface'])
-
+    _MATERIAL_CACHE[key] = mat
     return mat
 
 
 def apply_material(obj: bpy.types.Object, material: bpy.types.Material):
-    """Apply a material to an object."""
-    if obj.data.materials:
-        obj.data.materials[0] = material
+    """Apply a material to an object's first slot.
+
+    Objects whose mesh datablock is shared (instanced templates) get an
+    object-linked slot so every instance keeps its own material; the
+    write on the mesh itself only happens for single-user data.
+    """
+    mesh = obj.data
+    if mesh.users > 1:
+        if not mesh.materials:
+            mesh.materials.append(None)
+        slot = obj.material_slots[0]
+        slot.link = 'OBJECT'
+        if slot.material is not material:
+            slot.material = material
+        return
+
+    materials = mesh.materials
+    if materials:
+        # Skip the slot write (and its depsgraph tag) when the slot
+        # already holds this material - common now that materials are
+        # cached and shared between parts
+        if materials[0] is not material:
+            materials[0] = material
     else:
-        obj.data.materials.append(material)
+        materials.append(material)
 
 
 def join_objects(objects: list, name: str = None) -> bpy.types.Object:
     """Join multiple objects into one, optionally renaming the result.
 
+    Merges all the source meshes into one fresh datablock with bmesh
+    rather than bpy.ops.object.join, so there is no selection
+    bookkeeping, no in-place mutation of a (possibly shared) source
+    mesh, and only one scene update. Materials are collected across the
+    parts - honoring object-linked slots - and face indices remapped.
+
     WARNING: This merges all meshes, losing individual part names!
     For multi-part models that need separate named parts in Roblox,
     use group_objects() instead.
@@ -87,17 +176,60 @@ def join_objects(objects: list, name: str = None) -> bpy.types.Object:
     if not objects:
         return None
 
-    bpy.ops.object.select_all(action='DESELECT')
+    # Part transforms were set via bpy.data writes, so resolve every
+    # matrix_world in one update before baking them into the geometry
+    bpy.context.view_layer.update()
 
-    for obj in objects:
-        obj.select_set(True)
-
-    bpy.context.view_layer.objects.active = objects[0]
-    bpy.ops.object.join()
+    bm = bmesh.new()
+    materials = []
+    material_index = {}
+    index_chunks = []
 
-    result = bpy.context.active_object
-    if name:
-        result.name = name
+    for obj in objects:
+        vert_start = len(bm.verts)
+        source = obj.data
+        bm.from_mesh(source)
+        bm.verts.ensure_lookup_table()
+
+        # Bake the part's world transform into its appended vertices
+        bmesh.ops.transform(bm, matrix=obj.matrix_world,
+                            verts=bm.verts[vert_start:])
+
+        # Map this part's material slots into the joined material list
+        # (slot.material follows the slot's OBJECT/DATA link)
+        slot_map = []
+        for slot in obj.material_slots:
+            mat = slot.material
+            if mat not in material_index:
+                material_index[mat] = len(materials)
+                materials.append(mat)
+            slot_map.append(material_index[mat])
+
+        # Remap this part's per-face indices in one gather; the joined
+        # array is written back in a single foreach_set after to_mesh
+        face_count = len(source.polygons)
+        if slot_map:
+            src_indices = np.empty(face_count, dtype=np.int32)
+            source.polygons.foreach_get("material_index", src_indices)
+            index_chunks.append(np.asarray(slot_map, dtype=np.int32)[src_indices])
+        else:
+            index_chunks.append(np.zeros(face_count, dtype=np.int32))
+
+    result_name = name or objects[0].name
+    mesh = bpy.data.meshes.new(result_name)
+    bm.to_mesh(mesh)
+    bm.free()
+
+    for mat in materials:
+        mesh.materials.append(mat)
+    if index_chunks:
+        mesh.polygons.foreach_set("material_index", np.concatenate(index_chunks))
+
+    result = bpy.data.objects.new(result_name, mesh)
+    bpy.context.collection.objects.link(result)
+
+    # Source objects are spent; their (template) meshes stay alive
+    bpy.data.batch_remove(objects)
 
     return result
 
@@ -120,20 +252,48 @@ def group_objects(objects: list, name: str) -> bpy.types.Object:
     if not objects:
         return None
 
-    # Create an Empty as the parent container
-    bpy.ops.object.empty_add(type='PLAIN_AXES', location=(0, 0, 0))
-    parent = bpy.context.active_object
-    parent.name = name
+    # Data-level Empty: no operator dispatch, undo push, or scene update
+    parent = bpy.data.objects.new(name, None)
+    parent.empty_display_type = 'PLAIN_AXES'
+    bpy.context.scene.collection.objects.link(parent)
 
-    # Parent all objects to the Empty
+    # The parent sits at the origin, so its parent-inverse is identity
+    # and a plain parent write keeps every child's world transform
     for obj in objects:
         obj.parent = parent
-        # Keep the object's world transform
-        obj.matrix_parent_inverse = parent.matrix_world.inverted()
 
     return parent
 
 
+# Directories already created this session, so batch exports don't pay a
+# mkdir syscall per file
+_EXPORT_DIRS_CREATED = set()
+
+
+def _ensure_export_dir(filepath: str):
+    """Create the parent directory of an export path, once per session."""
+    directory = os.path.dirname(filepath)
+    if directory and directory not in _EXPORT_DIRS_CREATED:
+        os.makedirs(directory, exist_ok=True)
+        _EXPORT_DIRS_CREATED.add(directory)
+
+
+# Static Roblox FBX export settings (axis conversion, scale handling),
+# resolved once instead of being rebuilt as kwargs on every export call
+FBX_EXPORT_SETTINGS = {
+    'use_selection': False,
+    'apply_unit_scale': True,
+    'apply_scale_options': 'FBX_SCALE_ALL',
+    'axis_forward': '-Z',
+    'axis_up': 'Y',
+    'use_mesh_modifiers': True,
+    'mesh_smooth_type': 'OFF',
+    'use_armature_deform_only': True,
+    'bake_anim': False,
+    'embed_textures': False,
+}
+
+
 def export_fbx(filepath: str, scale: float = 1.0):
     """
     Export scene to FBX for Roblox.
@@ -143,22 +303,19 @@ def export_fbx(filepath: str, scale: float = 1.0):
         scale: Scale multiplier (Roblox uses different units)
     """
     # Ensure directory exists
-    os.makedirs(os.path.dirname(filepath), exist_ok=True)
+    _ensure_export_dir(filepath)
 
+    # Export to a sibling temp file and rename into place. The exporter
+    # only writes to paths (no in-memory buffer to stream), but the
+    # rename makes the swap atomic: parallel build workers and the
+    # hash-skip check never observe a partially written FBX.
+    tmp_path = f"{filepath}.tmp"
     bpy.ops.export_scene.fbx(
-        filepath=filepath,
-        use_selection=False,
+        filepath=tmp_path,
         global_scale=scale,
-        apply_unit_scale=True,
-        apply_scale_options='FBX_SCALE_ALL',
-        axis_forward='-Z',
-        axis_up='Y',
-        use_mesh_modifiers=True,
-        mesh_smooth_type='OFF',
-        use_armature_deform_only=True,
-        bake_anim=False,
-        embed_textures=False,
+        **FBX_EXPORT_SETTINGS,
     )
+    os.replace(tmp_path, filepath)
     print(f"Exported: {filepath}")
 
 
@@ -166,7 +323,7 @@ def export_obj(filepath: str, scale: float = 1.0):
     """
     Export scene to OBJ format (alternative to FBX).
     """
-    os.makedirs(os.path.dirname(filepath), exist_ok=True)
+    _ensure_export_dir(filepath)
 
     bpy.ops.wm.obj_export(
         filepath=filepath,
@@ -178,35 +335,109 @@ def export_obj(filepath: str, scale: float = 1.0):
     print(f"Exported: {filepath}")
 
 
+# Primitive meshes built this session, keyed by (ptype, size). The
+# bpy.ops.mesh.primitive_*_add operators each run context resolution, an
+# undo push, and a full scene update; building the geometry with bmesh and
+# copying a cached template skips all of that.
+_PRIMITIVE_CACHE = {}
+
+
+def _torus_mesh_data(major_radius: float, minor_radius: float,
+                     major_segments: int = 48, minor_segments: int = 12):
+    """Vertices and quad faces for a torus, matching the operator's layout."""
+    u = np.linspace(0, 2 * np.pi, major_segments, endpoint=False)
+    v = np.linspace(0, 2 * np.pi, minor_segments, endpoint=False)
+    uu, vv = np.meshgrid(u, v, indexing='ij')
+
+    ring = major_radius + minor_radius * np.cos(vv)
+    verts = np.stack(
+        (ring * np.cos(uu), ring * np.sin(uu), minor_radius * np.sin(vv)),
+        axis=-1,
+    ).reshape(-1, 3)
+
+    i = np.arange(major_segments)[:, None]
+    j = np.arange(minor_segments)[None, :]
+    a = i * minor_segments + j
+    b = i * minor_segments + (j + 1) % minor_segments
+    c = ((i + 1) % major_segments) * minor_segments + (j + 1) % minor_segments
+    d = ((i + 1) % major_segments) * minor_segments + j
+    faces = np.stack((a, b, c, d), axis=-1).reshape(-1, 4)
+
+    return verts, faces
+
+
+def _primitive_mesh(ptype: str, size: float) -> bpy.types.Mesh:
+    """Get (or build once) the template mesh for a primitive shape."""
+    key = (ptype, size)
+    cached = _PRIMITIVE_CACHE.get(key)
+    if cached is not None:
+        try:
+            cached.name  # Raises ReferenceError if the datablock was removed
+            return cached
+        except ReferenceError:
+            del _PRIMITIVE_CACHE[key]
+
+    mesh = bpy.data.meshes.new(f"{ptype}_{size}")
+
+    if ptype == 'torus':
+        verts, faces = _torus_mesh_data(major_radius=size / 2, minor_radius=size / 6)
+        mesh.from_pydata(verts.tolist(), [], faces.tolist())
+        mesh.update()
+    else:
+        bm = bmesh.new()
+        if ptype == 'cube':
+            bmesh.ops.create_cube(bm, size=size)
+        elif ptype == 'sphere':
+            bmesh.ops.create_uvsphere(bm, u_segments=32, v_segments=16, radius=size / 2)
+        elif ptype == 'cylinder':
+            bmesh.ops.create_cone(bm, cap_ends=True, segments=32,
+                                  radius1=size / 2, radius2=size / 2, depth=size)
+        elif ptype == 'cone':
+            bmesh.ops.create_cone(bm, cap_ends=True, segments=32,
+                                  radius1=size / 2, radius2=0, depth=size)
+        else:
+            bpy.data.meshes.remove(mesh)
+            raise ValueError(f"Unknown primitive type: {ptype}")
+        bm.to_mesh(mesh)
+        bm.free()
+
+    # Keep templates alive across clear_scene's orphan purge
+    mesh.use_fake_user = True
+    _PRIMITIVE_CACHE[key] = mesh
+    return mesh
+
+
 def create_primitive(ptype: str, size: float = 1.0, location: tuple = (0, 0, 0)) -> bpy.types.Object:
     """
     Create a primitive shape.
 
+    Geometry comes from a cached template mesh (copied per object, so
+    callers can still edit it freely) instead of a bpy.ops operator.
+
     Args:
         ptype: 'cube', 'sphere', 'cylinder', 'cone', 'torus'
         size: Base size
         location: Position tuple
     """
-    if ptype == 'cube':
-        bpy.ops.mesh.primitive_cube_add(size=size, location=location)
-    elif ptype == 'sphere':
-        bpy.ops.mesh.primitive_uv_sphere_add(radius=size/2, location=location)
-    elif ptype == 'cylinder':
-        bpy.ops.mesh.primitive_cylinder_add(radius=size/2, depth=size, location=location)
-    elif ptype == 'cone':
-        bpy.ops.mesh.primitive_cone_add(radius1=size/2, depth=size, location=location)
-    elif ptype == 'torus':
-        bpy.ops.mesh.primitive_torus_add(major_radius=size/2, minor_radius=size/6, location=location)
-    else:
-        raise ValueError(f"Unknown primitive type: {ptype}")
+    mesh = _primitive_mesh(ptype, size).copy()
+    mesh.use_fake_user = False
 
-    return bpy.context.active_object
+    obj = bpy.data.objects.new(ptype.capitalize(), mesh)
+    bpy.context.collection.objects.link(obj)
+    obj.location = location
+    return obj
 
 
 def smooth_shade(obj: bpy.types.Object):
-    """Apply smooth shading to an object."""
-    bpy.context.view_layer.objects.active = obj
-    bpy.ops.object.shade_smooth()
+    """Apply smooth shading to an object.
+
+    Writes the use_smooth flag on all polygons in one foreach_set memcpy
+    instead of making the object active and running the shade_smooth
+    operator (which selects every polygon and triggers a scene update).
+    """
+    polygons = obj.data.polygons
+    polygons.foreach_set("use_smooth", np.ones(len(polygons), dtype=bool))
+    obj.data.update()
 
 
 def subdivide(obj: bpy.types.Object, levels: int = 1):
@@ -224,7 +455,9 @@ def setup_fbx_export():
 
 def create_export_directory(path: str):
     """Create export directory if it doesn't exist."""
-    os.makedirs(path, exist_ok=True)
+    if path not in _EXPORT_DIRS_CREATED:
+        os.makedirs(path, exist_ok=True)
+        _EXPORT_DIRS_CREATED.add(path)
     return path
 
 
@@ -250,24 +483,38 @@ def export_model(model_or_filepath, filepath: str = None, scale: float = 0.01):
 
 
 def set_origin_to_bottom(obj: bpy.types.Object):
-    """Set object origin to the bottom center of its bounding box."""
-    bpy.context.view_layer.objects.active = obj
-    obj.select_set(True)
-
-    # Get bounding box in world coordinates
-    bbox = [obj.matrix_world @ Vector(corner) for corner in obj.bound_box]
-    min_z = min(v.z for v in bbox)
-    center_x = sum(v.x for v in bbox) / 8
-    center_y = sum(v.y for v in bbox) / 8
+    """Set object origin to the bottom center of its bounding box.
 
-    # Set 3D cursor to bottom center
-    bpy.context.scene.cursor.location = (center_x, center_y, min_z)
-
-    # Set origin to cursor
-    bpy.ops.object.origin_set(type='ORIGIN_CURSOR')
-
-    # Reset cursor
-    bpy.context.scene.cursor.location = (0, 0, 0)
+    Works directly on the mesh data (shift vertices, move the object the
+    opposite way) instead of the 3D-cursor + origin_set operator dance,
+    so it needs no selection, cursor, or operator context.
+    """
+    # The object may be freshly built via bpy.data, so make sure its
+    # bound_box and matrix_world are evaluated before reading them
+    bpy.context.view_layer.update()
+
+    # Get bounding box in world coordinates: transform all 8 corners in
+    # one homogeneous matrix product instead of per-corner Vector math
+    corners = np.ones((8, 4))
+    corners[:, :3] = np.asarray(obj.bound_box)
+    world = corners @ np.asarray(obj.matrix_world).T
+    center_x, center_y = world[:, :2].mean(axis=0)
+    min_z = world[:, 2].min()
+
+    # New origin in the object's local space
+    target_world = Vector((center_x, center_y, min_z))
+    target_local = obj.matrix_world.inverted() @ target_world
+
+    # Shift all vertices in one foreach_get/foreach_set round trip
+    mesh = obj.data
+    coords = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", coords)
+    coords = coords.reshape(-1, 3) - np.asarray(target_local, dtype=np.float32)
+    mesh.vertices.foreach_set("co", coords.ravel())
+    mesh.update()
+
+    # Move the object so the mesh stays put in world space
+    obj.matrix_world.translation = target_world
 
 
 if __name__ == "__main__":
@@ -1,178 +1,463 @@
-"""
-Combine All FBX Files into One Master FBX
-
-This script:
-1. Imports all individual FBX files from assets/models/for-import/
-2. Names each mesh as Category_AssetName (matching the filename)
-3. Exports ONE combined FBX file
-
-Usage:
-    blender --background --python tools/blender/combine_all_fbx.py
-
-Then in Roblox Studio:
-    File → Import 3D → select combined_all_assets.fbx
-    All meshes appear as separate MeshParts in Workspace!
-"""
-
-import bpy
-import os
-from pathlib import Path
-
-# Paths
-SCRIPT_DIR = Path(__file__).parent
-PROJECT_ROOT = SCRIPT_DIR.parent.parent
-MODELS_DIR = PROJECT_ROOT / "assets" / "models"
-OUTPUT_FILE = PROJECT_ROOT / "assets" / "models" / "combined_all_assets.fbx"
-
-# Category subdirectories to scan (in addition to for-import)
-CATEGORY_DIRS = [
-    "structures",
-    "animals",
-    "creatures",
-    "caves",
-    "npcs",
-    "signs",
-    "liminal",
-    "terrain",
-    "for-import",  # Also check for-import for backwards compatibility
-]
-
-def clear_scene():
-    """Remove all objects from scene."""
-    bpy.ops.object.select_all(action='SELECT')
-    bpy.ops.object.delete()
-
-    # Also clear orphan data
-    for block in bpy.data.meshes:
-        if block.users == 0:
-            bpy.data.meshes.remove(block)
-
-def import_and_combine():
-    """Import all FBX files and combine into one scene."""
-    clear_scene()
-
-    # Collect FBX files from all category directories
-    fbx_files = []
-    for category in CATEGORY_DIRS:
-        category_dir = MODELS_DIR / category
-        if category_dir.exists():
-            for fbx_path in category_dir.glob("*.fbx"):
-                # Add category prefix to help with naming
-                fbx_files.append((category, fbx_path))
-
-    if not fbx_files:
-        print(f"ERROR: No FBX files found in {MODELS_DIR} subdirectories")
-        return False
-
-    print(f"Found {len(fbx_files)} FBX files to combine")
-    print("=" * 50)
-
-    imported_count = 0
-
-    for category, fbx_path in sorted(fbx_files, key=lambda x: x[1].name):
-        # Create asset name: Category_Filename (e.g., "Structures_FerrisWheel")
-        # Capitalize category for consistency
-        category_name = category.capitalize()
-        if category == "for-import":
-            # Already has category prefix in filename
-            asset_name = fbx_path.stem
-        else:
-            asset_name = f"{category_name}_{fbx_path.stem}"
-
-        print(f"Importing: {asset_name} (from {category}/)")
-
-        # Remember what objects exist before import
-        existing_objects = set(bpy.data.objects.keys())
-
-        # Import the FBX
-        try:
-            bpy.ops.import_scene.fbx(filepath=str(fbx_path))
-        except Exception as e:
-            print(f"  ERROR importing {fbx_path}: {e}")
-            continue
-
-        # Find newly imported objects
-        new_objects = [obj for obj in bpy.data.objects if obj.name not in existing_objects]
-
-        if not new_objects:
-            print(f"  WARNING: No objects imported from {fbx_path}")
-            continue
-
-        # If multiple objects were imported, they might be in a hierarchy
-        # Find the root(s) and rename appropriately
-        for i, obj in enumerate(new_objects):
-            if obj.type == 'MESH':
-                # Name the mesh with the asset name
-                if len([o for o in new_objects if o.type == 'MESH']) == 1:
-                    obj.name = asset_name
-                else:
-                    obj.name = f"{asset_name}_part{i}"
-
-                # Position slightly offset so they don't all stack at origin
-                # (Roblox will use the positions from the FBX)
-                row = imported_count // 10
-                col = imported_count % 10
-                obj.location = (col * 5, row * 5, 0)
-
-        imported_count += 1
-        print(f"  OK: {asset_name}")
-
-    print("=" * 50)
-    print(f"Imported {imported_count} assets")
-
-    return imported_count > 0
-
-def export_combined():
-    """Export all objects as one FBX file."""
-    # Select all mesh objects
-    bpy.ops.object.select_all(action='DESELECT')
-    for obj in bpy.data.objects:
-        if obj.type == 'MESH':
-            obj.select_set(True)
-
-    # Ensure output directory exists
-    OUTPUT_FILE.parent.mkdir(parents=True, exist_ok=True)
-
-    # Export
-    bpy.ops.export_scene.fbx(
-        filepath=str(OUTPUT_FILE),
-        use_selection=True,
-        apply_scale_options='FBX_SCALE_ALL',
-        bake_space_transform=True,
-        mesh_smooth_type='FACE',
-    )
-
-    print(f"Exported combined FBX to: {OUTPUT_FILE}")
-
-def main():
-    print("=" * 50)
-    print("COMBINE ALL FBX FILES")
-    print("=" * 50)
-
-    if not MODELS_DIR.exists():
-        print(f"ERROR: Models directory not found: {MODELS_DIR}")
-        print("Run the create_*.py scripts first")
-        return
-
-    print(f"Scanning: {MODELS_DIR}")
-    print(f"Categories: {', '.join(CATEGORY_DIRS)}")
-
-    if import_and_combine():
-        export_combined()
-        print("")
-        print("=" * 50)
-        print("DONE!")
-        print("=" * 50)
-        print(f"""
-In Roblox Studio:
-  1. File → Import 3D
-  2. Select: {OUTPUT_FILE}
-  3. All meshes appear as separate MeshParts in Workspace.Meshes!
-
-No need to use Asset Manager or insert one by one.
-""")
-    else:
-        print("ERROR: No files were imported")
-
-if __name__ == "__main__":
-    main()
+"""
+Combine All FBX Files into One Master FBX
+
+This script:
+1. Imports all individual FBX files from assets/models/for-import/
+2. Names each mesh as Category_AssetName (matching the filename)
+3. Exports ONE combined FBX file
+
+Usage:
+    blender --background --python tools/blender/combine_all_fbx.py
+
+Parallel usage (spawns one headless Blender worker per shard, then
+appends the shard .blend files and exports once):
+    blender --background --python tools/blender/combine_all_fbx.py -- --jobs 4
+
+Then in Roblox Studio:
+    File → Import 3D → select combined_all_assets.fbx
+    All meshes appear as separate MeshParts in Workspace!
+"""
+
+import bpy
+import argparse
+import hashlib
+import numpy as np
+import os
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# Add script directory for imports
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from blender_utils import clear_scene
+
+# Paths
+SCRIPT_DIR = Path(__file__).parent
+PROJECT_ROOT = SCRIPT_DIR.parent.parent
+MODELS_DIR = PROJECT_ROOT / "assets" / "models"
+OUTPUT_FILE = PROJECT_ROOT / "assets" / "models" / "combined_all_assets.fbx"
+SHARD_DIR = MODELS_DIR / ".shards"
+CACHE_DIR = MODELS_DIR / ".fbx_cache"
+
+# Category subdirectories to scan (in addition to for-import)
+CATEGORY_DIRS = [
+    "structures",
+    "animals",
+    "creatures",
+    "caves",
+    "npcs",
+    "signs",
+    "liminal",
+    "terrain",
+    "for-import",  # Also check for-import for backwards compatibility
+]
+
+def collect_fbx_files():
+    """Collect (category, path) pairs for every FBX under the category dirs.
+
+    Sorted by filename so the import order (and thus grid placement)
+    is deterministic across serial and sharded runs.
+    """
+    fbx_files = []
+    for category in CATEGORY_DIRS:
+        category_dir = MODELS_DIR / category
+        if category_dir.exists():
+            # Plain directory scan with a suffix check - no glob pattern
+            # compilation/matching per entry
+            for fbx_path in category_dir.iterdir():
+                if fbx_path.suffix == ".fbx":
+                    # Add category prefix to help with naming
+                    fbx_files.append((category, fbx_path))
+
+    fbx_files.sort(key=lambda x: x[1].name)
+    return fbx_files
+
+def asset_name_for(category, fbx_path):
+    """Build the asset name: Category_Filename (e.g. "Structures_FerrisWheel")."""
+    if category == "for-import":
+        # Already has category prefix in filename
+        return fbx_path.stem
+    return f"{category.capitalize()}_{fbx_path.stem}"
+
+def assign_shards(fbx_files, shard_count):
+    """Split (index, category, path) work items into load-balanced shards.
+
+    Greedy bin packing by file size: biggest files first, each into the
+    currently lightest shard. Deterministic, so every worker computes the
+    same assignment from the same file list.
+    """
+    indexed = list(enumerate(fbx_files))
+    indexed.sort(key=lambda item: (-item[1][1].stat().st_size, item[1][1].name))
+
+    shards = [[] for _ in range(shard_count)]
+    loads = [0] * shard_count
+    for index, (category, fbx_path) in indexed:
+        target = loads.index(min(loads))
+        shards[target].append((index, category, fbx_path))
+        loads[target] += fbx_path.stat().st_size
+
+    return shards
+
+# Importer settings baked into the cached .blend files. The unit/axis
+# conversion work the importer does under these settings happens exactly
+# once per FBX; cache hits append already-converted datablocks. These are
+# static props, so skip animation import entirely.
+IMPORT_SETTINGS = {
+    "use_anim": False,
+}
+
+# How many imports between orphan-datablock purges in import_files()
+ORPHAN_PURGE_INTERVAL = 25
+
+def cache_blend_path(fbx_path):
+    """Cache file for an FBX, keyed by (path, mtime, size, import settings).
+
+    Any edit or re-export of the source FBX - or a change to the importer
+    settings above - changes the key, so stale cache entries are simply
+    never hit again.
+    """
+    stat = fbx_path.stat()
+    key = f"{fbx_path}:{stat.st_mtime_ns}:{stat.st_size}:{sorted(IMPORT_SETTINGS.items())}"
+    digest = hashlib.sha1(key.encode()).hexdigest()[:16]
+    return CACHE_DIR / f"{fbx_path.stem}_{digest}.blend"
+
+def append_objects_from_blend(blend_path):
+    """Append all objects from a .blend file, returning them as a list."""
+    with bpy.data.libraries.load(str(blend_path), link=False) as (data_from, data_to):
+        data_to.objects = data_from.objects
+
+    new_objects = [obj for obj in data_to.objects if obj is not None]
+    for obj in new_objects:
+        bpy.context.scene.collection.objects.link(obj)
+    return new_objects
+
+def import_or_load_cached(fbx_path):
+    """Import an FBX, going through the .blend cache when possible.
+
+    The FBX importer re-parses the whole file on every run; appending the
+    cached .blend skips the parse entirely on repeat builds. Returns the
+    list of newly added objects plus whether they still need caching.
+    """
+    cache_path = cache_blend_path(fbx_path)
+    if cache_path.exists():
+        return append_objects_from_blend(cache_path), None
+
+    bpy.ops.import_scene.fbx(filepath=str(fbx_path), **IMPORT_SETTINGS)
+
+    # The importer leaves exactly the imported objects selected, so read
+    # the selection instead of diffing a name-set snapshot against all of
+    # bpy.data.objects - that rescan made the import loop O(N^2) overall.
+    # import_files() deselects each batch after processing it.
+    new_objects = list(bpy.context.selected_objects)
+    return new_objects, cache_path
+
+def import_files(work_items):
+    """Import a list of (global_index, category, path) items into the scene.
+
+    The global index drives grid placement so shards don't overlap.
+    Returns the number of assets imported and the imported mesh objects.
+    """
+    imported_count = 0
+    placements = []
+
+    # Precompute the whole 10-wide placement grid up front: one row-major
+    # meshgrid covering every global index this run can see, so placement
+    # below is a single indexed load per object instead of div/mod math.
+    grid_rows = max(index for index, _, _ in work_items) // 10 + 1 if work_items else 0
+    cols, rows = np.meshgrid(np.arange(10), np.arange(grid_rows), indexing='xy')
+    grid = np.zeros((grid_rows * 10, 3))
+    grid[:, 0] = cols.reshape(-1) * 5.0
+    grid[:, 1] = rows.reshape(-1) * 5.0
+
+    for global_index, category, fbx_path in work_items:
+        asset_name = asset_name_for(category, fbx_path)
+        print(f"Importing: {asset_name} (from {category}/)")
+
+        try:
+            new_objects, cache_path = import_or_load_cached(fbx_path)
+        except Exception as e:
+            print(f"  ERROR importing {fbx_path}: {e}")
+            continue
+
+        if not new_objects:
+            print(f"  WARNING: No objects imported from {fbx_path}")
+            continue
+
+        # If multiple objects were imported, they might be in a hierarchy
+        # Find the root(s) and rename appropriately
+        mesh_count = len([o for o in new_objects if o.type == 'MESH'])
+        for i, obj in enumerate(new_objects):
+            if obj.type == 'MESH':
+                # Name the mesh with the asset name
+                if mesh_count == 1:
+                    obj.name = asset_name
+                else:
+                    obj.name = f"{asset_name}_part{i}"
+
+        # First sight of this FBX: snapshot the renamed objects so repeat
+        # builds can append the .blend instead of re-parsing the FBX.
+        # (Written before placement - the grid offset depends on batch order.)
+        if cache_path is not None:
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            bpy.data.libraries.write(str(cache_path), set(new_objects), fake_user=False)
+
+        # Queue grid placement instead of moving objects mid-loop, so the
+        # depsgraph isn't re-evaluating our edits on every import
+        placements.extend(
+            (obj, global_index) for obj in new_objects if obj.type == 'MESH'
+        )
+
+        # Deselect this batch so the next import's selection is clean
+        for obj in new_objects:
+            obj.select_set(False)
+
+        imported_count += 1
+        print(f"  OK: {asset_name}")
+
+        # The FBX importer can leave behind zero-user datablocks (images,
+        # stray materials) that pile up across hundreds of imports and make
+        # every later bpy.data walk slower. Purge them periodically; kept
+        # objects are linked to the scene, so they're never touched.
+        if imported_count % ORPHAN_PURGE_INTERVAL == 0:
+            bpy.data.orphans_purge(do_recursive=True)
+
+    # Position slightly offset so assets don't all stack at origin
+    # (Roblox will use the positions from the FBX). The whole translation
+    # grid is computed as one numpy array, then written in one pass.
+    if placements:
+        indices = np.fromiter(
+            (global_index for _, global_index in placements),
+            dtype=np.int64, count=len(placements),
+        )
+        locations = grid[indices]
+        for (obj, _), location in zip(placements, locations):
+            obj.location = location
+        bpy.context.view_layer.update()
+
+    return imported_count, [obj for obj, _ in placements]
+
+def import_and_combine():
+    """Import all FBX files and combine into one scene.
+
+    Returns the list of imported mesh objects (empty on failure).
+    """
+    clear_scene()
+
+    fbx_files = collect_fbx_files()
+
+    if not fbx_files:
+        print(f"ERROR: No FBX files found in {MODELS_DIR} subdirectories")
+        return []
+
+    print(f"Found {len(fbx_files)} FBX files to combine")
+    print("=" * 50)
+
+    work_items = [(i, category, path) for i, (category, path) in enumerate(fbx_files)]
+    imported_count, meshes = import_files(work_items)
+
+    print("=" * 50)
+    print(f"Imported {imported_count} assets")
+
+    return meshes
+
+def shard_blend_path(shard_index):
+    return SHARD_DIR / f"shard_{shard_index}.blend"
+
+def shard_fbx_path(shard_index):
+    return MODELS_DIR / f"combined_part_{shard_index}.fbx"
+
+def run_shard(shard_index, shard_count, export_shard=False):
+    """Worker mode: import this shard's files and save them to a .blend.
+
+    With export_shard, the worker also exports its own FBX so the export
+    I/O runs in parallel across workers instead of one final serial pass.
+    """
+    clear_scene()
+
+    fbx_files = collect_fbx_files()
+    if not fbx_files:
+        print(f"ERROR: No FBX files found in {MODELS_DIR} subdirectories")
+        return False
+
+    shard = assign_shards(fbx_files, shard_count)[shard_index]
+    print(f"Shard {shard_index + 1}/{shard_count}: {len(shard)} files")
+    _, meshes = import_files(shard)
+
+    SHARD_DIR.mkdir(parents=True, exist_ok=True)
+    bpy.ops.wm.save_as_mainfile(filepath=str(shard_blend_path(shard_index)))
+
+    if export_shard:
+        export_combined(shard_fbx_path(shard_index), meshes=meshes)
+    return True
+
+def combine_shards(shard_count):
+    """Reducer: append every shard .blend into a fresh scene.
+
+    Returns the appended objects (empty on failure).
+    """
+    clear_scene()
+
+    appended = []
+    for shard_index in range(shard_count):
+        blend_path = shard_blend_path(shard_index)
+        if not blend_path.exists():
+            print(f"  WARNING: Missing shard file {blend_path}")
+            continue
+
+        with bpy.data.libraries.load(str(blend_path), link=False) as (data_from, data_to):
+            data_to.objects = data_from.objects
+
+        for obj in data_to.objects:
+            if obj is not None:
+                bpy.context.scene.collection.objects.link(obj)
+                appended.append(obj)
+
+    print(f"Appended {len(appended)} objects from {shard_count} shards")
+    return appended
+
+def run_parallel(jobs, split_output=False):
+    """Driver mode: fan shards out to headless Blender workers, then reduce.
+
+    Per-file FBX import is embarrassingly parallel, so each worker imports
+    its shard in its own Blender process and saves an intermediate .blend.
+    This process then appends the shards and exports the combined FBX once.
+    With split_output, each worker streams out its own combined_part_N.fbx
+    instead, so export I/O overlaps across workers and no reduce is needed.
+    """
+    jobs = max(1, min(jobs, os.cpu_count() or 1))
+    print(f"Running {jobs} import workers")
+
+    SHARD_DIR.mkdir(parents=True, exist_ok=True)
+
+    def launch_worker(shard_index):
+        cmd = [
+            bpy.app.binary_path, "--background",
+            "--python", str(Path(__file__).resolve()),
+            "--", "--shard", f"{shard_index + 1}/{jobs}",
+        ]
+        if split_output:
+            cmd.append("--export-shard")
+        return subprocess.run(cmd, check=False).returncode
+
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        return_codes = list(pool.map(launch_worker, range(jobs)))
+
+    failures = [i for i, code in enumerate(return_codes) if code != 0]
+    if failures:
+        print(f"ERROR: Worker(s) failed for shard(s): {failures}")
+        return None
+
+    if split_output:
+        for shard_index in range(jobs):
+            print(f"Exported shard FBX: {shard_fbx_path(shard_index)}")
+        return []
+
+    return combine_shards(jobs)
+
+def export_combined(filepath=OUTPUT_FILE, meshes=None):
+    """Export mesh objects as one FBX file.
+
+    Callers that just imported pass their running mesh list; scanning all
+    of bpy.data.objects is kept only as a fallback for cold scenes.
+    """
+    if meshes is None:
+        meshes = [obj for obj in bpy.data.objects if obj.type == 'MESH']
+    else:
+        meshes = [obj for obj in meshes if obj.type == 'MESH']
+
+    # Ensure output directory exists
+    filepath.parent.mkdir(parents=True, exist_ok=True)
+
+    # Imported props normally carry no modifiers; in that case export the
+    # meshes as-is so the exporter reuses their cached tessellation instead
+    # of pulling a freshly evaluated copy of every mesh from the depsgraph.
+    # (The pipeline only ever touches object transforms, never mesh data.)
+    needs_modifiers = any(obj.modifiers for obj in meshes)
+
+    # Hand the exporter its object set via a context override rather than
+    # rewriting the selection state object by object
+    with bpy.context.temp_override(selected_objects=meshes):
+        bpy.ops.export_scene.fbx(
+            filepath=str(filepath),
+            use_selection=True,
+            use_mesh_modifiers=needs_modifiers,
+            apply_scale_options='FBX_SCALE_ALL',
+            bake_space_transform=True,
+            mesh_smooth_type='FACE',
+        )
+
+    print(f"Exported combined FBX to: {filepath}")
+
+def parse_args():
+    """Parse args after Blender's '--' separator."""
+    argv = sys.argv
+    argv = argv[argv.index("--") + 1:] if "--" in argv else []
+
+    parser = argparse.ArgumentParser(description="Combine FBX files into one master FBX")
+    parser.add_argument("--shard", metavar="i/N",
+                        help="Worker mode: import shard i of N to an intermediate .blend")
+    parser.add_argument("--jobs", type=int, default=0,
+                        help="Driver mode: spawn N Blender workers, then combine and export")
+    parser.add_argument("--split-output", action="store_true",
+                        help="With --jobs: export one combined_part_N.fbx per shard "
+                             "instead of a single combined FBX")
+    parser.add_argument("--export-shard", action="store_true",
+                        help="Worker-internal: also export this shard's FBX")
+    return parser.parse_args(argv)
+
+def print_done_banner():
+    print("")
+    print("=" * 50)
+    print("DONE!")
+    print("=" * 50)
+    print(f"""
+In Roblox Studio:
+  1. File → Import 3D
+  2. Select: {OUTPUT_FILE}
+  3. All meshes appear as separate MeshParts in Workspace.Meshes!
+
+No need to use Asset Manager or insert one by one.
+""")
+
+def main():
+    print("=" * 50)
+    print("COMBINE ALL FBX FILES")
+    print("=" * 50)
+
+    if not MODELS_DIR.exists():
+        print(f"ERROR: Models directory not found: {MODELS_DIR}")
+        print("Run the create_*.py scripts first")
+        return
+
+    args = parse_args()
+
+    if args.shard:
+        shard_index, shard_count = (int(n) for n in args.shard.split("/"))
+        if not run_shard(shard_index - 1, shard_count, export_shard=args.export_shard):
+            sys.exit(1)
+        return
+
+    print(f"Scanning: {MODELS_DIR}")
+    print(f"Categories: {', '.join(CATEGORY_DIRS)}")
+
+    if args.jobs > 0:
+        meshes = run_parallel(args.jobs, split_output=args.split_output)
+        if meshes is None:
+            print("ERROR: No files were imported")
+            return
+        if args.split_output:
+            # Workers already streamed their own shard FBX files
+            return
+    else:
+        meshes = import_and_combine()
+
+    if not meshes:
+        print("ERROR: No files were imported")
+        return
+
+    export_combined(meshes=meshes)
+    print_done_banner()
+
+if __name__ == "__main__":
+    main()
@@ -1,724 +1,951 @@
-#!/usr/bin/env python3
-"""
-Faultline Fear: Animal Model Generator
-
-Creates wildlife animal models:
-- Day animals (passive): Deer, Bird, Rabbit, Fish
-- Night predators (hostile): Wolf, Coyote, MountainLion
-
-Usage:
-    blender --background --python tools/blender/create_animals.py
-
-Output:
-    assets/models/animals/*.fbx
-"""
-
-import bpy
-import os
-import sys
-import math
-
-# Add parent directory for imports
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-from blender_utils import (
-    clear_scene,
-    setup_fbx_export,
-    create_export_directory,
-    export_model,
-    set_origin_to_bottom,
-    join_objects,
-    create_material,
-)
-
-
-def create_deer():
-    """Create a deer model - graceful quadruped."""
-    clear_scene()
-    parts = []
-
-    # Body
-    bpy.ops.mesh.primitive_uv_sphere_add(
-        radius=0.5,
-        location=(0, 0, 0.8),
-        scale=(1.5, 0.6, 0.8)
-    )
-    body = bpy.context.active_object
-    body.name = "Body"
-    bpy.ops.object.shade_smooth()
-    parts.append(body)
-
-    body_mat = create_material("DeerBody", (0.55, 0.4, 0.28, 1.0))
-    body.data.materials.append(body_mat)
-
-    # Neck
-    bpy.ops.mesh.primitive_cylinder_add(
-        radius=0.15,
-        depth=0.6,
-        location=(0.5, 0, 1.1),
-        rotation=(0, -0.5, 0)
-    )
-    neck = bpy.context.active_object
-    neck.name = "Neck"
-    neck.data.materials.append(body_mat)
-    parts.append(neck)
-
-    # Head
-    bpy.ops.mesh.primitive_uv_sphere_add(
-        radius=0.2,
-        location=(0.75, 0, 1.35),
-        scale=(1.3, 0.8, 1)
-    )
-    head = bpy.context.active_object
-    head.name = "Head"
-    bpy.ops.object.shade_smooth()
-    head.data.materials.append(body_mat)
-    parts.append(head)
-
-    # Snout
-    bpy.ops.mesh.primitive_cone_add(
-        radius1=0.1,
-        radius2=0.05,
-        depth=0.2,
-        location=(0.9, 0, 1.3),
-        rotation=(0, 1.57, 0)
-    )
-    snout = bpy.context.active_object
-    snout.name = "Snout"
-    snout.data.materials.append(body_mat)
-    parts.append(snout)
-
-    # Ears
-    ear_mat = create_material("DeerEars", (0.5, 0.35, 0.25, 1.0))
-    for z_off in [0.1, -0.1]:
-        bpy.ops.mesh.primitive_cone_add(
-            radius1=0.06,
-            radius2=0.02,
-            depth=0.15,
-            location=(0.65, z_off, 1.5),
-            rotation=(0.3, 0, 0 if z_off > 0 else 0)
-        )
-        ear = bpy.context.active_object
-        ear.name = f"Ear_{z_off}"
-        ear.data.materials.append(ear_mat)
-        parts.append(ear)
-
-    # Legs (4)
-    leg_mat = create_material("DeerLegs", (0.45, 0.32, 0.22, 1.0))
-    leg_positions = [
-        (0.35, 0.15, 0.35),
-        (0.35, -0.15, 0.35),
-        (-0.35, 0.15, 0.35),
-        (-0.35, -0.15, 0.35),
-    ]
-    for i, pos in enumerate(leg_positions):
-        bpy.ops.mesh.primitive_cylinder_add(
-            radius=0.05,
-            depth=0.7,
-            location=pos
-        )
-        leg = bpy.context.active_object
-        leg.name = f"Leg_{i}"
-        leg.data.materials.append(leg_mat)
-        parts.append(leg)
-
-    # Tail (small)
-    bpy.ops.mesh.primitive_uv_sphere_add(
-        radius=0.08,
-        location=(-0.7, 0, 0.9)
-    )
-    tail = bpy.context.active_object
-    tail.name = "Tail"
-    tail_mat = create_material("DeerTail", (1, 1, 0.9, 1.0))
-    tail.data.materials.append(tail_mat)
-    parts.append(tail)
-
-    model = join_objects(parts, "Deer")
-    set_origin_to_bottom(model)
-    return model
-
-
-def create_bird():
-    """Create a small bird model."""
-    clear_scene()
-    parts = []
-
-    # Body
-    bpy.ops.mesh.primitive_uv_sphere_add(
-        radius=0.1,
-        location=(0, 0, 0.1),
-        scale=(1.2, 0.8, 0.8)
-    )
-    body = bpy.context.active_object
-    body.name = "Body"
-    bpy.ops.object.shade_smooth()
-    parts.append(body)
-
-    body_mat = create_material("BirdBody", (0.4, 0.45, 0.5, 1.0))
-    body.data.materials.append(body_mat)
-
-    # Head
-    bpy.ops.mesh.primitive_uv_sphere_add(
-        radius=0.06,
-        location=(0.1, 0, 0.15)
-    )
-    head = bpy.context.active_object
-    head.name = "Head"
-    bpy.ops.object.shade_smooth()
-    head.data.materials.append(body_mat)
-    parts.append(head)
-
-    # Beak
-    bpy.ops.mesh.primitive_cone_add(
-        radius1=0.02,
-        radius2=0.005,
-        depth=0.06,
-        location=(0.16, 0, 0.14),
-        rotation=(0, 1.57, 0)
-    )
-    beak = bpy.context.active_object
-    beak.name = "Beak"
-    beak_mat = create_material("BirdBeak", (0.9, 0.7, 0.3, 1.0))
-    beak.data.materials.append(beak_mat)
-    parts.append(beak)
-
-    # Wings
-    wing_mat = create_material("BirdWings", (0.35, 0.4, 0.45, 1.0))
-    for z_off in [0.05, -0.05]:
-        bpy.ops.mesh.primitive_cube_add(
-            size=1,
-            location=(0, z_off * 2, 0.12),
-            scale=(0.08, 0.12, 0.02)
-        )
-        wing = bpy.context.active_object
-        wing.name = f"Wing_{z_off}"
-        wing.data.materials.append(wing_mat)
-        parts.append(wing)
-
-    # Tail feathers
-    bpy.ops.mesh.primitive_cube_add(
-        size=1,
-        location=(-0.12, 0, 0.1),
-        scale=(0.06, 0.04, 0.01)
-    )
-    tail = bpy.context.active_object
-    tail.name = "Tail"
-    tail.data.materials.append(body_mat)
-    parts.append(tail)
-
-    model = join_objects(parts, "Bird")
-    set_origin_to_bottom(model)
-    return model
-
-
-def create_rabbit():
-    """Create a rabbit model."""
-    clear_scene()
-    parts = []
-
-    # Body
-    bpy.ops.mesh.primitive_uv_sphere_add(
-        radius=0.15,
-        location=(0, 0, 0.15),
-        scale=(1.3, 0.9, 0.9)
-    )
-    body = bpy.context.active_object
-    body.name = "Body"
-    bpy.ops.object.shade_smooth()
-    parts.append(body)
-
-    body_mat = create_material("RabbitBody", (0.7, 0.65, 0.55, 1.0))
-    body.data.materials.append(body_mat)
-
-    # Head
-    bpy.ops.mesh.primitive_uv_sphere_add(
-        radius=0.1,
-        location=(0.18, 0, 0.2)
-    )
-    head = bpy.context.active_object
-    head.name = "Head"
-    bpy.ops.object.shade_smooth()
-    head.data.materials.append(body_mat)
-    parts.append(head)
-
-    # Ears (long)
-    ear_mat = create_material("RabbitEars", (0.75, 0.6, 0.5, 1.0))
-    for z_off in [0.04, -0.04]:
-        bpy.ops.mesh.primitive_cylinder_add(
-            radius=0.02,
-            depth=0.15,
-            location=(0.15, z_off, 0.35),
-            rotation=(0.2, 0, 0 if z_off > 0 else 0)
-        )
-        ear = bpy.context.active_object
-        ear.name = f"Ear_{z_off}"
-        ear.data.materials.append(ear_mat)
-        parts.append(ear)
-
-    # Nose
-    bpy.ops.mesh.primitive_uv_sphere_add(
-        radius=0.02,
-        location=(0.27, 0, 0.2)
-    )
-    nose = bpy.context.active_object
-    nose.name = "Nose"
-    nose_mat = create_material("RabbitNose", (0.9, 0.6, 0.6, 1.0))
-    nose.data.materials.append(nose_mat)
-    parts.append(nose)
-
-    # Tail (fluffy ball)
-    bpy.ops.mesh.primitive_uv_sphere_add(
-        radius=0.05,
-        location=(-0.18, 0, 0.15)
-    )
-    tail = bpy.context.active_object
-    tail.name = "Tail"
-    tail_mat = create_material("RabbitTail", (0.95, 0.95, 0.9, 1.0))
-    tail.data.materials.append(tail_mat)
-    parts.append(tail)
-
-    # Legs
-    for i, pos in enumerate([(0.08, 0.05, 0.05), (0.08, -0.05, 0.05),
-                              (-0.08, 0.06, 0.06), (-0.08, -0.06, 0.06)]):
-        bpy.ops.mesh.primitive_uv_sphere_add(
-            radius=0.04 if i < 2 else 0.05,
-            location=pos
-        )
-        leg = bpy.context.active_object
-        leg.name = f"Leg_{i}"
-        leg.data.materials.append(body_mat)
-        parts.append(leg)
-
-    model = join_objects(parts, "Rabbit")
-    set_origin_to_bottom(model)
-    return model
-
-
-def create_fish():
-    """Create a simple fish model."""
-    clear_scene()
-    parts = []
-
-    # Body
-    bpy.ops.mesh.primitive_uv_sphere_add(
-        radius=0.1,
-        location=(0, 0, 0),
-        scale=(2, 0.5, 0.8)
-    )
-    body = bpy.context.active_object
-    body.name = "Body"
-    bpy.ops.object.shade_smooth()
-    parts.append(body)
-
-    body_mat = create_material("FishBody", (0.4, 0.6, 0.7, 1.0))
-    body.data.materials.append(body_mat)
-
-    # Tail fin
-    bpy.ops.mesh.primitive_cone_add(
-        radius1=0.08,
-        radius2=0.01,
-        depth=0.1,
-        location=(-0.2, 0, 0),
-        rotation=(0, -1.57, 0)
-    )
-    tail = bpy.context.active_object
-    tail.name = "Tail"
-    fin_mat = create_material("FishFin", (0.35, 0.55, 0.65, 1.0))
-    tail.data.materials.append(fin_mat)
-    parts.append(tail)
-
-    # Dorsal fin
-    bpy.ops.mesh.primitive_cone_add(
-        radius1=0.04,
-        radius2=0.01,
-        depth=0.06,
-        location=(0, 0, 0.08),
-        rotation=(0, 0, 0)
-    )
-    dorsal = bpy.context.active_object
-    dorsal.name = "Dorsal"
-    dorsal.data.materials.append(fin_mat)
-    parts.append(dorsal)
-
-    # Eye
-    bpy.ops.mesh.primitive_uv_sphere_add(
-        radius=0.015,
-        location=(0.12, 0.04, 0.02)
-    )
-    eye = bpy.context.active_object
-    eye.name = "Eye"
-    eye_mat = create_material("FishEye", (0.1, 0.1, 0.1, 1.0))
-    eye.data.materials.append(eye_mat)
-    parts.append(eye)
-
-    model = join_objects(parts, "Fish")
-    set_origin_to_bottom(model)
-    return model
-
-
-def create_wolf():
-    """Create a wolf model - aggressive predator."""
-    clear_scene()
-    parts = []
-
-    # Body
-    bpy.ops.mesh.primitive_uv_sphere_add(
-        radius=0.4,
-        location=(0, 0, 0.5),
-        scale=(1.6, 0.6, 0.8)
-    )
-    body = bpy.context.active_object
-    body.name = "Body"
-    bpy.ops.object.shade_smooth()
-    parts.append(body)
-
-    body_mat = create_material("WolfBody", (0.3, 0.3, 0.35, 1.0))
-    body.data.materials.append(body_mat)
-
-    # Neck/Chest
-    bpy.ops.mesh.primitive_uv_sphere_add(
-        radius=0.25,
-        location=(0.4, 0, 0.55),
-        scale=(0.8, 0.8, 1)
-    )
-    chest = bpy.context.active_object
-    chest.name = "Chest"
-    bpy.ops.object.shade_smooth()
-    chest.data.materials.append(body_mat)
-    parts.append(chest)
-
-    # Head
-    bpy.ops.mesh.primitive_uv_sphere_add(
-        radius=0.18,
-        location=(0.6, 0, 0.65),
-        scale=(1.2, 0.8, 0.9)
-    )
-    head = bpy.context.active_object
-    head.name = "Head"
-    bpy.ops.object.shade_smooth()
-    head.data.materials.append(body_mat)
-    parts.append(head)
-
-    # Snout
-    bpy.ops.mesh.primitive_cone_add(
-        radius1=0.1,
-        radius2=0.04,
-        depth=0.2,
-        location=(0.78, 0, 0.6),
-        rotation=(0, 1.57, 0)
-    )
-    snout = bpy.context.active_object
-    snout.name = "Snout"
-    snout.data.materials.append(body_mat)
-    parts.append(snout)
-
-    # Ears
-    ear_mat = create_material("WolfEars", (0.25, 0.25, 0.3, 1.0))
-    for z_off in [0.1, -0.1]:
-        bpy.ops.mesh.primitive_cone_add(
-            radius1=0.05,
-            radius2=0.02,
-            depth=0.12,
-            location=(0.55, z_off, 0.8),
-            rotation=(0.2, 0, 0.2 if z_off > 0 else -0.2)
-        )
-        ear = bpy.context.active_object
-        ear.name = f"Ear_{z_off}"
-        ear.data.materials.append(ear_mat)
-        parts.append(ear)
-
-    # Legs
-    leg_mat = create_material("WolfLegs", (0.28, 0.28, 0.32, 1.0))
-    leg_positions = [
-        (0.3, 0.12, 0.25),
-        (0.3, -0.12, 0.25),
-        (-0.3, 0.12, 0.25),
-        (-0.3, -0.12, 0.25),
-    ]
-    for i, pos in enumerate(leg_positions):
-        bpy.ops.mesh.primitive_cylinder_add(
-            radius=0.05,
-            depth=0.5,
-            location=pos
-        )
-        leg = bpy.context.active_object
-        leg.name = f"Leg_{i}"
-        leg.data.materials.append(leg_mat)
-        parts.append(leg)
-
-    # Tail (bushy)
-    bpy.ops.mesh.primitive_cylinder_add(
-        radius=0.06,
-        depth=0.4,
-        location=(-0.55, 0, 0.45),
-        rotation=(0, 0.8, 0)
-    )
-    tail = bpy.context.active_object
-    tail.name = "Tail"
-    tail.data.materials.append(body_mat)
-    parts.append(tail)
-
-    model = join_objects(parts, "Wolf")
-    set_origin_to_bottom(model)
-    return model
-
-
-def create_coyote():
-    """Create a coyote model - smaller, faster than wolf."""
-    clear_scene()
-    parts = []
-
-    # Body (slimmer than wolf)
-    bpy.ops.mesh.primitive_uv_sphere_add(
-        radius=0.3,
-        location=(0, 0, 0.4),
-        scale=(1.5, 0.5, 0.7)
-    )
-    body = bpy.context.active_object
-    body.name = "Body"
-    bpy.ops.object.shade_smooth()
-    parts.append(body)
-
-    body_mat = create_material("CoyoteBody", (0.6, 0.45, 0.35, 1.0))
-    body.data.materials.append(body_mat)
-
-    # Chest
-    bpy.ops.mesh.primitive_uv_sphere_add(
-        radius=0.18,
-        location=(0.3, 0, 0.45),
-        scale=(0.8, 0.8, 1)
-    )
-    chest = bpy.context.active_object
-    chest.name = "Chest"
-    bpy.ops.object.shade_smooth()
-    chest.data.materials.append(body_mat)
-    parts.append(chest)
-
-    # Head
-    bpy.ops.mesh.primitive_uv_sphere_add(
-        radius=0.12,
-        location=(0.45, 0, 0.52),
-        scale=(1.3, 0.8, 0.9)
-    )
-    head = bpy.context.active_object
-    head.name = "Head"
-    bpy.ops.object.shade_smooth()
-    head.data.materials.append(body_mat)
-    parts.append(head)
-
-    # Snout (longer, thinner)
-    bpy.ops.mesh.primitive_cone_add(
-        radius1=0.06,
-        radius2=0.02,
-        depth=0.18,
-        location=(0.58, 0, 0.48),
-        rotation=(0, 1.57, 0)
-    )
-    snout = bpy.context.active_object
-    snout.name = "Snout"
-    snout.data.materials.append(body_mat)
-    parts.append(snout)
-
-    # Large ears
-    ear_mat = create_material("CoyoteEars", (0.55, 0.4, 0.32, 1.0))
-    for z_off in [0.08, -0.08]:
-        bpy.ops.mesh.primitive_cone_add(
-            radius1=0.05,
-            radius2=0.01,
-            depth=0.14,
-            location=(0.4, z_off, 0.68),
-            rotation=(0.15, 0, 0.25 if z_off > 0 else -0.25)
-        )
-        ear = bpy.context.active_object
-        ear.name = f"Ear_{z_off}"
-        ear.data.materials.append(ear_mat)
-        parts.append(ear)
-
-    # Legs (thin)
-    leg_positions = [
-        (0.2, 0.1, 0.2),
-        (0.2, -0.1, 0.2),
-        (-0.2, 0.1, 0.2),
-        (-0.2, -0.1, 0.2),
-    ]
-    for i, pos in enumerate(leg_positions):
-        bpy.ops.mesh.primitive_cylinder_add(
-            radius=0.035,
-            depth=0.4,
-            location=pos
-        )
-        leg = bpy.context.active_object
-        leg.name = f"Leg_{i}"
-        leg.data.materials.append(body_mat)
-        parts.append(leg)
-
-    # Bushy tail
-    bpy.ops.mesh.primitive_cylinder_add(
-        radius=0.045,
-        depth=0.35,
-        location=(-0.4, 0, 0.35),
-        rotation=(0, 0.6, 0)
-    )
-    tail = bpy.context.active_object
-    tail.name = "Tail"
-    tail.data.materials.append(body_mat)
-    parts.append(tail)
-
-    model = join_objects(parts, "Coyote")
-    set_origin_to_bottom(model)
-    return model
-
-
-def create_mountain_lion():
-    """Create a mountain lion model - large, powerful predator."""
-    clear_scene()
-    parts = []
-
-    # Body (muscular)
-    bpy.ops.mesh.primitive_uv_sphere_add(
-        radius=0.45,
-        location=(0, 0, 0.55),
-        scale=(1.8, 0.65, 0.8)
-    )
-    body = bpy.context.active_object
-    body.name = "Body"
-    bpy.ops.object.shade_smooth()
-    parts.append(body)
-
-    body_mat = create_material("LionBody", (0.7, 0.55, 0.4, 1.0))
-    body.data.materials.append(body_mat)
-
-    # Chest
-    bpy.ops.mesh.primitive_uv_sphere_add(
-        radius=0.3,
-        location=(0.45, 0, 0.6),
-        scale=(0.9, 0.85, 1)
-    )
-    chest = bpy.context.active_object
-    chest.name = "Chest"
-    bpy.ops.object.shade_smooth()
-    chest.data.materials.append(body_mat)
-    parts.append(chest)
-
-    # Head (rounded)
-    bpy.ops.mesh.primitive_uv_sphere_add(
-        radius=0.2,
-        location=(0.65, 0, 0.7)
-    )
-    head = bpy.context.active_object
-    head.name = "Head"
-    bpy.ops.object.shade_smooth()
-    head.data.materials.append(body_mat)
-    parts.append(head)
-
-    # Snout
-    bpy.ops.mesh.primitive_uv_sphere_add(
-        radius=0.1,
-        location=(0.8, 0, 0.65),
-        scale=(1.2, 0.9, 0.8)
-    )
-    snout = bpy.context.active_object
-    snout.name = "Snout"
-    bpy.ops.object.shade_smooth()
-    snout.data.materials.append(body_mat)
-    parts.append(snout)
-
-    # Small ears
-    ear_mat = create_material("LionEars", (0.65, 0.5, 0.38, 1.0))
-    for z_off in [0.1, -0.1]:
-        bpy.ops.mesh.primitive_cone_add(
-            radius1=0.04,
-            radius2=0.02,
-            depth=0.08,
-            location=(0.6, z_off, 0.88),
-            rotation=(0.1, 0, 0)
-        )
-        ear = bpy.context.active_object
-        ear.name = f"Ear_{z_off}"
-        ear.data.materials.append(ear_mat)
-        parts.append(ear)
-
-    # Powerful legs
-    leg_mat = create_material("LionLegs", (0.65, 0.5, 0.38, 1.0))
-    leg_positions = [
-        (0.35, 0.15, 0.28),
-        (0.35, -0.15, 0.28),
-        (-0.35, 0.15, 0.28),
-        (-0.35, -0.15, 0.28),
-    ]
-    for i, pos in enumerate(leg_positions):
-        bpy.ops.mesh.primitive_cylinder_add(
-            radius=0.06,
-            depth=0.55,
-            location=pos
-        )
-        leg = bpy.context.active_object
-        leg.name = f"Leg_{i}"
-        leg.data.materials.append(leg_mat)
-        parts.append(leg)
-
-    # Long tail
-    bpy.ops.mesh.primitive_cylinder_add(
-        radius=0.04,
-        depth=0.6,
-        location=(-0.65, 0, 0.45),
-        rotation=(0, 0.4, 0)
-    )
-    tail = bpy.context.active_object
-    tail.name = "Tail"
-    tail.data.materials.append(body_mat)
-    parts.append(tail)
-
-    # Tail tip (darker)
-    bpy.ops.mesh.primitive_uv_sphere_add(
-        radius=0.05,
-        location=(-0.9, 0, 0.35)
-    )
-    tail_tip = bpy.context.active_object
-    tail_tip.name = "TailTip"
-    tip_mat = create_material("LionTailTip", (0.3, 0.25, 0.2, 1.0))
-    tail_tip.data.materials.append(tip_mat)
-    parts.append(tail_tip)
-
-    model = join_objects(parts, "MountainLion")
-    set_origin_to_bottom(model)
-    return model
-
-
-def main():
-    """Generate all animal models."""
-    print("=" * 50)
-    print("Faultline Fear: Animal Model Generator")
-    print("=" * 50)
-
-    output_dir = create_export_directory("assets/models/animals")
-    setup_fbx_export()
-
-    # Generate models
-    models = [
-        # Day animals
-        ("Deer", create_deer),
-        ("Bird", create_bird),
-        ("Rabbit", create_rabbit),
-        ("Fish", create_fish),
-
-        # Night predators
-        ("Wolf", create_wolf),
-        ("Coyote", create_coyote),
-        ("MountainLion", create_mountain_lion),
-    ]
-
-    for name, create_func in models:
-        print(f"\nCreating {name}...")
-        model = create_func()
-
-        filepath = os.path.join(output_dir, f"{name}.fbx")
-        export_model(model, filepath)
-        print(f"  Exported: {filepath}")
-
-    print("\n" + "=" * 50)
-    print(f"Generated {len(models)} animal models")
-    print("=" * 50)
-
-
-if __name__ == "__main__":
-    main()
+#!/usr/bin/env python3
+"""
+Faultline Fear: Animal Model Generator
+
+Creates wildlife animal models:
+- Day animals (passive): Deer, Bird, Rabbit, Fish
+- Night predators (hostile): Wolf, Coyote, MountainLion
+
+Usage:
+    blender --background --python tools/blender/create_animals.py
+
+Output:
+    assets/models/animals/*.fbx
+"""
+
+import bpy
+import bmesh
+import argparse
+import hashlib
+import os
+import subprocess
+import sys
+import math
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+from mathutils import Vector
+
+# Add parent directory for imports
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from blender_utils import (
+    clear_scene,
+    fast_build,
+    setup_fbx_export,
+    create_export_directory,
+    export_model,
+    set_origin_to_bottom,
+    join_objects,
+    create_material,
+)
+
+
+# Named animal palette, one entry per original create_material call site.
+# palette_material dedupes by color: the browns shared across the
+# predators (e.g. LionEars/LionLegs) resolve to a single material
+# datablock instead of each rebuilding an identical node tree.
+COLORS = {
+    "DeerBody": (0.55, 0.4, 0.28, 1.0),
+    "DeerEars": (0.5, 0.35, 0.25, 1.0),
+    "DeerLegs": (0.45, 0.32, 0.22, 1.0),
+    "DeerTail": (1, 1, 0.9, 1.0),
+    "BirdBody": (0.4, 0.45, 0.5, 1.0),
+    "BirdBeak": (0.9, 0.7, 0.3, 1.0),
+    "BirdWings": (0.35, 0.4, 0.45, 1.0),
+    "RabbitBody": (0.7, 0.65, 0.55, 1.0),
+    "RabbitEars": (0.75, 0.6, 0.5, 1.0),
+    "RabbitNose": (0.9, 0.6, 0.6, 1.0),
+    "RabbitTail": (0.95, 0.95, 0.9, 1.0),
+    "FishBody": (0.4, 0.6, 0.7, 1.0),
+    "FishFin": (0.35, 0.55, 0.65, 1.0),
+    "FishEye": (0.1, 0.1, 0.1, 1.0),
+    "WolfBody": (0.3, 0.3, 0.35, 1.0),
+    "WolfEars": (0.25, 0.25, 0.3, 1.0),
+    "WolfLegs": (0.28, 0.28, 0.32, 1.0),
+    "CoyoteBody": (0.6, 0.45, 0.35, 1.0),
+    "CoyoteEars": (0.55, 0.4, 0.32, 1.0),
+    "LionBody": (0.7, 0.55, 0.4, 1.0),
+    "LionEars": (0.65, 0.5, 0.38, 1.0),
+    "LionLegs": (0.65, 0.5, 0.38, 1.0),
+    "LionTailTip": (0.3, 0.25, 0.2, 1.0),
+}
+
+# First palette name seen for each distinct color; later names with the
+# same color reuse that material via create_material's cache
+_COLOR_NAMES = {}
+
+
+def palette_material(key):
+    """Material for a named palette entry, shared between equal colors."""
+    rgba = tuple(round(c, 3) for c in COLORS[key])
+    name = _COLOR_NAMES.setdefault(rgba, key)
+    return create_material(name, rgba)
+
+
+# Target world-space edge length for curved primitives. Resolution scales
+# with part size: a deer body sphere keeps plenty of segments, while a
+# rabbit nose at radius 0.02 drops from hundreds of triangles to a few
+# dozen with no visible difference at game scale.
+AVERAGE_EDGE_LENGTH = 0.03
+
+
+def _segments_for(radius):
+    """Ring segment count for a given radius, clamped to sane bounds."""
+    return max(6, min(32, int(2 * math.pi * radius / AVERAGE_EDGE_LENGTH)))
+
+
+def _build_uv_sphere(bm, radius=1.0):
+    segments = _segments_for(radius)
+    bmesh.ops.create_uvsphere(
+        bm, u_segments=segments, v_segments=max(4, segments // 2), radius=radius)
+
+
+def _build_cylinder(bm, radius=1.0, depth=2.0):
+    bmesh.ops.create_cone(
+        bm, cap_ends=True, segments=_segments_for(radius),
+        radius1=radius, radius2=radius, depth=depth)
+
+
+def _build_cone(bm, radius1=1.0, radius2=0.0, depth=2.0):
+    bmesh.ops.create_cone(
+        bm, cap_ends=True, segments=_segments_for(max(radius1, radius2)),
+        radius1=radius1, radius2=radius2, depth=depth)
+
+
+# Geometry builders for each primitive kind, writing straight into a
+# bmesh. The bpy.ops.mesh.primitive_*_add operators each run context
+# resolution, an undo push, and a full depsgraph update per call - dozens
+# of times per animal. Building the mesh data directly skips all of that.
+_PRIMITIVE_BUILDERS = {
+    "uv_sphere": _build_uv_sphere,
+    "cylinder": _build_cylinder,
+    "cone": _build_cone,
+    "cube": lambda bm, size=1.0: bmesh.ops.create_cube(bm, size=size),
+}
+
+
+# Template meshes built this session, keyed by (kind, smooth, dims).
+# Legs, ears, and eyes recur with identical dimensions both within one
+# animal and across all seven, so parts share one mesh datablock per
+# shape and only differ by object transform and material.
+_PRIM_CACHE = {}
+
+
+def _template_mesh(kind, smooth, dims):
+    """Get (or build once) the shared template mesh for a primitive."""
+    key = (kind, smooth, tuple(sorted(dims.items())))
+    cached = _PRIM_CACHE.get(key)
+    if cached is not None:
+        try:
+            cached.name  # Raises ReferenceError if the datablock was removed
+            return cached
+        except ReferenceError:
+            del _PRIM_CACHE[key]
+
+    bm = bmesh.new()
+    _PRIMITIVE_BUILDERS[kind](bm, **dims)
+    if smooth:
+        # Shading is baked into the template (mesh data is shared, so it
+        # can't vary per object) - one flag write here replaces the old
+        # per-object shade_smooth operator calls
+        for face in bm.faces:
+            face.smooth = True
+    mesh = bpy.data.meshes.new(kind)
+    bm.to_mesh(mesh)
+    bm.free()
+
+    # One empty slot so parts can bind materials at the object level
+    # without touching the shared mesh
+    mesh.materials.append(None)
+    # Keep templates alive across clear_scene's orphan purge
+    mesh.use_fake_user = True
+    _PRIM_CACHE[key] = mesh
+    return mesh
+
+
+def make_primitive(kind, name, location=(0, 0, 0), rotation=(0, 0, 0),
+                   scale=(1, 1, 1), smooth=False, **dims):
+    """Create a primitive part without going through bpy.ops.
+
+    Geometry comes from a cached template mesh shared between all parts
+    of the same shape; the new object just links it with its own
+    transform - no operator, no selection churn, no per-call scene update.
+
+    Args:
+        kind: 'uv_sphere', 'cylinder', 'cone', or 'cube'
+        name: Object name (becomes the part name in Roblox)
+        smooth: Bake smooth shading into the template
+        dims: Dimensions for the builder (radius, depth, radius1, ...)
+    """
+    obj = bpy.data.objects.new(name, _template_mesh(kind, smooth, dims))
+    bpy.context.collection.objects.link(obj)
+    obj.location = location
+    obj.rotation_euler = rotation
+    obj.scale = scale
+    return obj
+
+
+# Leg stance sign grid shared by every quadruped: front/back x left/right.
+# Each animal only differs by its (x, y, z) stance scalars.
+_QUAD_LEG_SIGNS = np.array([[+1, +1], [+1, -1], [-1, +1], [-1, -1]], dtype=np.float32)
+
+
+def quad_leg_positions(x_off, y_off, z):
+    """(4, 3) world positions for a quadruped's legs."""
+    return np.column_stack([
+        _QUAD_LEG_SIGNS[:, 0] * x_off,
+        _QUAD_LEG_SIGNS[:, 1] * y_off,
+        np.full(4, z, dtype=np.float32),
+    ])
+
+
+def make_merged_parts(kind, name, positions, smooth=False, **dims):
+    """One object holding a template copy at each of the given positions.
+
+    The quadrupeds' legs are four identical cylinders differing only by
+    translation; merging them into a single part up front means one
+    object to link, one material slot to bind, and one less pass for the
+    final join. Positions can be any (N, 3) array-like.
+    """
+    template = _template_mesh(kind, smooth, dims)
+    bm = bmesh.new()
+    for position in np.asarray(positions, dtype=np.float32):
+        vert_start = len(bm.verts)
+        bm.from_mesh(template)
+        bm.verts.ensure_lookup_table()
+        bmesh.ops.translate(bm, vec=Vector(position), verts=bm.verts[vert_start:])
+
+    mesh = bpy.data.meshes.new(name)
+    bm.to_mesh(mesh)
+    bm.free()
+    mesh.materials.append(None)
+
+    obj = bpy.data.objects.new(name, mesh)
+    bpy.context.collection.objects.link(obj)
+    return obj
+
+
+def assign_part_material(obj, material):
+    """Bind a material to a part at the object level.
+
+    Parts share template mesh datablocks, so appending to
+    obj.data.materials would recolor every user of that mesh. Object-
+    linked slots keep the material per part.
+    """
+    slot = obj.material_slots[0]
+    slot.link = 'OBJECT'
+    slot.material = material
+
+
+def reset_animal_scene():
+    """Drop the previous animal without a full datablock sweep.
+
+    Between animals the scene only holds the previous model, so unlink
+    and remove just the scene's objects plus whatever meshes those owned
+    outright. Cached templates and materials are fake-user datablocks
+    and stay warm for the next animal.
+    """
+    objects = tuple(bpy.context.scene.collection.all_objects)
+    meshes = {obj.data for obj in objects if obj.type == 'MESH'}
+    bpy.data.batch_remove(objects)
+    orphans = tuple(mesh for mesh in meshes if mesh.users == 0)
+    if orphans:
+        bpy.data.batch_remove(orphans)
+
+
+def create_deer():
+    """Create a deer model - graceful quadruped."""
+    reset_animal_scene()
+    parts = []
+
+    # Body
+    body = make_primitive(
+        "uv_sphere", "Body",
+        radius=0.5,
+        location=(0, 0, 0.8),
+        scale=(1.5, 0.6, 0.8),
+        smooth=True
+    )
+    parts.append(body)
+
+    body_mat = palette_material("DeerBody")
+    assign_part_material(body, body_mat)
+
+    # Neck
+    neck = make_primitive(
+        "cylinder", "Neck",
+        radius=0.15,
+        depth=0.6,
+        location=(0.5, 0, 1.1),
+        rotation=(0, -0.5, 0)
+    )
+    assign_part_material(neck, body_mat)
+    parts.append(neck)
+
+    # Head
+    head = make_primitive(
+        "uv_sphere", "Head",
+        radius=0.2,
+        location=(0.75, 0, 1.35),
+        scale=(1.3, 0.8, 1),
+        smooth=True
+    )
+    assign_part_material(head, body_mat)
+    parts.append(head)
+
+    # Snout
+    snout = make_primitive(
+        "cone", "Snout",
+        radius1=0.1,
+        radius2=0.05,
+        depth=0.2,
+        location=(0.9, 0, 1.3),
+        rotation=(0, 1.57, 0)
+    )
+    assign_part_material(snout, body_mat)
+    parts.append(snout)
+
+    # Ears
+    ear_mat = palette_material("DeerEars")
+    for z_off in [0.1, -0.1]:
+        ear = make_primitive(
+            "cone", f"Ear_{z_off}",
+            radius1=0.06,
+            radius2=0.02,
+            depth=0.15,
+            location=(0.65, z_off, 1.5),
+            rotation=(0.3, 0, 0 if z_off > 0 else 0)
+        )
+        assign_part_material(ear, ear_mat)
+        parts.append(ear)
+
+    # Legs (4)
+    leg_mat = palette_material("DeerLegs")
+    leg_positions = quad_leg_positions(0.35, 0.15, 0.35)
+    legs = make_merged_parts("cylinder", "Legs", leg_positions, radius=0.05, depth=0.7)
+    assign_part_material(legs, leg_mat)
+    parts.append(legs)
+
+    # Tail (small)
+    tail = make_primitive(
+        "uv_sphere", "Tail",
+        radius=0.08,
+        location=(-0.7, 0, 0.9)
+    )
+    tail_mat = palette_material("DeerTail")
+    assign_part_material(tail, tail_mat)
+    parts.append(tail)
+
+    model = join_objects(parts, "Deer")
+    set_origin_to_bottom(model)
+    return model
+
+
+def create_bird():
+    """Create a small bird model."""
+    reset_animal_scene()
+    parts = []
+
+    # Body
+    body = make_primitive(
+        "uv_sphere", "Body",
+        radius=0.1,
+        location=(0, 0, 0.1),
+        scale=(1.2, 0.8, 0.8),
+        smooth=True
+    )
+    parts.append(body)
+
+    body_mat = palette_material("BirdBody")
+    assign_part_material(body, body_mat)
+
+    # Head
+    head = make_primitive(
+        "uv_sphere", "Head",
+        radius=0.06,
+        location=(0.1, 0, 0.15),
+        smooth=True
+    )
+    assign_part_material(head, body_mat)
+    parts.append(head)
+
+    # Beak
+    beak = make_primitive(
+        "cone", "Beak",
+        radius1=0.02,
+        radius2=0.005,
+        depth=0.06,
+        location=(0.16, 0, 0.14),
+        rotation=(0, 1.57, 0)
+    )
+    beak_mat = palette_material("BirdBeak")
+    assign_part_material(beak, beak_mat)
+    parts.append(beak)
+
+    # Wings
+    wing_mat = palette_material("BirdWings")
+    for z_off in [0.05, -0.05]:
+        wing = make_primitive(
+            "cube", f"Wing_{z_off}",
+            size=1,
+            location=(0, z_off * 2, 0.12),
+            scale=(0.08, 0.12, 0.02)
+        )
+        assign_part_material(wing, wing_mat)
+        parts.append(wing)
+
+    # Tail feathers
+    tail = make_primitive(
+        "cube", "Tail",
+        size=1,
+        location=(-0.12, 0, 0.1),
+        scale=(0.06, 0.04, 0.01)
+    )
+    assign_part_material(tail, body_mat)
+    parts.append(tail)
+
+    model = join_objects(parts, "Bird")
+    set_origin_to_bottom(model)
+    return model
+
+
+def create_rabbit():
+    """Create a rabbit model."""
+    reset_animal_scene()
+    parts = []
+
+    # Body
+    body = make_primitive(
+        "uv_sphere", "Body",
+        radius=0.15,
+        location=(0, 0, 0.15),
+        scale=(1.3, 0.9, 0.9),
+        smooth=True
+    )
+    parts.append(body)
+
+    body_mat = palette_material("RabbitBody")
+    assign_part_material(body, body_mat)
+
+    # Head
+    head = make_primitive(
+        "uv_sphere", "Head",
+        radius=0.1,
+        location=(0.18, 0, 0.2),
+        smooth=True
+    )
+    assign_part_material(head, body_mat)
+    parts.append(head)
+
+    # Ears (long)
+    ear_mat = palette_material("RabbitEars")
+    for z_off in [0.04, -0.04]:
+        ear = make_primitive(
+            "cylinder", f"Ear_{z_off}",
+            radius=0.02,
+            depth=0.15,
+            location=(0.15, z_off, 0.35),
+            rotation=(0.2, 0, 0 if z_off > 0 else 0)
+        )
+        assign_part_material(ear, ear_mat)
+        parts.append(ear)
+
+    # Nose
+    nose = make_primitive(
+        "uv_sphere", "Nose",
+        radius=0.02,
+        location=(0.27, 0, 0.2)
+    )
+    nose_mat = palette_material("RabbitNose")
+    assign_part_material(nose, nose_mat)
+    parts.append(nose)
+
+    # Tail (fluffy ball)
+    tail = make_primitive(
+        "uv_sphere", "Tail",
+        radius=0.05,
+        location=(-0.18, 0, 0.15)
+    )
+    tail_mat = palette_material("RabbitTail")
+    assign_part_material(tail, tail_mat)
+    parts.append(tail)
+
+    # Legs
+    for i, pos in enumerate([(0.08, 0.05, 0.05), (0.08, -0.05, 0.05),
+                              (-0.08, 0.06, 0.06), (-0.08, -0.06, 0.06)]):
+        leg = make_primitive(
+            "uv_sphere", f"Leg_{i}",
+            radius=0.04 if i < 2 else 0.05,
+            location=pos
+        )
+        assign_part_material(leg, body_mat)
+        parts.append(leg)
+
+    model = join_objects(parts, "Rabbit")
+    set_origin_to_bottom(model)
+    return model
+
+
+def create_fish():
+    """Create a simple fish model."""
+    reset_animal_scene()
+    parts = []
+
+    # Body
+    body = make_primitive(
+        "uv_sphere", "Body",
+        radius=0.1,
+        location=(0, 0, 0),
+        scale=(2, 0.5, 0.8),
+        smooth=True
+    )
+    parts.append(body)
+
+    body_mat = palette_material("FishBody")
+    assign_part_material(body, body_mat)
+
+    # Tail fin
+    tail = make_primitive(
+        "cone", "Tail",
+        radius1=0.08,
+        radius2=0.01,
+        depth=0.1,
+        location=(-0.2, 0, 0),
+        rotation=(0, -1.57, 0)
+    )
+    fin_mat = palette_material("FishFin")
+    assign_part_material(tail, fin_mat)
+    parts.append(tail)
+
+    # Dorsal fin
+    dorsal = make_primitive(
+        "cone", "Dorsal",
+        radius1=0.04,
+        radius2=0.01,
+        depth=0.06,
+        location=(0, 0, 0.08),
+        rotation=(0, 0, 0)
+    )
+    assign_part_material(dorsal, fin_mat)
+    parts.append(dorsal)
+
+    # Eye
+    eye = make_primitive(
+        "uv_sphere", "Eye",
+        radius=0.015,
+        location=(0.12, 0.04, 0.02)
+    )
+    eye_mat = palette_material("FishEye")
+    assign_part_material(eye, eye_mat)
+    parts.append(eye)
+
+    model = join_objects(parts, "Fish")
+    set_origin_to_bottom(model)
+    return model
+
+
+def create_wolf():
+    """Create a wolf model - aggressive predator."""
+    reset_animal_scene()
+    parts = []
+
+    # Body
+    body = make_primitive(
+        "uv_sphere", "Body",
+        radius=0.4,
+        location=(0, 0, 0.5),
+        scale=(1.6, 0.6, 0.8),
+        smooth=True
+    )
+    parts.append(body)
+
+    body_mat = palette_material("WolfBody")
+    assign_part_material(body, body_mat)
+
+    # Neck/Chest
+    chest = make_primitive(
+        "uv_sphere", "Chest",
+        radius=0.25,
+        location=(0.4, 0, 0.55),
+        scale=(0.8, 0.8, 1),
+        smooth=True
+    )
+    assign_part_material(chest, body_mat)
+    parts.append(chest)
+
+    # Head
+    head = make_primitive(
+        "uv_sphere", "Head",
+        radius=0.18,
+        location=(0.6, 0, 0.65),
+        scale=(1.2, 0.8, 0.9),
+        smooth=True
+    )
+    assign_part_material(head, body_mat)
+    parts.append(head)
+
+    # Snout
+    snout = make_primitive(
+        "cone", "Snout",
+        radius1=0.1,
+        radius2=0.04,
+        depth=0.2,
+        location=(0.78, 0, 0.6),
+        rotation=(0, 1.57, 0)
+    )
+    assign_part_material(snout, body_mat)
+    parts.append(snout)
+
+    # Ears
+    ear_mat = palette_material("WolfEars")
+    for z_off in [0.1, -0.1]:
+        ear = make_primitive(
+            "cone", f"Ear_{z_off}",
+            radius1=0.05,
+            radius2=0.02,
+            depth=0.12,
+            location=(0.55, z_off, 0.8),
+            rotation=(0.2, 0, 0.2 if z_off > 0 else -0.2)
+        )
+        assign_part_material(ear, ear_mat)
+        parts.append(ear)
+
+    # Legs
+    leg_mat = palette_material("WolfLegs")
+    leg_positions = quad_leg_positions(0.3, 0.12, 0.25)
+    legs = make_merged_parts("cylinder", "Legs", leg_positions, radius=0.05, depth=0.5)
+    assign_part_material(legs, leg_mat)
+    parts.append(legs)
+
+    # Tail (bushy)
+    tail = make_primitive(
+        "cylinder", "Tail",
+        radius=0.06,
+        depth=0.4,
+        location=(-0.55, 0, 0.45),
+        rotation=(0, 0.8, 0)
+    )
+    assign_part_material(tail, body_mat)
+    parts.append(tail)
+
+    model = join_objects(parts, "Wolf")
+    set_origin_to_bottom(model)
+    return model
+
+
+def create_coyote():
+    """Create a coyote model - smaller, faster than wolf."""
+    reset_animal_scene()
+    parts = []
+
+    # Body (slimmer than wolf)
+    body = make_primitive(
+        "uv_sphere", "Body",
+        radius=0.3,
+        location=(0, 0, 0.4),
+        scale=(1.5, 0.5, 0.7),
+        smooth=True
+    )
+    parts.append(body)
+
+    body_mat = palette_material("CoyoteBody")
+    assign_part_material(body, body_mat)
+
+    # Chest
+    chest = make_primitive(
+        "uv_sphere", "Chest",
+        radius=0.18,
+        location=(0.3, 0, 0.45),
+        scale=(0.8, 0.8, 1),
+        smooth=True
+    )
+    assign_part_material(chest, body_mat)
+    parts.append(chest)
+
+    # Head
+    head = make_primitive(
+        "uv_sphere", "Head",
+        radius=0.12,
+        location=(0.45, 0, 0.52),
+        scale=(1.3, 0.8, 0.9),
+        smooth=True
+    )
+    assign_part_material(head, body_mat)
+    parts.append(head)
+
+    # Snout (longer, thinner)
+    snout = make_primitive(
+        "cone", "Snout",
+        radius1=0.06,
+        radius2=0.02,
+        depth=0.18,
+        location=(0.58, 0, 0.48),
+        rotation=(0, 1.57, 0)
+    )
+    assign_part_material(snout, body_mat)
+    parts.append(snout)
+
+    # Large ears
+    ear_mat = palette_material("CoyoteEars")
+    for z_off in [0.08, -0.08]:
+        ear = make_primitive(
+            "cone", f"Ear_{z_off}",
+            radius1=0.05,
+            radius2=0.01,
+            depth=0.14,
+            location=(0.4, z_off, 0.68),
+            rotation=(0.15, 0, 0.25 if z_off > 0 else -0.25)
+        )
+        assign_part_material(ear, ear_mat)
+        parts.append(ear)
+
+    # Legs (thin)
+    leg_positions = quad_leg_positions(0.2, 0.1, 0.2)
+    legs = make_merged_parts("cylinder", "Legs", leg_positions, radius=0.035, depth=0.4)
+    assign_part_material(legs, body_mat)
+    parts.append(legs)
+
+    # Bushy tail
+    tail = make_primitive(
+        "cylinder", "Tail",
+        radius=0.045,
+        depth=0.35,
+        location=(-0.4, 0, 0.35),
+        rotation=(0, 0.6, 0)
+    )
+    assign_part_material(tail, body_mat)
+    parts.append(tail)
+
+    model = join_objects(parts, "Coyote")
+    set_origin_to_bottom(model)
+    return model
+
+
+def create_mountain_lion():
+    """Create a mountain lion model - large, powerful predator."""
+    reset_animal_scene()
+    parts = []
+
+    # Body (muscular)
+    body = make_primitive(
+        "uv_sphere", "Body",
+        radius=0.45,
+        location=(0, 0, 0.55),
+        scale=(1.8, 0.65, 0.8),
+        smooth=True
+    )
+    parts.append(body)
+
+    body_mat = palette_material("LionBody")
+    assign_part_material(body, body_mat)
+
+    # Chest
+    chest = make_primitive(
+        "uv_sphere", "Chest",
+        radius=0.3,
+        location=(0.45, 0, 0.6),
+        scale=(0.9, 0.85, 1),
+        smooth=True
+    )
+    assign_part_material(chest, body_mat)
+    parts.append(chest)
+
+    # Head (rounded)
+    head = make_primitive(
+        "uv_sphere", "Head",
+        radius=0.2,
+        location=(0.65, 0, 0.7),
+        smooth=True
+    )
+    assign_part_material(head, body_mat)
+    parts.append(head)
+
+    # Snout
+    snout = make_primitive(
+        "uv_sphere", "Snout",
+        radius=0.1,
+        location=(0.8, 0, 0.65),
+        scale=(1.2, 0.9, 0.8),
+        smooth=True
+    )
+    assign_part_material(snout, body_mat)
+    parts.append(snout)
+
+    # Small ears
+    ear_mat = palette_material("LionEars")
+    for z_off in [0.1, -0.1]:
+        ear = make_primitive(
+            "cone", f"Ear_{z_off}",
+            radius1=0.04,
+            radius2=0.02,
+            depth=0.08,
+            location=(0.6, z_off, 0.88),
+            rotation=(0.1, 0, 0)
+        )
+        assign_part_material(ear, ear_mat)
+        parts.append(ear)
+
+    # Powerful legs
+    leg_mat = palette_material("LionLegs")
+    leg_positions = quad_leg_positions(0.35, 0.15, 0.28)
+    legs = make_merged_parts("cylinder", "Legs", leg_positions, radius=0.06, depth=0.55)
+    assign_part_material(legs, leg_mat)
+    parts.append(legs)
+
+    # Long tail
+    tail = make_primitive(
+        "cylinder", "Tail",
+        radius=0.04,
+        depth=0.6,
+        location=(-0.65, 0, 0.45),
+        rotation=(0, 0.4, 0)
+    )
+    assign_part_material(tail, body_mat)
+    parts.append(tail)
+
+    # Tail tip (darker)
+    tail_tip = make_primitive(
+        "uv_sphere", "TailTip",
+        radius=0.05,
+        location=(-0.9, 0, 0.35)
+    )
+    tip_mat = palette_material("LionTailTip")
+    assign_part_material(tail_tip, tip_mat)
+    parts.append(tail_tip)
+
+    model = join_objects(parts, "MountainLion")
+    set_origin_to_bottom(model)
+    return model
+
+
+# All animal builders, in generation order
+MODELS = [
+    # Day animals
+    ("Deer", create_deer),
+    ("Bird", create_bird),
+    ("Rabbit", create_rabbit),
+    ("Fish", create_fish),
+
+    # Night predators
+    ("Wolf", create_wolf),
+    ("Coyote", create_coyote),
+    ("MountainLion", create_mountain_lion),
+]
+
+
+def pipeline_digest():
+    """Hash of everything that determines the generated geometry.
+
+    Covers this script and blender_utils.py wholesale: builders, shared
+    helpers, and the palette all live in those two files, so any edit to
+    either invalidates the whole set. Coarser than hashing one function
+    per animal, but immune to missed dependencies.
+    """
+    digest = hashlib.blake2b()
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    for path in (os.path.abspath(__file__),
+                 os.path.join(script_dir, "blender_utils.py")):
+        with open(path, "rb") as source:
+            digest.update(source.read())
+    return digest.hexdigest()[:16]
+
+
+def parse_args():
+    """Parse args after Blender's '--' separator."""
+    argv = sys.argv
+    argv = argv[argv.index("--") + 1:] if "--" in argv else []
+
+    parser = argparse.ArgumentParser(description="Generate animal FBX models")
+    parser.add_argument("--animals",
+                        help="Comma-separated subset to generate (e.g. Wolf,Coyote)")
+    parser.add_argument("--jobs", type=int, default=0,
+                        help="Spawn N Blender workers, each building a disjoint subset")
+    return parser.parse_args(argv)
+
+
+def run_parallel(jobs):
+    """Fan the animal builds out to headless Blender workers.
+
+    The seven models share no state and each ends in its own FBX write,
+    so every worker runs this script with a disjoint --animals subset in
+    its own Blender process.
+    """
+    jobs = max(1, min(jobs, len(MODELS), os.cpu_count() or 1))
+    shards = [[name for name, _ in MODELS[i::jobs]] for i in range(jobs)]
+    print(f"Running {jobs} animal workers")
+
+    def launch_worker(shard):
+        cmd = [
+            bpy.app.binary_path, "--background",
+            "--python", os.path.abspath(__file__),
+            "--", "--animals", ",".join(shard),
+        ]
+        return subprocess.run(cmd, check=False).returncode
+
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        return_codes = list(pool.map(launch_worker, shards))
+
+    failures = [",".join(shard) for shard, code in zip(shards, return_codes) if code != 0]
+    if failures:
+        print(f"ERROR: Worker(s) failed for: {failures}")
+        sys.exit(1)
+
+
+def main():
+    """Generate all animal models."""
+    print("=" * 50)
+    print("Faultline Fear: Animal Model Generator")
+    print("=" * 50)
+
+    args = parse_args()
+
+    if args.jobs > 0:
+        run_parallel(args.jobs)
+        return
+
+    models = MODELS
+    if args.animals:
+        wanted = set(args.animals.split(","))
+        models = [(name, func) for name, func in MODELS if name in wanted]
+        missing = wanted - {name for name, _ in models}
+        if missing:
+            print(f"ERROR: Unknown animal(s): {', '.join(sorted(missing))}")
+            sys.exit(1)
+
+    output_dir = create_export_directory("assets/models/animals")
+    setup_fbx_export()
+    clear_scene()  # One full clear up front; animals reset incrementally
+
+    digest = pipeline_digest()
+
+    with fast_build():
+        generate_models(models, output_dir, digest)
+
+    print("\n" + "=" * 50)
+    print(f"Generated {len(models)} animal models")
+    print("=" * 50)
+
+
+def generate_models(models, output_dir, digest):
+    """Build and export each model, skipping unchanged ones."""
+    for name, create_func in models:
+        filepath = os.path.join(output_dir, f"{name}.fbx")
+        hash_path = f"{filepath}.hash"
+
+        # Skip models whose pipeline hasn't changed since the last export
+        if os.path.exists(filepath) and os.path.exists(hash_path):
+            with open(hash_path) as marker:
+                if marker.read().strip() == digest:
+                    print(f"\nSkipping {name} (unchanged)")
+                    continue
+
+        print(f"\nCreating {name}...")
+        model = create_func()
+
+        export_model(model, filepath)
+        with open(hash_path, "w") as marker:
+            marker.write(digest)
+        print(f"  Exported: {filepath}")
+
+
+if __name__ == "__main__":
+    main()
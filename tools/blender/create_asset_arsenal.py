@@ -1,1923 +1,1626 @@
-"""
-Faultline Fear: Comprehensive Asset Arsenal Generator
-
-Creates eye-popping 3D assets for:
-- Earthquake destruction
-- 1960s retro California
-- Beach/coastal
-- Mountains/terrain
-- Fault line features
-- Horror/liminal spaces
-- Survival props
-
-Run: blender --background --python tools/blender/create_asset_arsenal.py
-"""
-
-import bpy
-import math
-import os
-import sys
-
-# Add tools directory to path
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-from blender_utils import (
-    clear_scene, create_material, apply_material,
-    export_fbx, create_primitive, smooth_shade,
-    group_objects, set_origin_to_bottom
-)
-
-OUTPUT_DIR = "assets/models/arsenal"
-EXPORT_SCALE = 1.0  # 1:1 stud scale
-
-# ===========================================
-# COLOR PALETTES
-# ===========================================
-
-COLORS = {
-    # Retro 60s California
-    "turquoise": (0.25, 0.88, 0.82),
-    "coral": (1.0, 0.5, 0.31),
-    "mustard": (1.0, 0.86, 0.35),
-    "pink": (1.0, 0.71, 0.76),
-    "cream": (1.0, 0.99, 0.82),
-    "teal": (0.0, 0.5, 0.5),
-    "orange": (1.0, 0.55, 0.0),
-
-    # Neon signs
-    "neon_pink": (1.0, 0.08, 0.58),
-    "neon_blue": (0.0, 0.75, 1.0),
-    "neon_green": (0.22, 1.0, 0.08),
-    "neon_orange": (1.0, 0.4, 0.0),
-
-    # Horror/liminal
-    "sickly_yellow": (0.9, 0.9, 0.5),
-    "concrete_gray": (0.5, 0.5, 0.5),
-    "rust": (0.72, 0.26, 0.06),
-    "dried_blood": (0.4, 0.1, 0.1),
-    "mold_green": (0.3, 0.4, 0.2),
-
-    # Natural
-    "sand": (0.76, 0.70, 0.50),
-    "palm_green": (0.13, 0.55, 0.13),
-    "ocean_blue": (0.0, 0.47, 0.75),
-    "rock_brown": (0.4, 0.3, 0.2),
-    "lava_red": (1.0, 0.2, 0.0),
-    "steam_white": (0.95, 0.95, 0.95),
-
-    # Metal/industrial
-    "chrome": (0.77, 0.77, 0.77),
-    "copper": (0.72, 0.45, 0.20),
-    "steel": (0.5, 0.5, 0.55),
-
-    # Wood
-    "wood_light": (0.76, 0.60, 0.42),
-    "wood_dark": (0.4, 0.26, 0.13),
-    "driftwood": (0.6, 0.55, 0.5),
-}
-
-def ensure_output_dir():
-    os.makedirs(OUTPUT_DIR, exist_ok=True)
-
-def export_asset(name):
-    filepath = os.path.join(OUTPUT_DIR, f"{name}.fbx")
-    export_fbx(filepath, EXPORT_SCALE)
-    print(f"Exported: {name}")
-
-# ===========================================
-# 1. RETRO 60s CALIFORNIA
-# ===========================================
-
-def create_vintage_diner():
-    """Classic 1960s roadside diner with chrome and neon"""
-    clear_scene()
-    parts = []
-
-    # Main building - streamlined design
-    bpy.ops.mesh.primitive_cube_add(size=1, location=(0, 0, 6))
-    body = bpy.context.active_object
-    body.name = "DinerBody"
-    body.scale = (20, 12, 6)
-    bpy.ops.object.transform_apply(scale=True)
-    mat = create_material("DinerTurquoise", COLORS["turquoise"])
-    apply_material(body, mat)
-    parts.append(body)
-
-    # Chrome trim band
-    bpy.ops.mesh.primitive_cube_add(size=1, location=(0, 0, 10))
-    trim = bpy.context.active_object
-    trim.name = "ChromeTrim"
-    trim.scale = (20.5, 12.5, 0.5)
-    bpy.ops.object.transform_apply(scale=True)
-    mat = create_material("Chrome", COLORS["chrome"])
-    apply_material(trim, mat)
-    parts.append(trim)
-
-    # Roof with slight angle
-    bpy.ops.mesh.primitive_cube_add(size=1, location=(0, 0, 11.5))
-    roof = bpy.context.active_object
-    roof.name = "Roof"
-    roof.scale = (21, 13, 1)
-    bpy.ops.object.transform_apply(scale=True)
-    mat = create_material("RoofCream", COLORS["cream"])
-    apply_material(roof, mat)
-    parts.append(roof)
-
-    # Large windows
-    for x in [-8, 0, 8]:
-        bpy.ops.mesh.primitive_cube_add(size=1, location=(x, 6.1, 5))
-        window = bpy.context.active_object
-        window.name = f"Window_{x}"
-        window.scale = (5, 0.2, 4)
-        bpy.ops.object.transform_apply(scale=True)
-        mat = create_material("Glass", (0.6, 0.8, 0.9, 0.5))
-        apply_material(window, mat)
-        parts.append(window)
-
-    # Neon sign on roof "EATS"
-    bpy.ops.mesh.primitive_cube_add(size=1, location=(0, 0, 14))
-    sign = bpy.context.active_object
-    sign.name = "NeonSign"
-    sign.scale = (8, 0.5, 3)
-    bpy.ops.object.transform_apply(scale=True)
-    mat = create_material("NeonPink", COLORS["neon_pink"], emission=2.0)
-    apply_material(sign, mat)
-    parts.append(sign)
-
-    # Counter stools visible through window
-    for x in [-6, -3, 0, 3, 6]:
-        bpy.ops.mesh.primitive_cylinder_add(radius=0.8, depth=0.3, location=(x, 4, 2.5))
-        seat = bpy.context.active_object
-        seat.name = f"Stool_{x}"
-        mat = create_material("CoralSeat", COLORS["coral"])
-        apply_material(seat, mat)
-        parts.append(seat)
-
-        bpy.ops.mesh.primitive_cylinder_add(radius=0.2, depth=2.5, location=(x, 4, 1))
-        pole = bpy.context.active_object
-        pole.name = f"StoolPole_{x}"
-        mat = create_material("ChromePole", COLORS["chrome"])
-        apply_material(pole, mat)
-        parts.append(pole)
-
-    group_objects(parts, "VintageDiner")
-    export_asset("vintage_diner")
-
-def create_retro_gas_station():
-    """1960s Googie-style gas station with dramatic canopy"""
-    clear_scene()
-    parts = []
-
-    # Office building
-    bpy.ops.mesh.primitive_cube_add(size=1, location=(-12, 0, 5))
-    office = bpy.context.active_object
-    office.name = "Office"
-    office.scale = (8, 10, 5)
-    bpy.ops.object.transform_apply(scale=True)
-    mat = create_material("OfficeCream", COLORS["cream"])
-    apply_material(office, mat)
-    parts.append(office)
-
-    # Dramatic angular canopy (Googie style)
-    bpy.ops.mesh.primitive_cube_add(size=1, location=(5, 0, 12))
-    canopy = bpy.context.active_object
-    canopy.name = "Canopy"
-    canopy.scale = (25, 15, 0.5)
-    canopy.rotation_euler = (0.1, 0, 0)  # Slight tilt
-    bpy.ops.object.transform_apply(scale=True, rotation=True)
-    mat = create_material("CanopyOrange", COLORS["orange"])
-    apply_material(canopy, mat)
-    parts.append(canopy)
-
-    # Canopy support columns
-    for pos in [(-8, -6), (-8, 6), (18, -6), (18, 6)]:
-        bpy.ops.mesh.primitive_cylinder_add(radius=0.5, depth=12, location=(pos[0], pos[1], 6))
-        col = bpy.context.active_object
-        col.name = f"Column_{pos[0]}_{pos[1]}"
-        mat = create_material("SteelColumn", COLORS["steel"])
-        apply_material(col, mat)
-        parts.append(col)
-
-    # Gas pumps (vintage style)
-    for x in [0, 8]:
-        # Pump body
-        bpy.ops.mesh.primitive_cube_add(size=1, location=(x, 0, 3))
-        pump = bpy.context.active_object
-        pump.name = f"Pump_{x}"
-        pump.scale = (2, 1.5, 6)
-        bpy.ops.object.transform_apply(scale=True)
-        mat = create_material("PumpRed", (0.8, 0.1, 0.1))
-        apply_material(pump, mat)
-        parts.append(pump)
-
-        # Pump globe on top
-        bpy.ops.mesh.primitive_uv_sphere_add(radius=1, location=(x, 0, 7))
-        globe = bpy.context.active_object
-        globe.name = f"Globe_{x}"
-        mat = create_material("GlobeWhite", COLORS["cream"], emission=0.5)
-        apply_material(globe, mat)
-        smooth_shade(globe)
-        parts.append(globe)
-
-    # Tall sign pole with rotating sign
-    bpy.ops.mesh.primitive_cylinder_add(radius=0.4, depth=25, location=(20, 0, 12.5))
-    pole = bpy.context.active_object
-    pole.name = "SignPole"
-    mat = create_material("PoleSteel", COLORS["steel"])
-    apply_material(pole, mat)
-    parts.append(pole)
-
-    # Sign at top
-    bpy.ops.mesh.primitive_cylinder_add(radius=5, depth=1, location=(20, 0, 26))
-    sign = bpy.context.active_object
-    sign.name = "RotatingSign"
-    mat = create_material("SignTeal", COLORS["teal"], emission=1.0)
-    apply_material(sign, mat)
-    parts.append(sign)
-
-    group_objects(parts, "RetroGasStation")
-    export_asset("retro_gas_station")
-
-def create_classic_car_57():
-    """1957-style classic car with fins"""
-    clear_scene()
-    parts = []
-
-    # Main body
-    bpy.ops.mesh.primitive_cube_add(size=1, location=(0, 0, 2))
-    body = bpy.context.active_object
-    body.name = "CarBody"
-    body.scale = (8, 3, 1.5)
-    bpy.ops.object.transform_apply(scale=True)
-    mat = create_material("CarTurquoise", COLORS["turquoise"])
-    apply_material(body, mat)
-    parts.append(body)
-
-    # Cabin
-    bpy.ops.mesh.primitive_cube_add(size=1, location=(0, 0, 3.5))
-    cabin = bpy.context.active_object
-    cabin.name = "Cabin"
-    cabin.scale = (4, 2.8, 1.2)
-    bpy.ops.object.transform_apply(scale=True)
-    mat = create_material("CabinCream", COLORS["cream"])
-    apply_material(cabin, mat)
-    parts.append(cabin)
-
-    # Tail fins
-    for y in [-1.5, 1.5]:
-        bpy.ops.mesh.primitive_cone_add(radius1=0.8, radius2=0, depth=2, location=(-4, y, 3))
-        fin = bpy.context.active_object
-        fin.name = f"Fin_{y}"
-        fin.rotation_euler = (1.57, 0, 0)
-        bpy.ops.object.transform_apply(rotation=True)
-        mat = create_material("FinChrome", COLORS["chrome"])
-        apply_material(fin, mat)
-        parts.append(fin)
-
-    # Wheels
-    for pos in [(-2.5, -1.6), (-2.5, 1.6), (2.5, -1.6), (2.5, 1.6)]:
-        bpy.ops.mesh.primitive_cylinder_add(radius=1, depth=0.6, location=(pos[0], pos[1], 1))
-        wheel = bpy.context.active_object
-        wheel.name = f"Wheel_{pos[0]}_{pos[1]}"
-        wheel.rotation_euler = (1.57, 0, 0)
-        bpy.ops.object.transform_apply(rotation=True)
-        mat = create_material("Tire", (0.1, 0.1, 0.1))
-        apply_material(wheel, mat)
-        parts.append(wheel)
-
-        # Hubcap
-        bpy.ops.mesh.primitive_cylinder_add(radius=0.5, depth=0.1, location=(pos[0], pos[1] + (0.35 if pos[1] > 0 else -0.35), 1))
-        hub = bpy.context.active_object
-        hub.name = f"Hubcap_{pos[0]}_{pos[1]}"
-        hub.rotation_euler = (1.57, 0, 0)
-        bpy.ops.object.transform_apply(rotation=True)
-        mat = create_material("HubChrome", COLORS["chrome"])
-        apply_material(hub, mat)
-        parts.append(hub)
-
-    # Chrome bumpers
-    for x in [-4.2, 4.2]:
-        bpy.ops.mesh.primitive_cube_add(size=1, location=(x, 0, 1.5))
-        bumper = bpy.context.active_object
-        bumper.name = f"Bumper_{x}"
-        bumper.scale = (0.3, 3, 0.4)
-        bpy.ops.object.transform_apply(scale=True)
-        mat = create_material("BumperChrome", COLORS["chrome"])
-        apply_material(bumper, mat)
-        parts.append(bumper)
-
-    # Headlights
-    for y in [-1, 1]:
-        bpy.ops.mesh.primitive_uv_sphere_add(radius=0.4, location=(4.1, y, 2))
-        light = bpy.context.active_object
-        light.name = f"Headlight_{y}"
-        mat = create_material("HeadlightGlow", COLORS["cream"], emission=1.0)
-        apply_material(light, mat)
-        smooth_shade(light)
-        parts.append(light)
-
-    group_objects(parts, "ClassicCar57")
-    export_asset("classic_car_57")
-
-def create_motel_sign():
-    """Iconic retro motel sign with arrow"""
-    clear_scene()
-    parts = []
-
-    # Main pole
-    bpy.ops.mesh.primitive_cylinder_add(radius=0.5, depth=30, location=(0, 0, 15))
-    pole = bpy.context.active_object
-    pole.name = "Pole"
-    mat = create_material("PoleSteel", COLORS["steel"])
-    apply_material(pole, mat)
-    parts.append(pole)
-
-    # Sign board
-    bpy.ops.mesh.primitive_cube_add(size=1, location=(0, 0, 28))
-    board = bpy.context.active_object
-    board.name = "SignBoard"
-    board.scale = (12, 1, 8)
-    bpy.ops.object.transform_apply(scale=True)
-    mat = create_material("SignPink", COLORS["pink"])
-    apply_material(board, mat)
-    parts.append(board)
-
-    # "MOTEL" letters (simplified as blocks)
-    for i, x in enumerate([-4, -2, 0, 2, 4]):
-        bpy.ops.mesh.primitive_cube_add(size=1, location=(x, 0.6, 28))
-        letter = bpy.context.active_object
-        letter.name = f"Letter_{i}"
-        letter.scale = (1.5, 0.2, 3)
-        bpy.ops.object.transform_apply(scale=True)
-        mat = create_material("NeonLetters", COLORS["neon_pink"], emission=3.0)
-        apply_material(letter, mat)
-        parts.append(letter)
-
-    # Arrow pointing down
-    bpy.ops.mesh.primitive_cone_add(radius1=3, radius2=0, depth=5, location=(0, 0.6, 20))
-    arrow = bpy.context.active_object
-    arrow.name = "Arrow"
-    arrow.rotation_euler = (0, 0, 3.14)  # Point down
-    bpy.ops.object.transform_apply(rotation=True)
-    mat = create_material("ArrowNeon", COLORS["neon_orange"], emission=2.0)
-    apply_material(arrow, mat)
-    parts.append(arrow)
-
-    # "VACANCY" sign below
-    bpy.ops.mesh.primitive_cube_add(size=1, location=(0, 0.6, 14))
-    vacancy = bpy.context.active_object
-    vacancy.name = "VacancySign"
-    vacancy.scale = (8, 0.2, 2)
-    bpy.ops.object.transform_apply(scale=True)
-    mat = create_material("VacancyNeon", COLORS["neon_green"], emission=2.0)
-    apply_material(vacancy, mat)
-    parts.append(vacancy)
-
-    group_objects(parts, "MotelSign")
-    export_asset("motel_sign")
-
-def create_drive_in_screen():
-    """Drive-in movie theater screen"""
-    clear_scene()
-    parts = []
-
-    # Main screen
-    bpy.ops.mesh.primitive_cube_add(size=1, location=(0, 0, 25))
-    screen = bpy.context.active_object
-    screen.name = "Screen"
-    screen.scale = (50, 1, 30)
-    bpy.ops.object.transform_apply(scale=True)
-    mat = create_material("ScreenWhite", (0.95, 0.95, 0.95))
-    apply_material(screen, mat)
-    parts.append(screen)
-
-    # Support structure (back)
-    for x in [-20, 0, 20]:
-        bpy.ops.mesh.primitive_cube_add(size=1, location=(x, -2, 20))
-        support = bpy.context.active_object
-        support.name = f"Support_{x}"
-        support.scale = (2, 3, 40)
-        bpy.ops.object.transform_apply(scale=True)
-        mat = create_material("SupportSteel", COLORS["steel"])
-        apply_material(support, mat)
-        parts.append(support)
-
-    # Cross braces
-    for z in [10, 30]:
-        bpy.ops.mesh.primitive_cube_add(size=1, location=(0, -2, z))
-        brace = bpy.context.active_object
-        brace.name = f"Brace_{z}"
-        brace.scale = (45, 1, 1)
-        bpy.ops.object.transform_apply(scale=True)
-        mat = create_material("BraceSteel", COLORS["steel"])
-        apply_material(brace, mat)
-        parts.append(brace)
-
-    # Speaker posts (a few in front)
-    for x in [-30, -15, 0, 15, 30]:
-        bpy.ops.mesh.primitive_cylinder_add(radius=0.3, depth=5, location=(x, 20, 2.5))
-        post = bpy.context.active_object
-        post.name = f"SpeakerPost_{x}"
-        mat = create_material("PostMetal", COLORS["steel"])
-        apply_material(post, mat)
-        parts.append(post)
-
-    group_objects(parts, "DriveInScreen")
-    export_asset("drive_in_screen")
-
-def create_tiki_bar():
-    """Beach tiki bar with thatched roof"""
-    clear_scene()
-    parts = []
-
-    # Counter
-    bpy.ops.mesh.primitive_cube_add(size=1, location=(0, 0, 2))
-    counter = bpy.context.active_object
-    counter.name = "Counter"
-    counter.scale = (12, 4, 2)
-    bpy.ops.object.transform_apply(scale=True)
-    mat = create_material("BambooCounter", COLORS["wood_light"])
-    apply_material(counter, mat)
-    parts.append(counter)
-
-    # Bamboo posts
-    for pos in [(-5, -2), (-5, 2), (5, -2), (5, 2)]:
-        bpy.ops.mesh.primitive_cylinder_add(radius=0.4, depth=10, location=(pos[0], pos[1], 5))
-        post = bpy.context.active_object
-        post.name = f"Post_{pos[0]}_{pos[1]}"
-        mat = create_material("Bamboo", COLORS["mustard"])
-        apply_material(post, mat)
-        parts.append(post)
-
-    # Thatched roof (cone shape)
-    bpy.ops.mesh.primitive_cone_add(radius1=8, radius2=1, depth=5, location=(0, 0, 12))
-    roof = bpy.context.active_object
-    roof.name = "ThatchedRoof"
-    mat = create_material("Thatch", COLORS["sand"])
-    apply_material(roof, mat)
-    parts.append(roof)
-
-    # Bar stools
-    for x in [-4, -2, 0, 2, 4]:
-        bpy.ops.mesh.primitive_cylinder_add(radius=0.6, depth=0.3, location=(x, -3, 2))
-        seat = bpy.context.active_object
-        seat.name = f"Stool_{x}"
-        mat = create_material("StoolSeat", COLORS["coral"])
-        apply_material(seat, mat)
-        parts.append(seat)
-
-        bpy.ops.mesh.primitive_cylinder_add(radius=0.15, depth=2, location=(x, -3, 1))
-        leg = bpy.context.active_object
-        leg.name = f"StoolLeg_{x}"
-        mat = create_material("BambooLeg", COLORS["wood_light"])
-        apply_material(leg, mat)
-        parts.append(leg)
-
-    # Tiki torches on sides
-    for x in [-7, 7]:
-        bpy.ops.mesh.primitive_cylinder_add(radius=0.2, depth=8, location=(x, 0, 4))
-        torch = bpy.context.active_object
-        torch.name = f"Torch_{x}"
-        mat = create_material("TorchBamboo", COLORS["wood_dark"])
-        apply_material(torch, mat)
-        parts.append(torch)
-
-        # Flame
-        bpy.ops.mesh.primitive_uv_sphere_add(radius=0.5, location=(x, 0, 8.5))
-        flame = bpy.context.active_object
-        flame.name = f"Flame_{x}"
-        mat = create_material("Flame", COLORS["orange"], emission=3.0)
-        apply_material(flame, mat)
-        smooth_shade(flame)
-        parts.append(flame)
-
-    group_objects(parts, "TikiBar")
-    export_asset("tiki_bar")
-
-# ===========================================
-# 2. BEACH / COASTAL
-# ===========================================
-
-def create_lifeguard_tower():
-    """Classic California lifeguard tower"""
-    clear_scene()
-    parts = []
-
-    # Platform
-    bpy.ops.mesh.primitive_cube_add(size=1, location=(0, 0, 8))
-    platform = bpy.context.active_object
-    platform.name = "Platform"
-    platform.scale = (6, 6, 0.5)
-    bpy.ops.object.transform_apply(scale=True)
-    mat = create_material("PlatformWood", COLORS["wood_light"])
-    apply_material(platform, mat)
-    parts.append(platform)
-
-    # Cabin
-    bpy.ops.mesh.primitive_cube_add(size=1, location=(0, 0, 11))
-    cabin = bpy.context.active_object
-    cabin.name = "Cabin"
-    cabin.scale = (5, 5, 5)
-    bpy.ops.object.transform_apply(scale=True)
-    mat = create_material("CabinCoral", COLORS["coral"])
-    apply_material(cabin, mat)
-    parts.append(cabin)
-
-    # Roof
-    bpy.ops.mesh.primitive_cube_add(size=1, location=(0, 0, 14.5))
-    roof = bpy.context.active_object
-    roof.name = "Roof"
-    roof.scale = (6, 6, 1)
-    bpy.ops.object.transform_apply(scale=True)
-    mat = create_material("RoofWhite", COLORS["cream"])
-    apply_material(roof, mat)
-    parts.append(roof)
-
-    # Support legs
-    for pos in [(-2.5, -2.5), (-2.5, 2.5), (2.5, -2.5), (2.5, 2.5)]:
-        bpy.ops.mesh.primitive_cube_add(size=1, location=(pos[0], pos[1], 4))
-        leg = bpy.context.active_object
-        leg.name = f"Leg_{pos[0]}_{pos[1]}"
-        leg.scale = (0.4, 0.4, 8)
-        bpy.ops.object.transform_apply(scale=True)
-        mat = create_material("LegWood", COLORS["wood_light"])
-        apply_material(leg, mat)
-        parts.append(leg)
-
-    # Ramp
-    bpy.ops.mesh.primitive_cube_add(size=1, location=(0, -6, 4))
-    ramp = bpy.context.active_object
-    ramp.name = "Ramp"
-    ramp.scale = (2, 6, 0.3)
-    ramp.rotation_euler = (0.3, 0, 0)
-    bpy.ops.object.transform_apply(scale=True, rotation=True)
-    mat = create_material("RampWood", COLORS["wood_light"])
-    apply_material(ramp, mat)
-    parts.append(ramp)
-
-    # Rescue buoy
-    bpy.ops.mesh.primitive_torus_add(major_radius=0.8, minor_radius=0.2, location=(3, 0, 9))
-    buoy = bpy.context.active_object
-    buoy.name = "RescueBuoy"
-    mat = create_material("BuoyOrange", COLORS["orange"])
-    apply_material(buoy, mat)
-    parts.append(buoy)
-
-    group_objects(parts, "LifeguardTower")
-    export_asset("lifeguard_tower")
-
-def create_surfboard():
-    """Vintage longboard surfboard"""
-    clear_scene()
-    parts = []
-
-    # Board body (elongated ellipsoid)
-    bpy.ops.mesh.primitive_uv_sphere_add(radius=1, location=(0, 0, 0.15))
-    board = bpy.context.active_object
-    board.name = "SurfboardBody"
-    board.scale = (0.8, 4, 0.1)
-    bpy.ops.object.transform_apply(scale=True)
-    mat = create_material("BoardTurquoise", COLORS["turquoise"])
-    apply_material(board, mat)
-    smooth_shade(board)
-    parts.append(board)
-
-    # Racing stripe
-    bpy.ops.mesh.primitive_cube_add(size=1, location=(0, 0, 0.2))
-    stripe = bpy.context.active_object
-    stripe.name = "Stripe"
-    stripe.scale = (0.15, 3.5, 0.02)
-    bpy.ops.object.transform_apply(scale=True)
-    mat = create_material("StripeOrange", COLORS["orange"])
-    apply_material(stripe, mat)
-    parts.append(stripe)
-
-    # Fin
-    bpy.ops.mesh.primitive_cone_add(radius1=0.3, radius2=0, depth=0.4, location=(0, -1.5, 0))
-    fin = bpy.context.active_object
-    fin.name = "Fin"
-    fin.rotation_euler = (1.57, 0, 0)
-    bpy.ops.object.transform_apply(rotation=True)
-    mat = create_material("FinDark", COLORS["wood_dark"])
-    apply_material(fin, mat)
-    parts.append(fin)
-
-    group_objects(parts, "Surfboard")
-    export_asset("surfboard")
-
-def create_beach_umbrella():
-    """Colorful beach umbrella"""
-    clear_scene()
-    parts = []
-
-    # Pole
-    bpy.ops.mesh.primitive_cylinder_add(radius=0.1, depth=8, location=(0, 0, 4))
-    pole = bpy.context.active_object
-    pole.name = "Pole"
-    mat = create_material("PoleWood", COLORS["wood_light"])
-    apply_material(pole, mat)
-    parts.append(pole)
-
-    # Umbrella top (cone)
-    bpy.ops.mesh.primitive_cone_add(radius1=4, radius2=0.3, depth=2, location=(0, 0, 8.5))
-    umbrella = bpy.context.active_object
-    umbrella.name = "UmbrellaTop"
-    mat = create_material("UmbrellaPink", COLORS["pink"])
-    apply_material(umbrella, mat)
-    parts.append(umbrella)
-
-    # Stripes (alternating colored sections)
-    for i, angle in enumerate([0, 1.57, 3.14, 4.71]):
-        bpy.ops.mesh.primitive_cube_add(size=1, location=(2 * math.cos(angle), 2 * math.sin(angle), 8))
-        stripe = bpy.context.active_object
-        stripe.name = f"Stripe_{i}"
-        stripe.scale = (0.5, 2, 0.1)
-        stripe.rotation_euler = (0.5, 0, angle)
-        bpy.ops.object.transform_apply(scale=True, rotation=True)
-        mat = create_material(f"StripeWhite_{i}", COLORS["cream"])
-        apply_material(stripe, mat)
-        parts.append(stripe)
-
-    group_objects(parts, "BeachUmbrella")
-    export_asset("beach_umbrella")
-
-def create_pier_section():
-    """Wooden pier section"""
-    clear_scene()
-    parts = []
-
-    # Main deck
-    bpy.ops.mesh.primitive_cube_add(size=1, location=(0, 0, 5))
-    deck = bpy.context.active_object
-    deck.name = "Deck"
-    deck.scale = (10, 30, 0.5)
-    bpy.ops.object.transform_apply(scale=True)
-    mat = create_material("DeckWood", COLORS["driftwood"])
-    apply_material(deck, mat)
-    parts.append(deck)
-
-    # Support pilings
-    for pos in [(-4, -12), (-4, 0), (-4, 12), (4, -12), (4, 0), (4, 12)]:
-        bpy.ops.mesh.primitive_cylinder_add(radius=0.5, depth=10, location=(pos[0], pos[1], 0))
-        piling = bpy.context.active_object
-        piling.name = f"Piling_{pos[0]}_{pos[1]}"
-        mat = create_material("PilingWood", COLORS["wood_dark"])
-        apply_material(piling, mat)
-        parts.append(piling)
-
-    # Railings
-    for x in [-5, 5]:
-        bpy.ops.mesh.primitive_cube_add(size=1, location=(x, 0, 6.5))
-        rail = bpy.context.active_object
-        rail.name = f"Rail_{x}"
-        rail.scale = (0.2, 30, 0.2)
-        bpy.ops.object.transform_apply(scale=True)
-        mat = create_material("RailWood", COLORS["wood_light"])
-        apply_material(rail, mat)
-        parts.append(rail)
-
-        # Rail posts
-        for y in range(-12, 15, 6):
-            bpy.ops.mesh.primitive_cube_add(size=1, location=(x, y, 5.75))
-            post = bpy.context.active_object
-            post.name = f"Post_{x}_{y}"
-            post.scale = (0.2, 0.2, 1.5)
-            bpy.ops.object.transform_apply(scale=True)
-            mat = create_material("PostWood", COLORS["wood_light"])
-            apply_material(post, mat)
-            parts.append(post)
-
-    group_objects(parts, "PierSection")
-    export_asset("pier_section")
-
-def create_palm_tree():
-    """California palm tree"""
-    clear_scene()
-    parts = []
-
-    # Trunk (slightly curved cylinder segments)
-    for i in range(5):
-        bpy.ops.mesh.primitive_cylinder_add(radius=1.2 - i*0.15, depth=8, location=(i*0.3, 0, 4 + i*8))
-        segment = bpy.context.active_object
-        segment.name = f"Trunk_{i}"
-        segment.rotation_euler = (0.05 * i, 0, 0)
-        bpy.ops.object.transform_apply(rotation=True)
-        mat = create_material("TrunkBrown", COLORS["wood_dark"])
-        apply_material(segment, mat)
-        parts.append(segment)
-
-    # Palm fronds
-    for i in range(8):
-        angle = i * (2 * math.pi / 8)
-        x = 2 * math.cos(angle)
-        y = 2 * math.sin(angle)
-
-        bpy.ops.mesh.primitive_cube_add(size=1, location=(x + 1.5, y, 42))
-        frond = bpy.context.active_object
-        frond.name = f"Frond_{i}"
-        frond.scale = (8, 0.5, 0.1)
-        frond.rotation_euler = (-0.5, 0, angle)
-        bpy.ops.object.transform_apply(scale=True, rotation=True)
-        mat = create_material("FrondGreen", COLORS["palm_green"])
-        apply_material(frond, mat)
-        parts.append(frond)
-
-    # Coconuts
-    for i in range(3):
-        angle = i * (2 * math.pi / 3)
-        bpy.ops.mesh.primitive_uv_sphere_add(radius=0.5, location=(0.5 * math.cos(angle) + 1.5, 0.5 * math.sin(angle), 40))
-        coconut = bpy.context.active_object
-        coconut.name = f"Coconut_{i}"
-        mat = create_material("CoconutBrown", COLORS["wood_dark"])
-        apply_material(coconut, mat)
-        smooth_shade(coconut)
-        parts.append(coconut)
-
-    group_objects(parts, "PalmTree")
-    export_asset("palm_tree")
-
-# ===========================================
-# 3. EARTHQUAKE / DESTRUCTION
-# ===========================================
-
-def create_cracked_earth():
-    """Ground with earthquake cracks"""
-    clear_scene()
-    parts = []
-
-    # Base ground
-    bpy.ops.mesh.primitive_cube_add(size=1, location=(0, 0, -0.5))
-    ground = bpy.context.active_object
-    ground.name = "Ground"
-    ground.scale = (20, 20, 1)
-    bpy.ops.object.transform_apply(scale=True)
-    mat = create_material("GroundBrown", COLORS["rock_brown"])
-    apply_material(ground, mat)
-    parts.append(ground)
-
-    # Crack fissures (dark gaps)
-    crack_positions = [
-        (0, 0, 0, 15, 1.5),
-        (-5, 3, 0.5, 8, 1),
-        (4, -4, -0.3, 10, 0.8),
-        (-3, -6, 0.2, 7, 0.6),
-    ]
-
-    for i, (x, y, rot, length, width) in enumerate(crack_positions):
-        bpy.ops.mesh.primitive_cube_add(size=1, location=(x, y, 0.1))
-        crack = bpy.context.active_object
-        crack.name = f"Crack_{i}"
-        crack.scale = (length, width, 0.3)
-        crack.rotation_euler = (0, 0, rot)
-        bpy.ops.object.transform_apply(scale=True, rotation=True)
-        mat = create_material(f"CrackDark_{i}", (0.05, 0.05, 0.05))
-        apply_material(crack, mat)
-        parts.append(crack)
-
-    # Uplifted chunks along cracks
-    for i in range(6):
-        x = (i - 3) * 3 + (i % 2) * 0.5
-        y = i * 0.3 - 1
-        bpy.ops.mesh.primitive_cube_add(size=1, location=(x, y, 0.8))
-        chunk = bpy.context.active_object
-        chunk.name = f"Chunk_{i}"
-        chunk.scale = (2, 1.5, 1.2)
-        chunk.rotation_euler = (0.1 * (i % 3 - 1), 0.1 * (i % 2), 0.2 * (i % 4 - 2))
-        bpy.ops.object.transform_apply(scale=True, rotation=True)
-        mat = create_material(f"ChunkRock_{i}", COLORS["rock_brown"])
-        apply_material(chunk, mat)
-        parts.append(chunk)
-
-    group_objects(parts, "CrackedEarth")
-    export_asset("cracked_earth")
-
-def create_steam_vent():
-    """Volcanic steam vent from fault line"""
-    clear_scene()
-    parts = []
-
-    # Vent opening (cone depression)
-    bpy.ops.mesh.primitive_cone_add(radius1=3, radius2=1, depth=2, location=(0, 0, -1))
-    vent = bpy.context.active_object
-    vent.name = "VentOpening"
-    vent.rotation_euler = (3.14, 0, 0)  # Flip upside down
-    bpy.ops.object.transform_apply(rotation=True)
-    mat = create_material("VentRock", COLORS["rock_brown"])
-    apply_material(vent, mat)
-    parts.append(vent)
-
-    # Inner glow
-    bpy.ops.mesh.primitive_uv_sphere_add(radius=0.8, location=(0, 0, -0.5))
-    glow = bpy.context.active_object
-    glow.name = "InnerGlow"
-    mat = create_material("LavaGlow", COLORS["lava_red"], emission=5.0)
-    apply_material(glow, mat)
-    smooth_shade(glow)
-    parts.append(glow)
-
-    # Steam clouds (spheres)
-    steam_positions = [
-        (0, 0, 2), (0.5, 0.3, 4), (-0.3, 0.5, 6),
-        (0.2, -0.4, 8), (-0.5, 0.2, 10), (0.3, 0.3, 12)
-    ]
-    for i, pos in enumerate(steam_positions):
-        size = 1.5 - i * 0.15
-        bpy.ops.mesh.primitive_uv_sphere_add(radius=size, location=pos)
-        steam = bpy.context.active_object
-        steam.name = f"Steam_{i}"
-        mat = create_material(f"Steam_{i}", (*COLORS["steam_white"], 0.6), emission=0.3)
-        apply_material(steam, mat)
-        smooth_shade(steam)
-        parts.append(steam)
-
-    # Surrounding rocks
-    for i in range(6):
-        angle = i * (2 * math.pi / 6)
-        x = 4 * math.cos(angle)
-        y = 4 * math.sin(angle)
-        bpy.ops.mesh.primitive_cube_add(size=1, location=(x, y, 0.5))
-        rock = bpy.context.active_object
-        rock.name = f"Rock_{i}"
-        rock.scale = (1.5, 1, 1)
-        rock.rotation_euler = (0.2, 0.1, angle)
-        bpy.ops.object.transform_apply(scale=True, rotation=True)
-        mat = create_material(f"SurroundRock_{i}", COLORS["rock_brown"])
-        apply_material(rock, mat)
-        parts.append(rock)
-
-    group_objects(parts, "SteamVent")
-    export_asset("steam_vent")
-
-def create_rubble_pile():
-    """Pile of building rubble and debris"""
-    clear_scene()
-    parts = []
-
-    # Various sized chunks
-    chunks = [
-        (0, 0, 1, 3, 2, 2, 0.1, 0.2, 0.3),
-        (2, 1, 0.8, 2, 1.5, 1.5, -0.2, 0.1, 0.1),
-        (-1.5, 0.5, 0.6, 1.5, 2, 1, 0.3, -0.1, 0.2),
-        (0.5, -1.5, 0.5, 2.5, 1, 1.2, 0.1, 0.3, -0.1),
-        (-2, -1, 0.4, 1, 1.5, 0.8, -0.1, 0.2, 0.4),
-        (1, 2, 0.3, 1.2, 0.8, 0.6, 0.2, 0.1, 0.15),
-    ]
-
-    for i, (x, y, z, sx, sy, sz, rx, ry, rz) in enumerate(chunks):
-        bpy.ops.mesh.primitive_cube_add(size=1, location=(x, y, z))
-        chunk = bpy.context.active_object
-        chunk.name = f"RubbleChunk_{i}"
-        chunk.scale = (sx, sy, sz)
-        chunk.rotation_euler = (rx, ry, rz)
-        bpy.ops.object.transform_apply(scale=True, rotation=True)
-        # Alternate between concrete gray and brick red
-        color = COLORS["concrete_gray"] if i % 2 == 0 else (0.6, 0.3, 0.2)
-        mat = create_material(f"RubbleMat_{i}", color)
-        apply_material(chunk, mat)
-        parts.append(chunk)
-
-    # Rebar sticking out
-    for i in range(4):
-        bpy.ops.mesh.primitive_cylinder_add(radius=0.05, depth=3, location=(i - 1.5, i * 0.3 - 0.5, 1.5 + i * 0.2))
-        rebar = bpy.context.active_object
-        rebar.name = f"Rebar_{i}"
-        rebar.rotation_euler = (0.3 + i * 0.1, 0.2, i * 0.2)
-        bpy.ops.object.transform_apply(rotation=True)
-        mat = create_material("RebarRust", COLORS["rust"])
-        apply_material(rebar, mat)
-        parts.append(rebar)
-
-    group_objects(parts, "RubblePile")
-    export_asset("rubble_pile")
-
-def create_damaged_car():
-    """Earthquake-damaged abandoned car"""
-    clear_scene()
-    parts = []
-
-    # Crushed body
-    bpy.ops.mesh.primitive_cube_add(size=1, location=(0, 0, 1.5))
-    body = bpy.context.active_object
-    body.name = "CrushedBody"
-    body.scale = (7, 3, 1.2)
-    body.rotation_euler = (0.1, 0.05, 0.02)
-    bpy.ops.object.transform_apply(scale=True, rotation=True)
-    mat = create_material("RustedBody", COLORS["rust"])
-    apply_material(body, mat)
-    parts.append(body)
-
-    # Smashed roof
-    bpy.ops.mesh.primitive_cube_add(size=1, location=(0, 0, 2.8))
-    roof = bpy.context.active_object
-    roof.name = "SmashedRoof"
-    roof.scale = (3.5, 2.5, 0.6)
-    roof.rotation_euler = (-0.15, 0.1, 0.05)
-    bpy.ops.object.transform_apply(scale=True, rotation=True)
-    mat = create_material("RustedRoof", COLORS["rust"])
-    apply_material(roof, mat)
-    parts.append(roof)
-
-    # Flat/missing wheels
-    wheel_data = [
-        (-2, -1.5, 0.4, True),   # Flat
-        (-2, 1.5, 0.4, True),
-        (2, -1.5, 0.3, False),  # Missing (just axle)
-        (2, 1.5, 0.4, True),
-    ]
-
-    for i, (x, y, z, has_wheel) in enumerate(wheel_data):
-        if has_wheel:
-            bpy.ops.mesh.primitive_cylinder_add(radius=0.6, depth=0.4, location=(x, y, z))
-            wheel = bpy.context.active_object
-            wheel.name = f"FlatWheel_{i}"
-            wheel.rotation_euler = (1.57, 0, 0)
-            bpy.ops.object.transform_apply(rotation=True)
-            mat = create_material("FlatTire", (0.1, 0.1, 0.1))
-            apply_material(wheel, mat)
-            parts.append(wheel)
-
-    # Broken window glass on ground
-    for i in range(5):
-        bpy.ops.mesh.primitive_cube_add(size=1, location=(i - 2, 2 + i * 0.2, 0.05))
-        glass = bpy.context.active_object
-        glass.name = f"BrokenGlass_{i}"
-        glass.scale = (0.3, 0.2, 0.02)
-        glass.rotation_euler = (0, 0, i * 0.5)
-        bpy.ops.object.transform_apply(scale=True, rotation=True)
-        mat = create_material(f"Glass_{i}", (0.7, 0.8, 0.85, 0.7))
-        apply_material(glass, mat)
-        parts.append(glass)
-
-    group_objects(parts, "DamagedCar")
-    export_asset("damaged_car")
-
-def create_fallen_power_lines():
-    """Downed power lines and pole"""
-    clear_scene()
-    parts = []
-
-    # Fallen pole
-    bpy.ops.mesh.primitive_cylinder_add(radius=0.3, depth=15, location=(0, 0, 0.5))
-    pole = bpy.context.active_object
-    pole.name = "FallenPole"
-    pole.rotation_euler = (0, 1.4, 0.2)
-    bpy.ops.object.transform_apply(rotation=True)
-    mat = create_material("WoodPole", COLORS["wood_dark"])
-    apply_material(pole, mat)
-    parts.append(pole)
-
-    # Cross beam
-    bpy.ops.mesh.primitive_cube_add(size=1, location=(5, 0, 3))
-    beam = bpy.context.active_object
-    beam.name = "CrossBeam"
-    beam.scale = (0.2, 4, 0.2)
-    beam.rotation_euler = (0, 0.3, 0)
-    bpy.ops.object.transform_apply(scale=True, rotation=True)
-    mat = create_material("BeamWood", COLORS["wood_dark"])
-    apply_material(beam, mat)
-    parts.append(beam)
-
-    # Tangled wires on ground
-    for i in range(4):
-        # Simulate wire as a series of small cylinders
-        for j in range(8):
-            bpy.ops.mesh.primitive_cylinder_add(radius=0.03, depth=2,
-                location=(j - 4 + i, i * 0.5 - 1, 0.2 + j * 0.1))
-            wire = bpy.context.active_object
-            wire.name = f"Wire_{i}_{j}"
-            wire.rotation_euler = (0.1 * j, 0.2 * i, 0.3 + j * 0.1)
-            bpy.ops.object.transform_apply(rotation=True)
-            mat = create_material("WireBlack", (0.05, 0.05, 0.05))
-            apply_material(wire, mat)
-            parts.append(wire)
-
-    # Sparking end (glowing)
-    bpy.ops.mesh.primitive_uv_sphere_add(radius=0.3, location=(-3, 0, 0.5))
-    spark = bpy.context.active_object
-    spark.name = "SparkingEnd"
-    mat = create_material("Spark", (1, 0.9, 0.3), emission=5.0)
-    apply_material(spark, mat)
-    smooth_shade(spark)
-    parts.append(spark)
-
-    group_objects(parts, "FallenPowerLines")
-    export_asset("fallen_power_lines")
-
-# ===========================================
-# 4. HORROR / LIMINAL
-# ===========================================
-
-def create_mannequin():
-    """Creepy store mannequin"""
-    clear_scene()
-    parts = []
-
-    # Body
-    bpy.ops.mesh.primitive_cube_add(size=1, location=(0, 0, 4))
-    torso = bpy.context.active_object
-    torso.name = "Torso"
-    torso.scale = (1.2, 0.6, 2)
-    bpy.ops.object.transform_apply(scale=True)
-    mat = create_material("MannequinSkin", (0.9, 0.8, 0.75))
-    apply_material(torso, mat)
-    parts.append(torso)
-
-    # Head
-    bpy.ops.mesh.primitive_uv_sphere_add(radius=0.6, location=(0, 0, 5.8))
-    head = bpy.context.active_object
-    head.name = "Head"
-    mat = create_material("HeadSkin", (0.9, 0.8, 0.75))
-    apply_material(head, mat)
-    smooth_shade(head)
-    parts.append(head)
-
-    # Featureless face (slightly darker area)
-    bpy.ops.mesh.primitive_uv_sphere_add(radius=0.55, location=(0, 0.2, 5.8))
-    face = bpy.context.active_object
-    face.name = "Face"
-    face.scale = (0.9, 0.5, 0.9)
-    bpy.ops.object.transform_apply(scale=True)
-    mat = create_material("FaceSkin", (0.85, 0.75, 0.7))
-    apply_material(face, mat)
-    smooth_shade(face)
-    parts.append(face)
-
-    # Arms (slightly posed)
-    for side, y_offset, rot in [(-1, -0.8, 0.3), (1, 0.8, -0.3)]:
-        bpy.ops.mesh.primitive_cylinder_add(radius=0.2, depth=2.5, location=(0, y_offset, 3.5))
-        arm = bpy.context.active_object
-        arm.name = f"Arm_{side}"
-        arm.rotation_euler = (0, rot, side * 0.2)
-        bpy.ops.object.transform_apply(rotation=True)
-        mat = create_material(f"ArmSkin_{side}", (0.9, 0.8, 0.75))
-        apply_material(arm, mat)
-        parts.append(arm)
-
-    # Legs
-    for y_offset in [-0.3, 0.3]:
-        bpy.ops.mesh.primitive_cylinder_add(radius=0.25, depth=3, location=(0, y_offset, 1.5))
-        leg = bpy.context.active_object
-        leg.name = f"Leg_{y_offset}"
-        mat = create_material(f"LegSkin_{y_offset}", (0.9, 0.8, 0.75))
-        apply_material(leg, mat)
-        parts.append(leg)
-
-    # Base stand
-    bpy.ops.mesh.primitive_cylinder_add(radius=0.8, depth=0.2, location=(0, 0, 0.1))
-    base = bpy.context.active_object
-    base.name = "Base"
-    mat = create_material("BaseBlack", (0.1, 0.1, 0.1))
-    apply_material(base, mat)
-    parts.append(base)
-
-    group_objects(parts, "Mannequin")
-    export_asset("mannequin")
-
-def create_empty_pool():
-    """Drained swimming pool - liminal space"""
-    clear_scene()
-    parts = []
-
-    # Pool walls
-    bpy.ops.mesh.primitive_cube_add(size=1, location=(0, 0, -3))
-    pool = bpy.context.active_object
-    pool.name = "PoolBasin"
-    pool.scale = (15, 25, 6)
-    bpy.ops.object.transform_apply(scale=True)
-    mat = create_material("PoolBlue", (0.6, 0.8, 0.9))
-    apply_material(pool, mat)
-    parts.append(pool)
-
-    # Pool floor (darker, stained)
-    bpy.ops.mesh.primitive_cube_add(size=1, location=(0, 0, -5.9))
-    floor = bpy.context.active_object
-    floor.name = "PoolFloor"
-    floor.scale = (14.5, 24.5, 0.2)
-    bpy.ops.object.transform_apply(scale=True)
-    mat = create_material("StainedFloor", COLORS["mold_green"])
-    apply_material(floor, mat)
-    parts.append(floor)
-
-    # Drain
-    bpy.ops.mesh.primitive_cylinder_add(radius=0.5, depth=0.1, location=(0, 8, -5.8))
-    drain = bpy.context.active_object
-    drain.name = "Drain"
-    mat = create_material("DrainMetal", COLORS["steel"])
-    apply_material(drain, mat)
-    parts.append(drain)
-
-    # Ladder
-    for y in [0.3, -0.3]:
-        bpy.ops.mesh.primitive_cylinder_add(radius=0.1, depth=8, location=(-7, y, -2))
-        rail = bpy.context.active_object
-        rail.name = f"LadderRail_{y}"
-        mat = create_material("ChromeRail", COLORS["chrome"])
-        apply_material(rail, mat)
-        parts.append(rail)
-
-    # Ladder rungs
-    for z in range(-5, 2, 1):
-        bpy.ops.mesh.primitive_cylinder_add(radius=0.08, depth=0.6, location=(-7, 0, z))
-        rung = bpy.context.active_object
-        rung.name = f"Rung_{z}"
-        rung.rotation_euler = (1.57, 0, 0)
-        bpy.ops.object.transform_apply(rotation=True)
-        mat = create_material(f"ChromeRung_{z}", COLORS["chrome"])
-        apply_material(rung, mat)
-        parts.append(rung)
-
-    # Abandoned pool toys
-    bpy.ops.mesh.primitive_torus_add(major_radius=1.5, minor_radius=0.3, location=(5, -5, -5.5))
-    floatie = bpy.context.active_object
-    floatie.name = "Floatie"
-    floatie.rotation_euler = (0.2, 0.1, 0)
-    bpy.ops.object.transform_apply(rotation=True)
-    mat = create_material("FloatiePink", COLORS["pink"])
-    apply_material(floatie, mat)
-    parts.append(floatie)
-
-    # Beach ball (deflated)
-    bpy.ops.mesh.primitive_uv_sphere_add(radius=0.8, location=(-3, 3, -5.5))
-    ball = bpy.context.active_object
-    ball.name = "DeflatedBall"
-    ball.scale = (1, 1, 0.3)
-    bpy.ops.object.transform_apply(scale=True)
-    mat = create_material("BeachBall", COLORS["coral"])
-    apply_material(ball, mat)
-    smooth_shade(ball)
-    parts.append(ball)
-
-    group_objects(parts, "EmptyPool")
-    export_asset("empty_pool")
-
-def create_old_tv():
-    """Vintage TV with static"""
-    clear_scene()
-    parts = []
-
-    # Cabinet
-    bpy.ops.mesh.primitive_cube_add(size=1, location=(0, 0, 3))
-    cabinet = bpy.context.active_object
-    cabinet.name = "Cabinet"
-    cabinet.scale = (4, 3, 3.5)
-    bpy.ops.object.transform_apply(scale=True)
-    mat = create_material("WoodCabinet", COLORS["wood_dark"])
-    apply_material(cabinet, mat)
-    parts.append(cabinet)
-
-    # Screen (glowing static)
-    bpy.ops.mesh.primitive_cube_add(size=1, location=(0, 1.4, 3.2))
-    screen = bpy.context.active_object
-    screen.name = "Screen"
-    screen.scale = (2.5, 0.1, 2)
-    bpy.ops.object.transform_apply(scale=True)
-    mat = create_material("StaticScreen", COLORS["sickly_yellow"], emission=0.5)
-    apply_material(screen, mat)
-    parts.append(screen)
-
-    # Screen bezel
-    bpy.ops.mesh.primitive_cube_add(size=1, location=(0, 1.35, 3.2))
-    bezel = bpy.context.active_object
-    bezel.name = "Bezel"
-    bezel.scale = (2.8, 0.05, 2.3)
-    bpy.ops.object.transform_apply(scale=True)
-    mat = create_material("BezelGray", COLORS["concrete_gray"])
-    apply_material(bezel, mat)
-    parts.append(bezel)
-
-    # Knobs
-    for z in [2, 3, 4]:
-        bpy.ops.mesh.primitive_cylinder_add(radius=0.2, depth=0.3, location=(1.6, 1.5, z))
-        knob = bpy.context.active_object
-        knob.name = f"Knob_{z}"
-        knob.rotation_euler = (1.57, 0, 0)
-        bpy.ops.object.transform_apply(rotation=True)
-        mat = create_material(f"KnobBrown_{z}", COLORS["wood_dark"])
-        apply_material(knob, mat)
-        parts.append(knob)
-
-    # Antenna ears
-    for x in [-1, 1]:
-        bpy.ops.mesh.primitive_cylinder_add(radius=0.05, depth=3, location=(x, 0, 5.5))
-        antenna = bpy.context.active_object
-        antenna.name = f"Antenna_{x}"
-        antenna.rotation_euler = (0, x * 0.4, 0)
-        bpy.ops.object.transform_apply(rotation=True)
-        mat = create_material(f"AntennaChrome_{x}", COLORS["chrome"])
-        apply_material(antenna, mat)
-        parts.append(antenna)
-
-    # Legs
-    for pos in [(-1.5, -1), (-1.5, 1), (1.5, -1), (1.5, 1)]:
-        bpy.ops.mesh.primitive_cylinder_add(radius=0.15, depth=1.2, location=(pos[0], pos[1], 0.6))
-        leg = bpy.context.active_object
-        leg.name = f"Leg_{pos[0]}_{pos[1]}"
-        mat = create_material("LegWood", COLORS["wood_dark"])
-        apply_material(leg, mat)
-        parts.append(leg)
-
-    group_objects(parts, "OldTV")
-    export_asset("old_tv")
-
-def create_flickering_light():
-    """Ceiling fluorescent light fixture"""
-    clear_scene()
-    parts = []
-
-    # Housing
-    bpy.ops.mesh.primitive_cube_add(size=1, location=(0, 0, 0))
-    housing = bpy.context.active_object
-    housing.name = "Housing"
-    housing.scale = (6, 1.5, 0.3)
-    bpy.ops.object.transform_apply(scale=True)
-    mat = create_material("HousingWhite", COLORS["cream"])
-    apply_material(housing, mat)
-    parts.append(housing)
-
-    # Tubes (glowing)
-    for y in [-0.3, 0.3]:
-        bpy.ops.mesh.primitive_cylinder_add(radius=0.12, depth=5, location=(0, y, -0.25))
-        tube = bpy.context.active_object
-        tube.name = f"Tube_{y}"
-        tube.rotation_euler = (0, 1.57, 0)
-        bpy.ops.object.transform_apply(rotation=True)
-        # One tube dimmer (flickering effect)
-        emission = 3.0 if y > 0 else 1.0
-        mat = create_material(f"TubeGlow_{y}", COLORS["sickly_yellow"], emission=emission)
-        apply_material(tube, mat)
-        parts.append(tube)
-
-    # End caps
-    for x in [-2.7, 2.7]:
-        bpy.ops.mesh.primitive_cube_add(size=1, location=(x, 0, -0.15))
-        cap = bpy.context.active_object
-        cap.name = f"EndCap_{x}"
-        cap.scale = (0.3, 1.3, 0.2)
-        bpy.ops.object.transform_apply(scale=True)
-        mat = create_material(f"CapGray_{x}", COLORS["concrete_gray"])
-        apply_material(cap, mat)
-        parts.append(cap)
-
-    group_objects(parts, "FlickeringLight")
-    export_asset("flickering_light")
-
-def create_shopping_cart():
-    """Abandoned shopping cart"""
-    clear_scene()
-    parts = []
-
-    # Basket frame
-    bpy.ops.mesh.primitive_cube_add(size=1, location=(0, 0, 2.5))
-    basket = bpy.context.active_object
-    basket.name = "Basket"
-    basket.scale = (2, 3, 2)
-    bpy.ops.object.transform_apply(scale=True)
-    mat = create_material("WireFrame", COLORS["chrome"])
-    apply_material(basket, mat)
-    parts.append(basket)
-
-    # Handle
-    bpy.ops.mesh.primitive_cylinder_add(radius=0.08, depth=2.5, location=(0, -1.8, 3.5))
-    handle = bpy.context.active_object
-    handle.name = "Handle"
-    handle.rotation_euler = (0.3, 0, 0)
-    bpy.ops.object.transform_apply(rotation=True)
-    mat = create_material("HandleChrome", COLORS["chrome"])
-    apply_material(handle, mat)
-    parts.append(handle)
-
-    # Wheels
-    for pos in [(-0.8, -1.2), (-0.8, 1.2), (0.8, -1.2), (0.8, 1.2)]:
-        bpy.ops.mesh.primitive_cylinder_add(radius=0.3, depth=0.15, location=(pos[0], pos[1], 0.3))
-        wheel = bpy.context.active_object
-        wheel.name = f"Wheel_{pos[0]}_{pos[1]}"
-        wheel.rotation_euler = (1.57, 0, 0)
-        bpy.ops.object.transform_apply(rotation=True)
-        mat = create_material("WheelBlack", (0.1, 0.1, 0.1))
-        apply_material(wheel, mat)
-        parts.append(wheel)
-
-    # Child seat (folded)
-    bpy.ops.mesh.primitive_cube_add(size=1, location=(0, 1.3, 2))
-    seat = bpy.context.active_object
-    seat.name = "ChildSeat"
-    seat.scale = (1.8, 0.3, 0.8)
-    bpy.ops.object.transform_apply(scale=True)
-    mat = create_material("SeatPlastic", (0.3, 0.3, 0.35))
-    apply_material(seat, mat)
-    parts.append(seat)
-
-    group_objects(parts, "ShoppingCart")
-    export_asset("shopping_cart")
-
-# ===========================================
-# 5. SURVIVAL PROPS
-# ===========================================
-
-def create_first_aid_kit():
-    """Emergency first aid kit"""
-    clear_scene()
-    parts = []
-
-    # Box
-    bpy.ops.mesh.primitive_cube_add(size=1, location=(0, 0, 0.5))
-    box = bpy.context.active_object
-    box.name = "Box"
-    box.scale = (2, 1.2, 0.8)
-    bpy.ops.object.transform_apply(scale=True)
-    mat = create_material("BoxWhite", (0.95, 0.95, 0.95))
-    apply_material(box, mat)
-    parts.append(box)
-
-    # Red cross
-    bpy.ops.mesh.primitive_cube_add(size=1, location=(0, 0.61, 0.5))
-    cross_h = bpy.context.active_object
-    cross_h.name = "CrossH"
-    cross_h.scale = (0.8, 0.02, 0.2)
-    bpy.ops.object.transform_apply(scale=True)
-    mat = create_material("RedCross", (0.9, 0.1, 0.1))
-    apply_material(cross_h, mat)
-    parts.append(cross_h)
-
-    bpy.ops.mesh.primitive_cube_add(size=1, location=(0, 0.61, 0.5))
-    cross_v = bpy.context.active_object
-    cross_v.name = "CrossV"
-    cross_v.scale = (0.2, 0.02, 0.8)
-    bpy.ops.object.transform_apply(scale=True)
-    mat = create_material("RedCrossV", (0.9, 0.1, 0.1))
-    apply_material(cross_v, mat)
-    parts.append(cross_v)
-
-    # Handle
-    bpy.ops.mesh.primitive_cube_add(size=1, location=(0, 0, 1.1))
-    handle = bpy.context.active_object
-    handle.name = "Handle"
-    handle.scale = (0.8, 0.1, 0.15)
-    bpy.ops.object.transform_apply(scale=True)
-    mat = create_material("HandleGray", COLORS["concrete_gray"])
-    apply_material(handle, mat)
-    parts.append(handle)
-
-    # Latches
-    for x in [-0.7, 0.7]:
-        bpy.ops.mesh.primitive_cube_add(size=1, location=(x, 0.5, 0.5))
-        latch = bpy.context.active_object
-        latch.name = f"Latch_{x}"
-        latch.scale = (0.15, 0.15, 0.08)
-        bpy.ops.object.transform_apply(scale=True)
-        mat = create_material(f"LatchMetal_{x}", COLORS["chrome"])
-        apply_material(latch, mat)
-        parts.append(latch)
-
-    group_objects(parts, "FirstAidKit")
-    export_asset("first_aid_kit")
-
-def create_flashlight():
-    """Heavy duty flashlight"""
-    clear_scene()
-    parts = []
-
-    # Body
-    bpy.ops.mesh.primitive_cylinder_add(radius=0.3, depth=2.5, location=(0, 0, 1.25))
-    body = bpy.context.active_object
-    body.name = "Body"
-    mat = create_material("BodyBlack", (0.1, 0.1, 0.1))
-    apply_material(body, mat)
-    parts.append(body)
-
-    # Head
-    bpy.ops.mesh.primitive_cylinder_add(radius=0.5, depth=0.8, location=(0, 0, 2.9))
-    head = bpy.context.active_object
-    head.name = "Head"
-    mat = create_material("HeadBlack", (0.1, 0.1, 0.1))
-    apply_material(head, mat)
-    parts.append(head)
-
-    # Lens
-    bpy.ops.mesh.primitive_cylinder_add(radius=0.45, depth=0.1, location=(0, 0, 3.35))
-    lens = bpy.context.active_object
-    lens.name = "Lens"
-    mat = create_material("LensGlow", COLORS["cream"], emission=2.0)
-    apply_material(lens, mat)
-    parts.append(lens)
-
-    # Grip ridges
-    for z in [0.5, 0.8, 1.1, 1.4, 1.7]:
-        bpy.ops.mesh.primitive_torus_add(major_radius=0.32, minor_radius=0.03, location=(0, 0, z))
-        ridge = bpy.context.active_object
-        ridge.name = f"Ridge_{z}"
-        mat = create_material(f"RidgeGray_{z}", (0.2, 0.2, 0.2))
-        apply_material(ridge, mat)
-        parts.append(ridge)
-
-    # Button
-    bpy.ops.mesh.primitive_cylinder_add(radius=0.08, depth=0.05, location=(0.25, 0, 2))
-    button = bpy.context.active_object
-    button.name = "Button"
-    button.rotation_euler = (0, 1.57, 0)
-    bpy.ops.object.transform_apply(rotation=True)
-    mat = create_material("ButtonOrange", COLORS["orange"])
-    apply_material(button, mat)
-    parts.append(button)
-
-    group_objects(parts, "Flashlight")
-    export_asset("flashlight")
-
-def create_camping_tent():
-    """Small survival tent"""
-    clear_scene()
-    parts = []
-
-    # Main tent body (triangular prism)
-    bpy.ops.mesh.primitive_cone_add(vertices=3, radius1=4, radius2=4, depth=6, location=(0, 0, 2))
-    tent = bpy.context.active_object
-    tent.name = "TentBody"
-    tent.rotation_euler = (1.57, 0, 0)
-    bpy.ops.object.transform_apply(rotation=True)
-    mat = create_material("TentOrange", COLORS["orange"])
-    apply_material(tent, mat)
-    parts.append(tent)
-
-    # Door opening (darker)
-    bpy.ops.mesh.primitive_cone_add(vertices=3, radius1=1.5, radius2=1.5, depth=0.5, location=(0, 3.1, 1.5))
-    door = bpy.context.active_object
-    door.name = "Door"
-    door.rotation_euler = (1.57, 0, 0)
-    bpy.ops.object.transform_apply(rotation=True)
-    mat = create_material("DoorDark", (0.1, 0.1, 0.1))
-    apply_material(door, mat)
-    parts.append(door)
-
-    # Guy lines
-    for angle in [0, 2.09, 4.18]:
-        x = 5 * math.cos(angle)
-        y = 5 * math.sin(angle)
-        bpy.ops.mesh.primitive_cylinder_add(radius=0.02, depth=5, location=(x/2, y/2, 1.5))
-        line = bpy.context.active_object
-        line.name = f"GuyLine_{angle}"
-        line.rotation_euler = (0, 0.5, angle)
-        bpy.ops.object.transform_apply(rotation=True)
-        mat = create_material("RopeYellow", COLORS["mustard"])
-        apply_material(line, mat)
-        parts.append(line)
-
-    group_objects(parts, "CampingTent")
-    export_asset("camping_tent")
-
-def create_campfire():
-    """Campfire with logs"""
-    clear_scene()
-    parts = []
-
-    # Fire pit ring (rocks)
-    for i in range(8):
-        angle = i * (2 * math.pi / 8)
-        x = 2 * math.cos(angle)
-        y = 2 * math.sin(angle)
-        bpy.ops.mesh.primitive_cube_add(size=1, location=(x, y, 0.3))
-        rock = bpy.context.active_object
-        rock.name = f"Rock_{i}"
-        rock.scale = (0.8, 0.6, 0.5)
-        rock.rotation_euler = (0.1, 0.1, angle)
-        bpy.ops.object.transform_apply(scale=True, rotation=True)
-        mat = create_material(f"RockGray_{i}", COLORS["rock_brown"])
-        apply_material(rock, mat)
-        parts.append(rock)
-
-    # Logs
-    for i, (x, y, rot) in enumerate([(-0.5, 0, 0.5), (0.5, 0, -0.5), (0, -0.3, 1.57)]):
-        bpy.ops.mesh.primitive_cylinder_add(radius=0.25, depth=2, location=(x, y, 0.5))
-        log = bpy.context.active_object
-        log.name = f"Log_{i}"
-        log.rotation_euler = (0, 0.3, rot)
-        bpy.ops.object.transform_apply(rotation=True)
-        mat = create_material(f"LogWood_{i}", COLORS["wood_dark"])
-        apply_material(log, mat)
-        parts.append(log)
-
-    # Flames (stylized)
-    flame_positions = [
-        (0, 0, 1, 0.6), (-0.3, 0.2, 1.3, 0.4), (0.3, -0.2, 1.2, 0.5),
-        (0, 0.3, 1.5, 0.3), (-0.2, -0.3, 1.4, 0.35)
-    ]
-    for i, (x, y, z, s) in enumerate(flame_positions):
-        bpy.ops.mesh.primitive_cone_add(radius1=s * 0.5, radius2=0, depth=s * 2, location=(x, y, z))
-        flame = bpy.context.active_object
-        flame.name = f"Flame_{i}"
-        mat = create_material(f"FlameOrange_{i}", COLORS["orange"], emission=5.0)
-        apply_material(flame, mat)
-        parts.append(flame)
-
-    # Embers (small glowing spheres)
-    for i in range(10):
-        x = (i % 3 - 1) * 0.5
-        y = (i // 3 - 1) * 0.4
-        bpy.ops.mesh.primitive_uv_sphere_add(radius=0.08, location=(x, y, 0.15))
-        ember = bpy.context.active_object
-        ember.name = f"Ember_{i}"
-        mat = create_material(f"EmberGlow_{i}", COLORS["lava_red"], emission=3.0)
-        apply_material(ember, mat)
-        smooth_shade(ember)
-        parts.append(ember)
-
-    group_objects(parts, "Campfire")
-    export_asset("campfire")
-
-def create_water_bottle():
-    """Plastic water bottle"""
-    clear_scene()
-    parts = []
-
-    # Bottle body
-    bpy.ops.mesh.primitive_cylinder_add(radius=0.4, depth=2, location=(0, 0, 1))
-    body = bpy.context.active_object
-    body.name = "Bottle"
-    mat = create_material("BottlePlastic", (0.7, 0.85, 0.95, 0.8))
-    apply_material(body, mat)
-    smooth_shade(body)
-    parts.append(body)
-
-    # Neck
-    bpy.ops.mesh.primitive_cylinder_add(radius=0.2, depth=0.4, location=(0, 0, 2.2))
-    neck = bpy.context.active_object
-    neck.name = "Neck"
-    mat = create_material("NeckPlastic", (0.7, 0.85, 0.95, 0.8))
-    apply_material(neck, mat)
-    parts.append(neck)
-
-    # Cap
-    bpy.ops.mesh.primitive_cylinder_add(radius=0.22, depth=0.25, location=(0, 0, 2.55))
-    cap = bpy.context.active_object
-    cap.name = "Cap"
-    mat = create_material("CapBlue", COLORS["ocean_blue"])
-    apply_material(cap, mat)
-    parts.append(cap)
-
-    # Water inside (visible through bottle)
-    bpy.ops.mesh.primitive_cylinder_add(radius=0.35, depth=1.2, location=(0, 0, 0.8))
-    water = bpy.context.active_object
-    water.name = "Water"
-    mat = create_material("WaterBlue", (0.5, 0.7, 0.9, 0.6))
-    apply_material(water, mat)
-    parts.append(water)
-
-    # Label
-    bpy.ops.mesh.primitive_cylinder_add(radius=0.42, depth=0.8, location=(0, 0, 1))
-    label = bpy.context.active_object
-    label.name = "Label"
-    mat = create_material("LabelWhite", COLORS["cream"])
-    apply_material(label, mat)
-    parts.append(label)
-
-    group_objects(parts, "WaterBottle")
-    export_asset("water_bottle")
-
-# ===========================================
-# 6. SIGNS AND MARKERS
-# ===========================================
-
-def create_warning_sign():
-    """Diamond-shaped warning sign"""
-    clear_scene()
-    parts = []
-
-    # Post
-    bpy.ops.mesh.primitive_cylinder_add(radius=0.15, depth=8, location=(0, 0, 4))
-    post = bpy.context.active_object
-    post.name = "Post"
-    mat = create_material("PostMetal", COLORS["steel"])
-    apply_material(post, mat)
-    parts.append(post)
-
-    # Diamond sign (rotated square)
-    bpy.ops.mesh.primitive_cube_add(size=1, location=(0, 0.2, 7))
-    sign = bpy.context.active_object
-    sign.name = "Sign"
-    sign.scale = (3, 0.1, 3)
-    sign.rotation_euler = (0, 0, 0.785)  # 45 degrees
-    bpy.ops.object.transform_apply(scale=True, rotation=True)
-    mat = create_material("SignYellow", COLORS["mustard"])
-    apply_material(sign, mat)
-    parts.append(sign)
-
-    # Exclamation mark (simplified)
-    bpy.ops.mesh.primitive_cube_add(size=1, location=(0, 0.25, 7.2))
-    exclaim = bpy.context.active_object
-    exclaim.name = "Exclaim"
-    exclaim.scale = (0.3, 0.05, 1.2)
-    bpy.ops.object.transform_apply(scale=True)
-    mat = create_material("ExclaimBlack", (0.05, 0.05, 0.05))
-    apply_material(exclaim, mat)
-    parts.append(exclaim)
-
-    bpy.ops.mesh.primitive_cube_add(size=1, location=(0, 0.25, 6.2))
-    dot = bpy.context.active_object
-    dot.name = "Dot"
-    dot.scale = (0.3, 0.05, 0.3)
-    bpy.ops.object.transform_apply(scale=True)
-    mat = create_material("DotBlack", (0.05, 0.05, 0.05))
-    apply_material(dot, mat)
-    parts.append(dot)
-
-    group_objects(parts, "WarningSign")
-    export_asset("warning_sign")
-
-def create_route_66_sign():
-    """Classic Route 66 highway shield"""
-    clear_scene()
-    parts = []
-
-    # Post
-    bpy.ops.mesh.primitive_cylinder_add(radius=0.2, depth=10, location=(0, 0, 5))
-    post = bpy.context.active_object
-    post.name = "Post"
-    mat = create_material("PostWood", COLORS["wood_dark"])
-    apply_material(post, mat)
-    parts.append(post)
-
-    # Shield shape (simplified as rounded cube)
-    bpy.ops.mesh.primitive_cube_add(size=1, location=(0, 0.3, 9))
-    shield = bpy.context.active_object
-    shield.name = "Shield"
-    shield.scale = (3, 0.15, 3.5)
-    bpy.ops.object.transform_apply(scale=True)
-    mat = create_material("ShieldWhite", COLORS["cream"])
-    apply_material(shield, mat)
-    parts.append(shield)
-
-    # Inner shield
-    bpy.ops.mesh.primitive_cube_add(size=1, location=(0, 0.35, 9))
-    inner = bpy.context.active_object
-    inner.name = "InnerShield"
-    inner.scale = (2.5, 0.05, 3)
-    bpy.ops.object.transform_apply(scale=True)
-    mat = create_material("InnerBlack", (0.1, 0.1, 0.1))
-    apply_material(inner, mat)
-    parts.append(inner)
-
-    # 66 numbers (simplified blocks)
-    for x in [-0.5, 0.5]:
-        bpy.ops.mesh.primitive_cube_add(size=1, location=(x, 0.4, 9))
-        num = bpy.context.active_object
-        num.name = f"Six_{x}"
-        num.scale = (0.6, 0.05, 1.2)
-        bpy.ops.object.transform_apply(scale=True)
-        mat = create_material(f"NumWhite_{x}", COLORS["cream"])
-        apply_material(num, mat)
-        parts.append(num)
-
-    group_objects(parts, "Route66Sign")
-    export_asset("route_66_sign")
-
-def create_evacuation_sign():
-    """Emergency evacuation route sign"""
-    clear_scene()
-    parts = []
-
-    # Post
-    bpy.ops.mesh.primitive_cube_add(size=1, location=(0, 0, 4))
-    post = bpy.context.active_object
-    post.name = "Post"
-    post.scale = (0.3, 0.3, 8)
-    bpy.ops.object.transform_apply(scale=True)
-    mat = create_material("PostSteel", COLORS["steel"])
-    apply_material(post, mat)
-    parts.append(post)
-
-    # Sign panel
-    bpy.ops.mesh.primitive_cube_add(size=1, location=(0, 0.2, 7))
-    panel = bpy.context.active_object
-    panel.name = "Panel"
-    panel.scale = (5, 0.1, 2)
-    bpy.ops.object.transform_apply(scale=True)
-    mat = create_material("PanelGreen", (0.1, 0.5, 0.2))
-    apply_material(panel, mat)
-    parts.append(panel)
-
-    # Arrow
-    bpy.ops.mesh.primitive_cone_add(radius1=0.5, radius2=0, depth=1, location=(1.5, 0.25, 7))
-    arrow = bpy.context.active_object
-    arrow.name = "Arrow"
-    arrow.rotation_euler = (0, 0, -1.57)
-    bpy.ops.object.transform_apply(rotation=True)
-    mat = create_material("ArrowWhite", COLORS["cream"])
-    apply_material(arrow, mat)
-    parts.append(arrow)
-
-    # Arrow shaft
-    bpy.ops.mesh.primitive_cube_add(size=1, location=(0, 0.25, 7))
-    shaft = bpy.context.active_object
-    shaft.name = "Shaft"
-    shaft.scale = (2, 0.05, 0.3)
-    bpy.ops.object.transform_apply(scale=True)
-    mat = create_material("ShaftWhite", COLORS["cream"])
-    apply_material(shaft, mat)
-    parts.append(shaft)
-
-    # Running figure (simplified)
-    bpy.ops.mesh.primitive_uv_sphere_add(radius=0.3, location=(-1.5, 0.25, 7.3))
-    head = bpy.context.active_object
-    head.name = "FigureHead"
-    mat = create_material("FigureWhite", COLORS["cream"])
-    apply_material(head, mat)
-    smooth_shade(head)
-    parts.append(head)
-
-    bpy.ops.mesh.primitive_cube_add(size=1, location=(-1.5, 0.25, 6.7))
-    body = bpy.context.active_object
-    body.name = "FigureBody"
-    body.scale = (0.3, 0.05, 0.6)
-    bpy.ops.object.transform_apply(scale=True)
-    mat = create_material("FigureBodyWhite", COLORS["cream"])
-    apply_material(body, mat)
-    parts.append(body)
-
-    group_objects(parts, "EvacuationSign")
-    export_asset("evacuation_sign")
-
-# ===========================================
-# 7. VEGETATION
-# ===========================================
-
-def create_dead_tree():
-    """Dead/burnt tree"""
-    clear_scene()
-    parts = []
-
-    # Trunk
-    bpy.ops.mesh.primitive_cone_add(radius1=1.5, radius2=0.3, depth=15, location=(0, 0, 7.5))
-    trunk = bpy.context.active_object
-    trunk.name = "Trunk"
-    mat = create_material("DeadWood", (0.2, 0.15, 0.1))
-    apply_material(trunk, mat)
-    parts.append(trunk)
-
-    # Dead branches
-    branches = [
-        (0, 0, 10, 5, 0.3, 0.8, 0.3),
-        (0, 0, 12, 4, -0.3, -0.5, 0.4),
-        (0, 0, 8, 3.5, 0.5, 0.2, -0.3),
-        (0, 0, 14, 2.5, -0.4, 0.6, 0.2),
-    ]
-
-    for i, (x, y, z, length, rx, ry, rz) in enumerate(branches):
-        bpy.ops.mesh.primitive_cone_add(radius1=0.2, radius2=0.05, depth=length, location=(x, y, z))
-        branch = bpy.context.active_object
-        branch.name = f"Branch_{i}"
-        branch.rotation_euler = (rx, ry, rz)
-        bpy.ops.object.transform_apply(rotation=True)
-        mat = create_material(f"BranchDead_{i}", (0.2, 0.15, 0.1))
-        apply_material(branch, mat)
-        parts.append(branch)
-
-    group_objects(parts, "DeadTree")
-    export_asset("dead_tree")
-
-def create_cactus():
-    """Desert saguaro cactus"""
-    clear_scene()
-    parts = []
-
-    # Main body
-    bpy.ops.mesh.primitive_cylinder_add(radius=1, depth=12, location=(0, 0, 6))
-    body = bpy.context.active_object
-    body.name = "Body"
-    mat = create_material("CactusGreen", (0.2, 0.5, 0.2))
-    apply_material(body, mat)
-    parts.append(body)
-
-    # Arms
-    arms = [
-        (0, 0, 7, 1.57, 0.5, 4),   # Right arm
-        (0, 0, 9, -1.57, -0.4, 3), # Left arm
-    ]
-
-    for i, (x, y, z, rot_y, rot_z, length) in enumerate(arms):
-        # Horizontal section
-        bpy.ops.mesh.primitive_cylinder_add(radius=0.6, depth=2, location=(0, 0, z))
-        arm_h = bpy.context.active_object
-        arm_h.name = f"ArmH_{i}"
-        arm_h.rotation_euler = (0, rot_y, 0)
-        arm_h.location = (1.5 * (1 if i == 0 else -1), 0, z)
-        bpy.ops.object.transform_apply(rotation=True)
-        mat = create_material(f"ArmGreen_{i}", (0.2, 0.5, 0.2))
-        apply_material(arm_h, mat)
-        parts.append(arm_h)
-
-        # Vertical section
-        bpy.ops.mesh.primitive_cylinder_add(radius=0.5, depth=length, location=(2.5 * (1 if i == 0 else -1), 0, z + length/2))
-        arm_v = bpy.context.active_object
-        arm_v.name = f"ArmV_{i}"
-        mat = create_material(f"ArmVGreen_{i}", (0.2, 0.5, 0.2))
-        apply_material(arm_v, mat)
-        parts.append(arm_v)
-
-    group_objects(parts, "Cactus")
-    export_asset("cactus")
-
-def create_tumbleweed():
-    """Rolling tumbleweed"""
-    clear_scene()
-    parts = []
-
-    # Core sphere (icosphere for organic look)
-    bpy.ops.mesh.primitive_ico_sphere_add(radius=1.5, subdivisions=2, location=(0, 0, 1.5))
-    core = bpy.context.active_object
-    core.name = "Core"
-    mat = create_material("TumbleCore", COLORS["sand"])
-    apply_material(core, mat)
-    parts.append(core)
-
-    # Add spiky branches
-    for i in range(20):
-        # Random-ish positions on sphere surface
-        theta = (i / 20) * 2 * math.pi
-        phi = (i % 5) * 0.6 + 0.3
-        x = 1.5 * math.sin(phi) * math.cos(theta)
-        y = 1.5 * math.sin(phi) * math.sin(theta)
-        z = 1.5 * math.cos(phi) + 1.5
-
-        length = 0.5 + (i % 3) * 0.3
-        bpy.ops.mesh.primitive_cylinder_add(radius=0.03, depth=length, location=(x * 1.2, y * 1.2, z))
-        stick = bpy.context.active_object
-        stick.name = f"Stick_{i}"
-        # Point outward
-        stick.rotation_euler = (phi - 1.57, 0, theta)
-        bpy.ops.object.transform_apply(rotation=True)
-        mat = create_material(f"StickBrown_{i}", COLORS["sand"])
-        apply_material(stick, mat)
-        parts.append(stick)
-
-    group_objects(parts, "Tumbleweed")
-    export_asset("tumbleweed")
-
-# ===========================================
-# MAIN EXECUTION
-# ===========================================
-
-def main():
-    print("=" * 50)
-    print("FAULTLINE FEAR: ASSET ARSENAL GENERATOR")
-    print("=" * 50)
-
-    ensure_output_dir()
-
-    # 1. RETRO 60s CALIFORNIA
-    print("\n[1/7] Creating Retro 60s California assets...")
-    create_vintage_diner()
-    create_retro_gas_station()
-    create_classic_car_57()
-    create_motel_sign()
-    create_drive_in_screen()
-    create_tiki_bar()
-
-    # 2. BEACH / COASTAL
-    print("\n[2/7] Creating Beach/Coastal assets...")
-    create_lifeguard_tower()
-    create_surfboard()
-    create_beach_umbrella()
-    create_pier_section()
-    create_palm_tree()
-
-    # 3. EARTHQUAKE / DESTRUCTION
-    print("\n[3/7] Creating Earthquake/Destruction assets...")
-    create_cracked_earth()
-    create_steam_vent()
-    create_rubble_pile()
-    create_damaged_car()
-    create_fallen_power_lines()
-
-    # 4. HORROR / LIMINAL
-    print("\n[4/7] Creating Horror/Liminal assets...")
-    create_mannequin()
-    create_empty_pool()
-    create_old_tv()
-    create_flickering_light()
-    create_shopping_cart()
-
-    # 5. SURVIVAL PROPS
-    print("\n[5/7] Creating Survival Props...")
-    create_first_aid_kit()
-    create_flashlight()
-    create_camping_tent()
-    create_campfire()
-    create_water_bottle()
-
-    # 6. SIGNS AND MARKERS
-    print("\n[6/7] Creating Signs and Markers...")
-    create_warning_sign()
-    create_route_66_sign()
-    create_evacuation_sign()
-
-    # 7. VEGETATION
-    print("\n[7/7] Creating Vegetation...")
-    create_dead_tree()
-    create_cactus()
-    create_tumbleweed()
-
-    print("\n" + "=" * 50)
-    print("ASSET GENERATION COMPLETE!")
-    print(f"Output directory: {OUTPUT_DIR}")
-    print("=" * 50)
-
-if __name__ == "__main__":
-    main()
+"""
+Faultline Fear: Comprehensive Asset Arsenal Generator
+
+Creates eye-popping 3D assets for:
+- Earthquake destruction
+- 1960s retro California
+- Beach/coastal
+- Mountains/terrain
+- Fault line features
+- Horror/liminal spaces
+- Survival props
+
+Run: blender --background --python tools/blender/create_asset_arsenal.py
+"""
+
+import bpy
+import bmesh
+import argparse
+import hashlib
+import inspect
+import math
+import os
+import subprocess
+import sys
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from mathutils import Euler, Matrix
+
+# Add tools directory to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from blender_utils import (
+    clear_scene, create_material, apply_material,
+    export_fbx, create_primitive,
+    group_objects, set_origin_to_bottom, _torus_mesh_data,
+    fast_build,
+)
+
+OUTPUT_DIR = "assets/models/arsenal"
+EXPORT_SCALE = 1.0  # 1:1 stud scale
+
+# ===========================================
+# COLOR PALETTES
+# ===========================================
+
+_COLOR_DEFS = {
+    # Retro 60s California
+    "turquoise": (0.25, 0.88, 0.82),
+    "coral": (1.0, 0.5, 0.31),
+    "mustard": (1.0, 0.86, 0.35),
+    "pink": (1.0, 0.71, 0.76),
+    "cream": (1.0, 0.99, 0.82),
+    "teal": (0.0, 0.5, 0.5),
+    "orange": (1.0, 0.55, 0.0),
+
+    # Neon signs
+    "neon_pink": (1.0, 0.08, 0.58),
+    "neon_blue": (0.0, 0.75, 1.0),
+    "neon_green": (0.22, 1.0, 0.08),
+    "neon_orange": (1.0, 0.4, 0.0),
+
+    # Horror/liminal
+    "sickly_yellow": (0.9, 0.9, 0.5),
+    "concrete_gray": (0.5, 0.5, 0.5),
+    "rust": (0.72, 0.26, 0.06),
+    "dried_blood": (0.4, 0.1, 0.1),
+    "mold_green": (0.3, 0.4, 0.2),
+
+    # Natural
+    "sand": (0.76, 0.70, 0.50),
+    "palm_green": (0.13, 0.55, 0.13),
+    "ocean_blue": (0.0, 0.47, 0.75),
+    "rock_brown": (0.4, 0.3, 0.2),
+    "lava_red": (1.0, 0.2, 0.0),
+    "steam_white": (0.95, 0.95, 0.95),
+
+    # Metal/industrial
+    "chrome": (0.77, 0.77, 0.77),
+    "copper": (0.72, 0.45, 0.20),
+    "steel": (0.5, 0.5, 0.55),
+
+    # Wood
+    "wood_light": (0.76, 0.60, 0.42),
+    "wood_dark": (0.4, 0.26, 0.13),
+    "driftwood": (0.6, 0.55, 0.5),
+}
+
+# The palette is stored as one contiguous (N, 4) float32 array; COLORS
+# maps each name to a row view, so call sites read the same memory the
+# bulk writes do instead of shuffling per-color Python tuples around.
+COLOR_NAMES = {name: i for i, name in enumerate(_COLOR_DEFS)}
+COLOR_RGBA = np.array([(*rgb, 1.0) for rgb in _COLOR_DEFS.values()], dtype=np.float32)
+COLORS = {name: COLOR_RGBA[i] for name, i in COLOR_NAMES.items()}
+
+def get_color(name):
+    """RGBA row view into the palette array for a named color."""
+    return COLOR_RGBA[COLOR_NAMES[name]]
+
+def ensure_output_dir():
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+
+def export_asset(name):
+    _flush_links()
+    filepath = os.path.join(OUTPUT_DIR, f"{name}.fbx")
+    export_fbx(filepath, EXPORT_SCALE)
+    print(f"Exported: {name}")
+
+# ===========================================
+# DIRECT PART CONSTRUCTION
+# ===========================================
+# bpy.ops.mesh.primitive_*_add runs operator context resolution, an undo
+# push, and a depsgraph update on every call; with dozens of primitives
+# per asset that dominates build time.  add_part builds the geometry with
+# bmesh, creates the object through bpy.data, and keeps location/rotation/
+# scale on the object itself — the FBX exporter bakes object transforms,
+# so there is no transform_apply pass at all.
+#
+# Rule for hot build paths: never read bpy.context.active_object to find
+# a newly created object (it re-scans the view layer on every access) —
+# use the object add_part returns.
+
+def _build_cube(bm, size=1.0):
+    bmesh.ops.create_cube(bm, size=size)
+
+def _build_cylinder(bm, radius=1.0, depth=2.0, segments=32):
+    bmesh.ops.create_cone(bm, cap_ends=True, segments=segments,
+                          radius1=radius, radius2=radius, depth=depth)
+
+def _build_cone(bm, radius1=1.0, radius2=0.0, depth=2.0, segments=32):
+    bmesh.ops.create_cone(bm, cap_ends=True, segments=segments,
+                          radius1=radius1, radius2=radius2, depth=depth)
+
+def _build_uv_sphere(bm, radius=1.0, segments=32, ring_count=16):
+    bmesh.ops.create_uvsphere(bm, u_segments=segments, v_segments=ring_count,
+                              radius=radius)
+
+def _build_ico_sphere(bm, radius=1.0, subdivisions=2):
+    bmesh.ops.create_icosphere(bm, subdivisions=subdivisions, radius=radius)
+
+_PART_BUILDERS = {
+    "cube": _build_cube,
+    "cylinder": _build_cylinder,
+    "cone": _build_cone,
+    "uv_sphere": _build_uv_sphere,
+    "ico_sphere": _build_ico_sphere,
+}
+
+# Template meshes shared by every part with the same shape and
+# dimensions: the five diner stools, four gas-station columns, four car
+# wheels, six pier pilings (and every unit cube, since scale lives on
+# the object) all link one datablock apiece.
+_PART_MESH_CACHE = {}
+
+def _part_mesh(kind, dims):
+    """Get (or build once) the shared template mesh for a part shape.
+
+    A smooth=True dim bakes smooth shading into the template (and keys
+    it separately), so objects that scale one shared sphere don't have
+    to touch the mesh themselves.
+    """
+    key = (kind, tuple(sorted(dims.items())))
+    cached = _PART_MESH_CACHE.get(key)
+    if cached is not None:
+        try:
+            cached.name  # Raises ReferenceError if the datablock was removed
+            return cached
+        except ReferenceError:
+            del _PART_MESH_CACHE[key]
+
+    dims = dict(dims)
+    smooth = dims.pop("smooth", False)
+    mesh = bpy.data.meshes.new(kind)
+    if kind == "torus":
+        verts, faces = _torus_mesh_data(
+            dims.get("major_radius", 1.0), dims.get("minor_radius", 0.25))
+        mesh.from_pydata(verts.tolist(), [], faces.tolist())
+        mesh.update()
+    else:
+        bm = bmesh.new()
+        _PART_BUILDERS[kind](bm, **dims)
+        bm.to_mesh(mesh)
+        bm.free()
+    if smooth:
+        polygons = mesh.polygons
+        polygons.foreach_set("use_smooth", np.ones(len(polygons), dtype=bool))
+
+    # One empty slot for apply_material's object-linked binding, and a
+    # fake user so the template survives clear_scene between assets
+    mesh.materials.append(None)
+    mesh.use_fake_user = True
+    _PART_MESH_CACHE[key] = mesh
+    return mesh
+
+def add_merged_parts(kind, name, transforms, **dims):
+    """Build N copies of one template shape as a single mesh/object.
+
+    transforms is an iterable of (location, rotation, scale) triples;
+    rotation and scale may be None.  For dense decorative groups (wire
+    tangles, ladder rungs, crack fissures) where per-part identity does
+    not matter, one merged part beats dozens of objects.
+    """
+    template = _part_mesh(kind, dims)
+    bm = bmesh.new()
+    for location, rotation, scale in transforms:
+        vert_start = len(bm.verts)
+        bm.from_mesh(template)
+        bm.verts.ensure_lookup_table()
+        matrix = Matrix.Translation(location)
+        if rotation is not None:
+            matrix = matrix @ Euler(rotation).to_matrix().to_4x4()
+        if scale is not None:
+            matrix = matrix @ Matrix.Diagonal((*scale, 1))
+        bmesh.ops.transform(bm, matrix=matrix, verts=bm.verts[vert_start:])
+    mesh = bpy.data.meshes.new(name)
+    bm.to_mesh(mesh)
+    bm.free()
+    obj = bpy.data.objects.new(name, mesh)
+    _PENDING_LINK.append(obj)
+    return obj
+
+# Parts stay outside every collection while an asset is under
+# construction, so the depsgraph never sees (or re-evaluates) the
+# half-built scene; export_asset links the whole batch in one pass.
+_PENDING_LINK = []
+
+def _flush_links():
+    """Link all pending parts and run one view-layer update for the batch."""
+    collection = bpy.context.scene.collection
+    for obj in _PENDING_LINK:
+        collection.objects.link(obj)
+    _PENDING_LINK.clear()
+    bpy.context.view_layer.update()
+
+def add_part(kind, name, location=(0, 0, 0), scale=None, rotation=None, **dims):
+    """Create one named asset part without going through bpy.ops.
+
+    Returns the new object directly, so callers never touch
+    bpy.context.active_object.  Shape dimensions (radius, depth,
+    major_radius, ...) are passed through as keyword arguments.
+    """
+    obj = bpy.data.objects.new(name, _part_mesh(kind, dims))
+    obj.location = location
+    if rotation is not None:
+        obj.rotation_euler = rotation
+    if scale is not None:
+        obj.scale = scale
+    _PENDING_LINK.append(obj)
+    return obj
+
+# ===========================================
+# 1. RETRO 60s CALIFORNIA
+# ===========================================
+
+# Part rows: (shape, name, location, dims, scale, rotation, material,
+# color, emission).  color is a palette key or a literal RGBA tuple;
+# dims are extra shape kwargs (radius, depth, segments, ...).  Keeping
+# the asset as data makes the spec hashable for export caching.
+DINER_PARTS = [
+    # Main building - streamlined design, chrome trim band, roof
+    ("cube", "DinerBody", (0, 0, 6), None, (20, 12, 6), None, "DinerTurquoise", "turquoise", 0),
+    ("cube", "ChromeTrim", (0, 0, 10), None, (20.5, 12.5, 0.5), None, "Chrome", "chrome", 0),
+    ("cube", "Roof", (0, 0, 11.5), None, (21, 13, 1), None, "RoofCream", "cream", 0),
+] + [
+    # Large windows
+    ("cube", f"Window_{x}", (x, 6.1, 5), None, (5, 0.2, 4), None, "Glass", (0.6, 0.8, 0.9, 0.5), 0)
+    for x in [-8, 0, 8]
+] + [
+    # Neon sign on roof "EATS"
+    ("cube", "NeonSign", (0, 0, 14), None, (8, 0.5, 3), None, "NeonPink", "neon_pink", 2.0),
+] + [
+    # Counter stools visible through window
+    row for x in [-6, -3, 0, 3, 6] for row in (
+        ("cylinder", f"Stool_{x}", (x, 4, 2.5), {"radius": 0.8, "depth": 0.3, "segments": 12}, None, None, "CoralSeat", "coral", 0),
+        ("cylinder", f"StoolPole_{x}", (x, 4, 1), {"radius": 0.2, "depth": 2.5, "segments": 8}, None, None, "ChromePole", "chrome", 0),
+    )
+]
+
+def _build(rows, group_name, asset_name):
+    """Build one asset from a table of part rows and export it."""
+    clear_scene()
+    parts = []
+    for kind, name, location, dims, scale, rotation, mat_name, color, emission in rows:
+        obj = add_part(kind, name, location=location, scale=scale,
+                       rotation=rotation, **(dims or {}))
+        if isinstance(color, str):
+            color = COLORS[color]
+        apply_material(obj, create_material(mat_name, color, emission=emission))
+        parts.append(obj)
+    group_objects(parts, group_name)
+    export_asset(asset_name)
+
+def create_vintage_diner():
+    """Classic 1960s roadside diner with chrome and neon"""
+    _build(DINER_PARTS, "VintageDiner", "vintage_diner")
+
+def create_retro_gas_station():
+    """1960s Googie-style gas station with dramatic canopy"""
+    clear_scene()
+    parts = []
+
+    # Office building
+    office = add_part("cube", "Office", location=(-12, 0, 5), scale=(8, 10, 5))
+    mat = create_material("OfficeCream", COLORS["cream"])
+    apply_material(office, mat)
+    parts.append(office)
+
+    # Dramatic angular canopy (Googie style)
+    canopy = add_part("cube", "Canopy", location=(5, 0, 12), scale=(25, 15, 0.5), rotation=(0.1, 0, 0))  # Slight tilt
+    mat = create_material("CanopyOrange", COLORS["orange"])
+    apply_material(canopy, mat)
+    parts.append(canopy)
+
+    # Canopy support columns
+    for pos in [(-8, -6), (-8, 6), (18, -6), (18, 6)]:
+        col = add_part("cylinder", f"Column_{pos[0]}_{pos[1]}", location=(pos[0], pos[1], 6), radius=0.5, depth=12, segments=12)
+        mat = create_material("SteelColumn", COLORS["steel"])
+        apply_material(col, mat)
+        parts.append(col)
+
+    # Gas pumps (vintage style)
+    for x in [0, 8]:
+        # Pump body
+        pump = add_part("cube", f"Pump_{x}", location=(x, 0, 3), scale=(2, 1.5, 6))
+        mat = create_material("PumpRed", (0.8, 0.1, 0.1))
+        apply_material(pump, mat)
+        parts.append(pump)
+
+        # Pump globe on top
+        globe = add_part("uv_sphere", f"Globe_{x}", location=(x, 0, 7), radius=1, segments=12, ring_count=8)
+        mat = create_material("GlobeWhite", COLORS["cream"], emission=0.5)
+        apply_material(globe, mat)
+        parts.append(globe)
+
+    # Tall sign pole with rotating sign
+    pole = add_part("cylinder", "SignPole", location=(20, 0, 12.5), radius=0.4, depth=25)
+    mat = create_material("PoleSteel", COLORS["steel"])
+    apply_material(pole, mat)
+    parts.append(pole)
+
+    # Sign at top
+    sign = add_part("cylinder", "RotatingSign", location=(20, 0, 26), radius=5, depth=1)
+    mat = create_material("SignTeal", COLORS["teal"], emission=1.0)
+    apply_material(sign, mat)
+    parts.append(sign)
+
+    group_objects(parts, "RetroGasStation")
+    export_asset("retro_gas_station")
+
+def create_classic_car_57():
+    """1957-style classic car with fins"""
+    clear_scene()
+    parts = []
+
+    # Main body
+    body = add_part("cube", "CarBody", location=(0, 0, 2), scale=(8, 3, 1.5))
+    mat = create_material("CarTurquoise", COLORS["turquoise"])
+    apply_material(body, mat)
+    parts.append(body)
+
+    # Cabin
+    cabin = add_part("cube", "Cabin", location=(0, 0, 3.5), scale=(4, 2.8, 1.2))
+    mat = create_material("CabinCream", COLORS["cream"])
+    apply_material(cabin, mat)
+    parts.append(cabin)
+
+    # Tail fins
+    for y in [-1.5, 1.5]:
+        fin = add_part("cone", f"Fin_{y}", location=(-4, y, 3), radius1=0.8, radius2=0, depth=2, rotation=(1.57, 0, 0))
+        mat = create_material("FinChrome", COLORS["chrome"])
+        apply_material(fin, mat)
+        parts.append(fin)
+
+    # Wheels
+    for pos in [(-2.5, -1.6), (-2.5, 1.6), (2.5, -1.6), (2.5, 1.6)]:
+        wheel = add_part("cylinder", f"Wheel_{pos[0]}_{pos[1]}", location=(pos[0], pos[1], 1), radius=1, depth=0.6, rotation=(1.57, 0, 0))
+        mat = create_material("Tire", (0.1, 0.1, 0.1))
+        apply_material(wheel, mat)
+        parts.append(wheel)
+
+        # Hubcap
+        hub = add_part("cylinder", f"Hubcap_{pos[0]}_{pos[1]}", location=(pos[0], pos[1] + (0.35 if pos[1] > 0 else -0.35), 1), radius=0.5, depth=0.1, rotation=(1.57, 0, 0))
+        mat = create_material("HubChrome", COLORS["chrome"])
+        apply_material(hub, mat)
+        parts.append(hub)
+
+    # Chrome bumpers
+    for x in [-4.2, 4.2]:
+        bumper = add_part("cube", f"Bumper_{x}", location=(x, 0, 1.5), scale=(0.3, 3, 0.4))
+        mat = create_material("BumperChrome", COLORS["chrome"])
+        apply_material(bumper, mat)
+        parts.append(bumper)
+
+    # Headlights
+    for y in [-1, 1]:
+        light = add_part("uv_sphere", f"Headlight_{y}", location=(4.1, y, 2), radius=0.4, segments=12, ring_count=8)
+        mat = create_material("HeadlightGlow", COLORS["cream"], emission=1.0)
+        apply_material(light, mat)
+        parts.append(light)
+
+    group_objects(parts, "ClassicCar57")
+    export_asset("classic_car_57")
+
+def create_motel_sign():
+    """Iconic retro motel sign with arrow"""
+    clear_scene()
+    parts = []
+
+    # Main pole
+    pole = add_part("cylinder", "Pole", location=(0, 0, 15), radius=0.5, depth=30)
+    mat = create_material("PoleSteel", COLORS["steel"])
+    apply_material(pole, mat)
+    parts.append(pole)
+
+    # Sign board
+    board = add_part("cube", "SignBoard", location=(0, 0, 28), scale=(12, 1, 8))
+    mat = create_material("SignPink", COLORS["pink"])
+    apply_material(board, mat)
+    parts.append(board)
+
+    # "MOTEL" letters (simplified as blocks)
+    for i, x in enumerate([-4, -2, 0, 2, 4]):
+        letter = add_part("cube", f"Letter_{i}", location=(x, 0.6, 28), scale=(1.5, 0.2, 3))
+        mat = create_material("NeonLetters", COLORS["neon_pink"], emission=3.0)
+        apply_material(letter, mat)
+        parts.append(letter)
+
+    # Arrow pointing down
+    arrow = add_part("cone", "Arrow", location=(0, 0.6, 20), radius1=3, radius2=0, depth=5, rotation=(0, 0, 3.14))  # Point down
+    mat = create_material("ArrowNeon", COLORS["neon_orange"], emission=2.0)
+    apply_material(arrow, mat)
+    parts.append(arrow)
+
+    # "VACANCY" sign below
+    vacancy = add_part("cube", "VacancySign", location=(0, 0.6, 14), scale=(8, 0.2, 2))
+    mat = create_material("VacancyNeon", COLORS["neon_green"], emission=2.0)
+    apply_material(vacancy, mat)
+    parts.append(vacancy)
+
+    group_objects(parts, "MotelSign")
+    export_asset("motel_sign")
+
+def create_drive_in_screen():
+    """Drive-in movie theater screen"""
+    clear_scene()
+    parts = []
+
+    # Main screen
+    screen = add_part("cube", "Screen", location=(0, 0, 25), scale=(50, 1, 30))
+    mat = create_material("ScreenWhite", (0.95, 0.95, 0.95))
+    apply_material(screen, mat)
+    parts.append(screen)
+
+    # Support structure (back)
+    for x in [-20, 0, 20]:
+        support = add_part("cube", f"Support_{x}", location=(x, -2, 20), scale=(2, 3, 40))
+        mat = create_material("SupportSteel", COLORS["steel"])
+        apply_material(support, mat)
+        parts.append(support)
+
+    # Cross braces
+    for z in [10, 30]:
+        brace = add_part("cube", f"Brace_{z}", location=(0, -2, z), scale=(45, 1, 1))
+        mat = create_material("BraceSteel", COLORS["steel"])
+        apply_material(brace, mat)
+        parts.append(brace)
+
+    # Speaker posts (a few in front)
+    for x in [-30, -15, 0, 15, 30]:
+        post = add_part("cylinder", f"SpeakerPost_{x}", location=(x, 20, 2.5), radius=0.3, depth=5, segments=12)
+        mat = create_material("PostMetal", COLORS["steel"])
+        apply_material(post, mat)
+        parts.append(post)
+
+    group_objects(parts, "DriveInScreen")
+    export_asset("drive_in_screen")
+
+def create_tiki_bar():
+    """Beach tiki bar with thatched roof"""
+    clear_scene()
+    parts = []
+
+    # Counter
+    counter = add_part("cube", "Counter", location=(0, 0, 2), scale=(12, 4, 2))
+    mat = create_material("BambooCounter", COLORS["wood_light"])
+    apply_material(counter, mat)
+    parts.append(counter)
+
+    # Bamboo posts
+    for pos in [(-5, -2), (-5, 2), (5, -2), (5, 2)]:
+        post = add_part("cylinder", f"Post_{pos[0]}_{pos[1]}", location=(pos[0], pos[1], 5), radius=0.4, depth=10)
+        mat = create_material("Bamboo", COLORS["mustard"])
+        apply_material(post, mat)
+        parts.append(post)
+
+    # Thatched roof (cone shape)
+    roof = add_part("cone", "ThatchedRoof", location=(0, 0, 12), radius1=8, radius2=1, depth=5)
+    mat = create_material("Thatch", COLORS["sand"])
+    apply_material(roof, mat)
+    parts.append(roof)
+
+    # Bar stools
+    for x in [-4, -2, 0, 2, 4]:
+        seat = add_part("cylinder", f"Stool_{x}", location=(x, -3, 2), radius=0.6, depth=0.3, segments=12)
+        mat = create_material("StoolSeat", COLORS["coral"])
+        apply_material(seat, mat)
+        parts.append(seat)
+
+        leg = add_part("cylinder", f"StoolLeg_{x}", location=(x, -3, 1), radius=0.15, depth=2, segments=8)
+        mat = create_material("BambooLeg", COLORS["wood_light"])
+        apply_material(leg, mat)
+        parts.append(leg)
+
+    # Tiki torches on sides
+    for x in [-7, 7]:
+        torch = add_part("cylinder", f"Torch_{x}", location=(x, 0, 4), radius=0.2, depth=8)
+        mat = create_material("TorchBamboo", COLORS["wood_dark"])
+        apply_material(torch, mat)
+        parts.append(torch)
+
+        # Flame
+        flame = add_part("uv_sphere", f"Flame_{x}", location=(x, 0, 8.5), radius=0.5, segments=12, ring_count=8)
+        mat = create_material("Flame", COLORS["orange"], emission=3.0)
+        apply_material(flame, mat)
+        parts.append(flame)
+
+    group_objects(parts, "TikiBar")
+    export_asset("tiki_bar")
+
+# ===========================================
+# 2. BEACH / COASTAL
+# ===========================================
+
+def create_lifeguard_tower():
+    """Classic California lifeguard tower"""
+    clear_scene()
+    parts = []
+
+    # Platform
+    platform = add_part("cube", "Platform", location=(0, 0, 8), scale=(6, 6, 0.5))
+    mat = create_material("PlatformWood", COLORS["wood_light"])
+    apply_material(platform, mat)
+    parts.append(platform)
+
+    # Cabin
+    cabin = add_part("cube", "Cabin", location=(0, 0, 11), scale=(5, 5, 5))
+    mat = create_material("CabinCoral", COLORS["coral"])
+    apply_material(cabin, mat)
+    parts.append(cabin)
+
+    # Roof
+    roof = add_part("cube", "Roof", location=(0, 0, 14.5), scale=(6, 6, 1))
+    mat = create_material("RoofWhite", COLORS["cream"])
+    apply_material(roof, mat)
+    parts.append(roof)
+
+    # Support legs
+    for pos in [(-2.5, -2.5), (-2.5, 2.5), (2.5, -2.5), (2.5, 2.5)]:
+        leg = add_part("cube", f"Leg_{pos[0]}_{pos[1]}", location=(pos[0], pos[1], 4), scale=(0.4, 0.4, 8))
+        mat = create_material("LegWood", COLORS["wood_light"])
+        apply_material(leg, mat)
+        parts.append(leg)
+
+    # Ramp
+    ramp = add_part("cube", "Ramp", location=(0, -6, 4), scale=(2, 6, 0.3), rotation=(0.3, 0, 0))
+    mat = create_material("RampWood", COLORS["wood_light"])
+    apply_material(ramp, mat)
+    parts.append(ramp)
+
+    # Rescue buoy
+    buoy = add_part("torus", "RescueBuoy", location=(3, 0, 9), major_radius=0.8, minor_radius=0.2)
+    mat = create_material("BuoyOrange", COLORS["orange"])
+    apply_material(buoy, mat)
+    parts.append(buoy)
+
+    group_objects(parts, "LifeguardTower")
+    export_asset("lifeguard_tower")
+
+def create_surfboard():
+    """Vintage longboard surfboard"""
+    clear_scene()
+    parts = []
+
+    # Board body (elongated ellipsoid)
+    board = add_part("uv_sphere", "SurfboardBody", location=(0, 0, 0.15), radius=1, scale=(0.8, 4, 0.1), smooth=True)
+    mat = create_material("BoardTurquoise", COLORS["turquoise"])
+    apply_material(board, mat)
+    parts.append(board)
+
+    # Racing stripe
+    stripe = add_part("cube", "Stripe", location=(0, 0, 0.2), scale=(0.15, 3.5, 0.02))
+    mat = create_material("StripeOrange", COLORS["orange"])
+    apply_material(stripe, mat)
+    parts.append(stripe)
+
+    # Fin
+    fin = add_part("cone", "Fin", location=(0, -1.5, 0), radius1=0.3, radius2=0, depth=0.4, rotation=(1.57, 0, 0))
+    mat = create_material("FinDark", COLORS["wood_dark"])
+    apply_material(fin, mat)
+    parts.append(fin)
+
+    group_objects(parts, "Surfboard")
+    export_asset("surfboard")
+
+def create_beach_umbrella():
+    """Colorful beach umbrella"""
+    clear_scene()
+    parts = []
+
+    # Pole
+    pole = add_part("cylinder", "Pole", location=(0, 0, 4), radius=0.1, depth=8)
+    mat = create_material("PoleWood", COLORS["wood_light"])
+    apply_material(pole, mat)
+    parts.append(pole)
+
+    # Umbrella top (cone)
+    umbrella = add_part("cone", "UmbrellaTop", location=(0, 0, 8.5), radius1=4, radius2=0.3, depth=2)
+    mat = create_material("UmbrellaPink", COLORS["pink"])
+    apply_material(umbrella, mat)
+    parts.append(umbrella)
+
+    # Stripes (alternating colored sections)
+    angles = np.array([0, 1.57, 3.14, 4.71])
+    xs, ys = 2 * np.cos(angles), 2 * np.sin(angles)
+    mat = create_material("StripeWhite", COLORS["cream"])
+    for i, angle in enumerate(angles):
+        stripe = add_part("cube", f"Stripe_{i}", location=(xs[i], ys[i], 8), scale=(0.5, 2, 0.1), rotation=(0.5, 0, angle))
+        apply_material(stripe, mat)
+        parts.append(stripe)
+
+    group_objects(parts, "BeachUmbrella")
+    export_asset("beach_umbrella")
+
+def create_pier_section():
+    """Wooden pier section"""
+    clear_scene()
+    parts = []
+
+    # Main deck
+    deck = add_part("cube", "Deck", location=(0, 0, 5), scale=(10, 30, 0.5))
+    mat = create_material("DeckWood", COLORS["driftwood"])
+    apply_material(deck, mat)
+    parts.append(deck)
+
+    # Support pilings
+    for pos in [(-4, -12), (-4, 0), (-4, 12), (4, -12), (4, 0), (4, 12)]:
+        piling = add_part("cylinder", f"Piling_{pos[0]}_{pos[1]}", location=(pos[0], pos[1], 0), radius=0.5, depth=10, segments=12)
+        mat = create_material("PilingWood", COLORS["wood_dark"])
+        apply_material(piling, mat)
+        parts.append(piling)
+
+    # Railings
+    for x in [-5, 5]:
+        rail = add_part("cube", f"Rail_{x}", location=(x, 0, 6.5), scale=(0.2, 30, 0.2))
+        mat = create_material("RailWood", COLORS["wood_light"])
+        apply_material(rail, mat)
+        parts.append(rail)
+
+        # Rail posts
+        for y in range(-12, 15, 6):
+            post = add_part("cube", f"Post_{x}_{y}", location=(x, y, 5.75), scale=(0.2, 0.2, 1.5))
+            mat = create_material("PostWood", COLORS["wood_light"])
+            apply_material(post, mat)
+            parts.append(post)
+
+    group_objects(parts, "PierSection")
+    export_asset("pier_section")
+
+def create_palm_tree():
+    """California palm tree"""
+    clear_scene()
+    parts = []
+
+    # Trunk (slightly curved cylinder segments)
+    for i in range(5):
+        segment = add_part("cylinder", f"Trunk_{i}", location=(i*0.3, 0, 4 + i*8), radius=1.2 - i*0.15, depth=8, segments=12, rotation=(0.05 * i, 0, 0))
+        mat = create_material("TrunkBrown", COLORS["wood_dark"])
+        apply_material(segment, mat)
+        parts.append(segment)
+
+    # Palm fronds - one mesh: a single tilted frond swept radially by
+    # bmesh.ops.spin (7 duplicates + the original = 8 fronds), so the
+    # crown is one object and one material binding instead of eight
+    bm = bmesh.new()
+    bmesh.ops.create_cube(bm, size=1.0)
+    bm.transform(Matrix.Translation((2, 0, 0))
+                 @ Matrix.Rotation(-0.5, 4, 'X')
+                 @ Matrix.Diagonal((8, 0.5, 0.1, 1)))
+    bmesh.ops.spin(bm, geom=bm.verts[:] + bm.edges[:] + bm.faces[:],
+                   cent=(0, 0, 0), axis=(0, 0, 1), dvec=(0, 0, 0),
+                   angle=2 * math.pi * 7 / 8, steps=7, use_duplicate=True)
+    mesh = bpy.data.meshes.new("Fronds")
+    bm.to_mesh(mesh)
+    bm.free()
+    fronds = bpy.data.objects.new("Fronds", mesh)
+    fronds.location = (1.5, 0, 42)
+    _PENDING_LINK.append(fronds)
+    mat = create_material("FrondGreen", COLORS["palm_green"])
+    apply_material(fronds, mat)
+    parts.append(fronds)
+
+    # Coconuts
+    angles = np.linspace(0, 2 * np.pi, 3, endpoint=False)
+    xs, ys = 0.5 * np.cos(angles) + 1.5, 0.5 * np.sin(angles)
+    for i in range(3):
+        coconut = add_part("uv_sphere", f"Coconut_{i}", location=(xs[i], ys[i], 40), radius=0.5, segments=12, ring_count=8)
+        mat = create_material("CoconutBrown", COLORS["wood_dark"])
+        apply_material(coconut, mat)
+        parts.append(coconut)
+
+    group_objects(parts, "PalmTree")
+    export_asset("palm_tree")
+
+# ===========================================
+# 3. EARTHQUAKE / DESTRUCTION
+# ===========================================
+
+def create_cracked_earth():
+    """Ground with earthquake cracks"""
+    clear_scene()
+    parts = []
+
+    # Base ground
+    ground = add_part("cube", "Ground", location=(0, 0, -0.5), scale=(20, 20, 1))
+    mat = create_material("GroundBrown", COLORS["rock_brown"])
+    apply_material(ground, mat)
+    parts.append(ground)
+
+    # Crack fissures (dark gaps): columns are x, y, z-rotation, length,
+    # width; split into (N,3) location/rotation/scale arrays in one pass
+    crack_data = np.array([
+        (0, 0, 0, 15, 1.5),
+        (-5, 3, 0.5, 8, 1),
+        (4, -4, -0.3, 10, 0.8),
+        (-3, -6, 0.2, 7, 0.6),
+    ], dtype=np.float32)
+    n = len(crack_data)
+    zeros = np.zeros(n, dtype=np.float32)
+    crack_locs = np.column_stack([crack_data[:, 0], crack_data[:, 1], np.full(n, 0.1, np.float32)])
+    crack_rots = np.column_stack([zeros, zeros, crack_data[:, 2]])
+    crack_scales = np.column_stack([crack_data[:, 3], crack_data[:, 4], np.full(n, 0.3, np.float32)])
+
+    cracks = add_merged_parts("cube", "Cracks", zip(crack_locs, crack_rots, crack_scales))
+    mat = create_material("CrackDark", (0.05, 0.05, 0.05))
+    apply_material(cracks, mat)
+    parts.append(cracks)
+
+    # Uplifted chunks along cracks - one merged mesh, transforms
+    # computed vectorized over the chunk index
+    idx = np.arange(6, dtype=np.float32)
+    chunk_locs = np.column_stack([(idx - 3) * 3 + (idx % 2) * 0.5, idx * 0.3 - 1, np.full(6, 0.8, np.float32)])
+    chunk_rots = np.column_stack([0.1 * (idx % 3 - 1), 0.1 * (idx % 2), 0.2 * (idx % 4 - 2)])
+    chunks = add_merged_parts("cube", "Chunks",
+                              zip(chunk_locs, chunk_rots, [(2, 1.5, 1.2)] * 6))
+    mat = create_material("ChunkRock", COLORS["rock_brown"])
+    apply_material(chunks, mat)
+    parts.append(chunks)
+
+    group_objects(parts, "CrackedEarth")
+    export_asset("cracked_earth")
+
+def create_steam_vent():
+    """Volcanic steam vent from fault line"""
+    clear_scene()
+    parts = []
+
+    # Vent opening (cone depression)
+    vent = add_part("cone", "VentOpening", location=(0, 0, -1), radius1=3, radius2=1, depth=2, rotation=(3.14, 0, 0))  # Flip upside down
+    mat = create_material("VentRock", COLORS["rock_brown"])
+    apply_material(vent, mat)
+    parts.append(vent)
+
+    # Inner glow
+    glow = add_part("uv_sphere", "InnerGlow", location=(0, 0, -0.5), radius=0.8, segments=12, ring_count=8, smooth=True)
+    mat = create_material("LavaGlow", COLORS["lava_red"], emission=5.0)
+    apply_material(glow, mat)
+    parts.append(glow)
+
+    # Steam clouds (spheres), sizes tapering with height
+    steam_positions = np.array([
+        (0, 0, 2), (0.5, 0.3, 4), (-0.3, 0.5, 6),
+        (0.2, -0.4, 8), (-0.5, 0.2, 10), (0.3, 0.3, 12)
+    ], dtype=np.float32)
+    steam_sizes = 1.5 - 0.15 * np.arange(len(steam_positions))
+    mat = create_material("Steam", (*COLORS["steam_white"], 0.6), emission=0.3)
+    # All six puffs scale one shared pre-smoothed unit sphere
+    for i, pos in enumerate(steam_positions):
+        size = float(steam_sizes[i])
+        steam = add_part("uv_sphere", f"Steam_{i}", location=pos, scale=(size, size, size),
+                         radius=1.0, segments=12, ring_count=8, smooth=True)
+        apply_material(steam, mat)
+        parts.append(steam)
+
+    # Surrounding rocks - one trig pass for the whole ring
+    mat = create_material("SurroundRock", COLORS["rock_brown"])
+    angles = np.linspace(0, 2 * np.pi, 6, endpoint=False)
+    xs, ys = 4 * np.cos(angles), 4 * np.sin(angles)
+    for i, angle in enumerate(angles):
+        rock = add_part("cube", f"Rock_{i}", location=(xs[i], ys[i], 0.5), scale=(1.5, 1, 1), rotation=(0.2, 0.1, angle))
+        apply_material(rock, mat)
+        parts.append(rock)
+
+    group_objects(parts, "SteamVent")
+    export_asset("steam_vent")
+
+def create_rubble_pile():
+    """Pile of building rubble and debris"""
+    clear_scene()
+    parts = []
+
+    # Various sized chunks, merged into one mesh with two material
+    # slots alternated per chunk (bulk material_index write instead of
+    # one object + slot assignment per chunk)
+    chunk_data = [
+        (0, 0, 1, 3, 2, 2, 0.1, 0.2, 0.3),
+        (2, 1, 0.8, 2, 1.5, 1.5, -0.2, 0.1, 0.1),
+        (-1.5, 0.5, 0.6, 1.5, 2, 1, 0.3, -0.1, 0.2),
+        (0.5, -1.5, 0.5, 2.5, 1, 1.2, 0.1, 0.3, -0.1),
+        (-2, -1, 0.4, 1, 1.5, 0.8, -0.1, 0.2, 0.4),
+        (1, 2, 0.3, 1.2, 0.8, 0.6, 0.2, 0.1, 0.15),
+    ]
+    chunks = add_merged_parts("cube", "RubbleChunks", [
+        ((x, y, z), (rx, ry, rz), (sx, sy, sz))
+        for x, y, z, sx, sy, sz, rx, ry, rz in chunk_data
+    ])
+    mesh = chunks.data
+    mesh.materials.append(create_material("RubbleConcrete", COLORS["concrete_gray"]))
+    mesh.materials.append(create_material("RubbleBrick", (0.6, 0.3, 0.2)))
+    polys_per_chunk = len(mesh.polygons) // len(chunk_data)
+    mesh.polygons.foreach_set(
+        "material_index",
+        np.repeat(np.arange(len(chunk_data), dtype=np.int32) % 2, polys_per_chunk))
+    parts.append(chunks)
+
+    # Rebar sticking out - merged into one mesh
+    rebar = add_merged_parts("cylinder", "Rebar", [
+        ((i - 1.5, i * 0.3 - 0.5, 1.5 + i * 0.2), (0.3 + i * 0.1, 0.2, i * 0.2), None)
+        for i in range(4)
+    ], radius=0.05, depth=3, segments=8)
+    mat = create_material("RebarRust", COLORS["rust"])
+    apply_material(rebar, mat)
+    parts.append(rebar)
+
+    group_objects(parts, "RubblePile")
+    export_asset("rubble_pile")
+
+def create_damaged_car():
+    """Earthquake-damaged abandoned car"""
+    clear_scene()
+    parts = []
+
+    # Crushed body
+    body = add_part("cube", "CrushedBody", location=(0, 0, 1.5), scale=(7, 3, 1.2), rotation=(0.1, 0.05, 0.02))
+    mat = create_material("RustedBody", COLORS["rust"])
+    apply_material(body, mat)
+    parts.append(body)
+
+    # Smashed roof
+    roof = add_part("cube", "SmashedRoof", location=(0, 0, 2.8), scale=(3.5, 2.5, 0.6), rotation=(-0.15, 0.1, 0.05))
+    mat = create_material("RustedRoof", COLORS["rust"])
+    apply_material(roof, mat)
+    parts.append(roof)
+
+    # Flat/missing wheels: columns x, y, z, has_wheel (0 = just axle)
+    wheel_data = np.array([
+        (-2, -1.5, 0.4, 1),   # Flat
+        (-2, 1.5, 0.4, 1),
+        (2, -1.5, 0.3, 0),    # Missing (just axle)
+        (2, 1.5, 0.4, 1),
+    ], dtype=np.float32)
+
+    mat = create_material("FlatTire", (0.1, 0.1, 0.1))
+    for i, pos in enumerate(wheel_data[wheel_data[:, 3] > 0, :3]):
+        wheel = add_part("cylinder", f"FlatWheel_{i}", location=pos, radius=0.6, depth=0.4, rotation=(1.57, 0, 0))
+        apply_material(wheel, mat)
+        parts.append(wheel)
+
+    # Broken window glass on ground
+    mat = create_material("BrokenGlass", (0.7, 0.8, 0.85, 0.7))
+    for i in range(5):
+        glass = add_part("cube", f"BrokenGlass_{i}", location=(i - 2, 2 + i * 0.2, 0.05), scale=(0.3, 0.2, 0.02), rotation=(0, 0, i * 0.5))
+        apply_material(glass, mat)
+        parts.append(glass)
+
+    group_objects(parts, "DamagedCar")
+    export_asset("damaged_car")
+
+def create_fallen_power_lines():
+    """Downed power lines and pole"""
+    clear_scene()
+    parts = []
+
+    # Fallen pole
+    pole = add_part("cylinder", "FallenPole", location=(0, 0, 0.5), radius=0.3, depth=15, rotation=(0, 1.4, 0.2))
+    mat = create_material("WoodPole", COLORS["wood_dark"])
+    apply_material(pole, mat)
+    parts.append(pole)
+
+    # Cross beam
+    beam = add_part("cube", "CrossBeam", location=(5, 0, 3), scale=(0.2, 4, 0.2), rotation=(0, 0.3, 0))
+    mat = create_material("BeamWood", COLORS["wood_dark"])
+    apply_material(beam, mat)
+    parts.append(beam)
+
+    # Tangled wires on ground - all 32 segments merged into one mesh
+    wires = add_merged_parts("cylinder", "WireTangle", [
+        ((j - 4 + i, i * 0.5 - 1, 0.2 + j * 0.1), (0.1 * j, 0.2 * i, 0.3 + j * 0.1), None)
+        for i in range(4) for j in range(8)
+    ], radius=0.03, depth=2, segments=8)
+    mat = create_material("WireBlack", (0.05, 0.05, 0.05))
+    apply_material(wires, mat)
+    parts.append(wires)
+
+    # Sparking end (glowing)
+    spark = add_part("uv_sphere", "SparkingEnd", location=(-3, 0, 0.5), radius=0.3, segments=12, ring_count=8, smooth=True)
+    mat = create_material("Spark", (1, 0.9, 0.3), emission=5.0)
+    apply_material(spark, mat)
+    parts.append(spark)
+
+    group_objects(parts, "FallenPowerLines")
+    export_asset("fallen_power_lines")
+
+# ===========================================
+# 4. HORROR / LIMINAL
+# ===========================================
+
+def create_mannequin():
+    """Creepy store mannequin"""
+    clear_scene()
+    parts = []
+
+    # Body
+    torso = add_part("cube", "Torso", location=(0, 0, 4), scale=(1.2, 0.6, 2))
+    mat = create_material("MannequinSkin", (0.9, 0.8, 0.75))
+    apply_material(torso, mat)
+    parts.append(torso)
+
+    # Head
+    head = add_part("uv_sphere", "Head", location=(0, 0, 5.8), radius=0.6, smooth=True)
+    mat = create_material("MannequinSkin", (0.9, 0.8, 0.75))
+    apply_material(head, mat)
+    parts.append(head)
+
+    # Featureless face (slightly darker area)
+    face = add_part("uv_sphere", "Face", location=(0, 0.2, 5.8), radius=0.55, scale=(0.9, 0.5, 0.9), smooth=True)
+    mat = create_material("FaceSkin", (0.85, 0.75, 0.7))
+    apply_material(face, mat)
+    parts.append(face)
+
+    # Arms (slightly posed)
+    mat = create_material("MannequinSkin", (0.9, 0.8, 0.75))
+    for side, y_offset, rot in [(-1, -0.8, 0.3), (1, 0.8, -0.3)]:
+        arm = add_part("cylinder", f"Arm_{side}", location=(0, y_offset, 3.5), radius=0.2, depth=2.5, segments=12, rotation=(0, rot, side * 0.2))
+        apply_material(arm, mat)
+        parts.append(arm)
+
+    # Legs
+    for y_offset in [-0.3, 0.3]:
+        leg = add_part("cylinder", f"Leg_{y_offset}", location=(0, y_offset, 1.5), radius=0.25, depth=3, segments=12)
+        apply_material(leg, mat)
+        parts.append(leg)
+
+    # Base stand
+    base = add_part("cylinder", "Base", location=(0, 0, 0.1), radius=0.8, depth=0.2)
+    mat = create_material("BaseBlack", (0.1, 0.1, 0.1))
+    apply_material(base, mat)
+    parts.append(base)
+
+    group_objects(parts, "Mannequin")
+    export_asset("mannequin")
+
+def create_empty_pool():
+    """Drained swimming pool - liminal space"""
+    clear_scene()
+    parts = []
+
+    # Pool walls
+    pool = add_part("cube", "PoolBasin", location=(0, 0, -3), scale=(15, 25, 6))
+    mat = create_material("PoolBlue", (0.6, 0.8, 0.9))
+    apply_material(pool, mat)
+    parts.append(pool)
+
+    # Pool floor (darker, stained)
+    floor = add_part("cube", "PoolFloor", location=(0, 0, -5.9), scale=(14.5, 24.5, 0.2))
+    mat = create_material("StainedFloor", COLORS["mold_green"])
+    apply_material(floor, mat)
+    parts.append(floor)
+
+    # Drain
+    drain = add_part("cylinder", "Drain", location=(0, 8, -5.8), radius=0.5, depth=0.1)
+    mat = create_material("DrainMetal", COLORS["steel"])
+    apply_material(drain, mat)
+    parts.append(drain)
+
+    # Ladder
+    mat = create_material("ChromeRail", COLORS["chrome"])
+    for y in [0.3, -0.3]:
+        rail = add_part("cylinder", f"LadderRail_{y}", location=(-7, y, -2), radius=0.1, depth=8, segments=12)
+        apply_material(rail, mat)
+        parts.append(rail)
+
+    # Ladder rungs - merged into one mesh
+    rungs = add_merged_parts("cylinder", "Rungs", [
+        ((-7, 0, z), (1.57, 0, 0), None) for z in range(-5, 2, 1)
+    ], radius=0.08, depth=0.6, segments=8)
+    mat = create_material("ChromeRung", COLORS["chrome"])
+    apply_material(rungs, mat)
+    parts.append(rungs)
+
+    # Abandoned pool toys
+    floatie = add_part("torus", "Floatie", location=(5, -5, -5.5), major_radius=1.5, minor_radius=0.3, rotation=(0.2, 0.1, 0))
+    mat = create_material("FloatiePink", COLORS["pink"])
+    apply_material(floatie, mat)
+    parts.append(floatie)
+
+    # Beach ball (deflated)
+    ball = add_part("uv_sphere", "DeflatedBall", location=(-3, 3, -5.5), radius=0.8, scale=(1, 1, 0.3), segments=12, ring_count=8, smooth=True)
+    mat = create_material("BeachBall", COLORS["coral"])
+    apply_material(ball, mat)
+    parts.append(ball)
+
+    group_objects(parts, "EmptyPool")
+    export_asset("empty_pool")
+
+def create_old_tv():
+    """Vintage TV with static"""
+    clear_scene()
+    parts = []
+
+    # Cabinet
+    cabinet = add_part("cube", "Cabinet", location=(0, 0, 3), scale=(4, 3, 3.5))
+    mat = create_material("WoodCabinet", COLORS["wood_dark"])
+    apply_material(cabinet, mat)
+    parts.append(cabinet)
+
+    # Screen (glowing static)
+    screen = add_part("cube", "Screen", location=(0, 1.4, 3.2), scale=(2.5, 0.1, 2))
+    mat = create_material("StaticScreen", COLORS["sickly_yellow"], emission=0.5)
+    apply_material(screen, mat)
+    parts.append(screen)
+
+    # Screen bezel
+    bezel = add_part("cube", "Bezel", location=(0, 1.35, 3.2), scale=(2.8, 0.05, 2.3))
+    mat = create_material("BezelGray", COLORS["concrete_gray"])
+    apply_material(bezel, mat)
+    parts.append(bezel)
+
+    # Knobs
+    mat = create_material("KnobBrown", COLORS["wood_dark"])
+    for z in [2, 3, 4]:
+        knob = add_part("cylinder", f"Knob_{z}", location=(1.6, 1.5, z), radius=0.2, depth=0.3, segments=12, rotation=(1.57, 0, 0))
+        apply_material(knob, mat)
+        parts.append(knob)
+
+    # Antenna ears
+    mat = create_material("AntennaChrome", COLORS["chrome"])
+    for x in [-1, 1]:
+        antenna = add_part("cylinder", f"Antenna_{x}", location=(x, 0, 5.5), radius=0.05, depth=3, segments=8, rotation=(0, x * 0.4, 0))
+        apply_material(antenna, mat)
+        parts.append(antenna)
+
+    # Legs
+    mat = create_material("LegWood", COLORS["wood_dark"])
+    for pos in [(-1.5, -1), (-1.5, 1), (1.5, -1), (1.5, 1)]:
+        leg = add_part("cylinder", f"Leg_{pos[0]}_{pos[1]}", location=(pos[0], pos[1], 0.6), radius=0.15, depth=1.2, segments=12)
+        apply_material(leg, mat)
+        parts.append(leg)
+
+    group_objects(parts, "OldTV")
+    export_asset("old_tv")
+
+def create_flickering_light():
+    """Ceiling fluorescent light fixture"""
+    clear_scene()
+    parts = []
+
+    # Housing
+    housing = add_part("cube", "Housing", location=(0, 0, 0), scale=(6, 1.5, 0.3))
+    mat = create_material("HousingWhite", COLORS["cream"])
+    apply_material(housing, mat)
+    parts.append(housing)
+
+    # Tubes (glowing)
+    for y in [-0.3, 0.3]:
+        tube = add_part("cylinder", f"Tube_{y}", location=(0, y, -0.25), radius=0.12, depth=5, segments=12, rotation=(0, 1.57, 0))
+        # One tube dimmer (flickering effect)
+        emission = 3.0 if y > 0 else 1.0
+        mat = create_material(f"TubeGlow_{y}", COLORS["sickly_yellow"], emission=emission)
+        apply_material(tube, mat)
+        parts.append(tube)
+
+    # End caps
+    mat = create_material("CapGray", COLORS["concrete_gray"])
+    for x in [-2.7, 2.7]:
+        cap = add_part("cube", f"EndCap_{x}", location=(x, 0, -0.15), scale=(0.3, 1.3, 0.2))
+        apply_material(cap, mat)
+        parts.append(cap)
+
+    group_objects(parts, "FlickeringLight")
+    export_asset("flickering_light")
+
+def create_shopping_cart():
+    """Abandoned shopping cart"""
+    clear_scene()
+    parts = []
+
+    # Basket frame
+    basket = add_part("cube", "Basket", location=(0, 0, 2.5), scale=(2, 3, 2))
+    mat = create_material("WireFrame", COLORS["chrome"])
+    apply_material(basket, mat)
+    parts.append(basket)
+
+    # Handle
+    handle = add_part("cylinder", "Handle", location=(0, -1.8, 3.5), radius=0.08, depth=2.5, segments=12, rotation=(0.3, 0, 0))
+    mat = create_material("HandleChrome", COLORS["chrome"])
+    apply_material(handle, mat)
+    parts.append(handle)
+
+    # Wheels
+    mat = create_material("WheelBlack", (0.1, 0.1, 0.1))
+    for pos in [(-0.8, -1.2), (-0.8, 1.2), (0.8, -1.2), (0.8, 1.2)]:
+        wheel = add_part("cylinder", f"Wheel_{pos[0]}_{pos[1]}", location=(pos[0], pos[1], 0.3), radius=0.3, depth=0.15, segments=12, rotation=(1.57, 0, 0))
+        apply_material(wheel, mat)
+        parts.append(wheel)
+
+    # Child seat (folded)
+    seat = add_part("cube", "ChildSeat", location=(0, 1.3, 2), scale=(1.8, 0.3, 0.8))
+    mat = create_material("SeatPlastic", (0.3, 0.3, 0.35))
+    apply_material(seat, mat)
+    parts.append(seat)
+
+    group_objects(parts, "ShoppingCart")
+    export_asset("shopping_cart")
+
+# ===========================================
+# 5. SURVIVAL PROPS
+# ===========================================
+
+def create_first_aid_kit():
+    """Emergency first aid kit"""
+    clear_scene()
+    parts = []
+
+    # Box
+    box = add_part("cube", "Box", location=(0, 0, 0.5), scale=(2, 1.2, 0.8))
+    mat = create_material("BoxWhite", (0.95, 0.95, 0.95))
+    apply_material(box, mat)
+    parts.append(box)
+
+    # Red cross
+    mat = create_material("RedCross", (0.9, 0.1, 0.1))
+    cross_h = add_part("cube", "CrossH", location=(0, 0.61, 0.5), scale=(0.8, 0.02, 0.2))
+    apply_material(cross_h, mat)
+    parts.append(cross_h)
+
+    cross_v = add_part("cube", "CrossV", location=(0, 0.61, 0.5), scale=(0.2, 0.02, 0.8))
+    apply_material(cross_v, mat)
+    parts.append(cross_v)
+
+    # Handle
+    handle = add_part("cube", "Handle", location=(0, 0, 1.1), scale=(0.8, 0.1, 0.15))
+    mat = create_material("HandleGray", COLORS["concrete_gray"])
+    apply_material(handle, mat)
+    parts.append(handle)
+
+    # Latches
+    mat = create_material("LatchMetal", COLORS["chrome"])
+    for x in [-0.7, 0.7]:
+        latch = add_part("cube", f"Latch_{x}", location=(x, 0.5, 0.5), scale=(0.15, 0.15, 0.08))
+        apply_material(latch, mat)
+        parts.append(latch)
+
+    group_objects(parts, "FirstAidKit")
+    export_asset("first_aid_kit")
+
+def create_flashlight():
+    """Heavy duty flashlight"""
+    clear_scene()
+    parts = []
+
+    # Body
+    mat = create_material("BodyBlack", (0.1, 0.1, 0.1))
+    body = add_part("cylinder", "Body", location=(0, 0, 1.25), radius=0.3, depth=2.5)
+    apply_material(body, mat)
+    parts.append(body)
+
+    # Head
+    head = add_part("cylinder", "Head", location=(0, 0, 2.9), radius=0.5, depth=0.8)
+    apply_material(head, mat)
+    parts.append(head)
+
+    # Lens
+    lens = add_part("cylinder", "Lens", location=(0, 0, 3.35), radius=0.45, depth=0.1)
+    mat = create_material("LensGlow", COLORS["cream"], emission=2.0)
+    apply_material(lens, mat)
+    parts.append(lens)
+
+    # Grip ridges
+    mat = create_material("RidgeGray", (0.2, 0.2, 0.2))
+    for z in [0.5, 0.8, 1.1, 1.4, 1.7]:
+        ridge = add_part("torus", f"Ridge_{z}", location=(0, 0, z), major_radius=0.32, minor_radius=0.03)
+        apply_material(ridge, mat)
+        parts.append(ridge)
+
+    # Button
+    button = add_part("cylinder", "Button", location=(0.25, 0, 2), radius=0.08, depth=0.05, rotation=(0, 1.57, 0))
+    mat = create_material("ButtonOrange", COLORS["orange"])
+    apply_material(button, mat)
+    parts.append(button)
+
+    group_objects(parts, "Flashlight")
+    export_asset("flashlight")
+
+def create_camping_tent():
+    """Small survival tent"""
+    clear_scene()
+    parts = []
+
+    # Main tent body (triangular prism)
+    tent = add_part("cone", "TentBody", location=(0, 0, 2), radius1=4, radius2=4, depth=6, segments=3, rotation=(1.57, 0, 0))
+    mat = create_material("TentOrange", COLORS["orange"])
+    apply_material(tent, mat)
+    parts.append(tent)
+
+    # Door opening (darker)
+    door = add_part("cone", "Door", location=(0, 3.1, 1.5), radius1=1.5, radius2=1.5, depth=0.5, segments=3, rotation=(1.57, 0, 0))
+    mat = create_material("DoorDark", (0.1, 0.1, 0.1))
+    apply_material(door, mat)
+    parts.append(door)
+
+    # Guy lines
+    mat = create_material("RopeYellow", COLORS["mustard"])
+    for angle in [0, 2.09, 4.18]:
+        x = 5 * math.cos(angle)
+        y = 5 * math.sin(angle)
+        line = add_part("cylinder", f"GuyLine_{angle}", location=(x/2, y/2, 1.5), radius=0.02, depth=5, rotation=(0, 0.5, angle))
+        apply_material(line, mat)
+        parts.append(line)
+
+    group_objects(parts, "CampingTent")
+    export_asset("camping_tent")
+
+def create_campfire():
+    """Campfire with logs"""
+    clear_scene()
+    parts = []
+
+    # Fire pit ring (rocks) - one trig pass for the whole ring
+    mat = create_material("RockGray", COLORS["rock_brown"])
+    angles = np.linspace(0, 2 * np.pi, 8, endpoint=False)
+    xs, ys = 2 * np.cos(angles), 2 * np.sin(angles)
+    for i, angle in enumerate(angles):
+        rock = add_part("cube", f"Rock_{i}", location=(xs[i], ys[i], 0.3), scale=(0.8, 0.6, 0.5), rotation=(0.1, 0.1, angle))
+        apply_material(rock, mat)
+        parts.append(rock)
+
+    # Logs
+    mat = create_material("LogWood", COLORS["wood_dark"])
+    for i, (x, y, rot) in enumerate([(-0.5, 0, 0.5), (0.5, 0, -0.5), (0, -0.3, 1.57)]):
+        log = add_part("cylinder", f"Log_{i}", location=(x, y, 0.5), radius=0.25, depth=2, rotation=(0, 0.3, rot))
+        apply_material(log, mat)
+        parts.append(log)
+
+    # Flames (stylized): columns x, y, z, size
+    flame_positions = np.array([
+        (0, 0, 1, 0.6), (-0.3, 0.2, 1.3, 0.4), (0.3, -0.2, 1.2, 0.5),
+        (0, 0.3, 1.5, 0.3), (-0.2, -0.3, 1.4, 0.35)
+    ], dtype=np.float32)
+    mat = create_material("FlameOrange", COLORS["orange"], emission=5.0)
+    for i, (x, y, z, s) in enumerate(flame_positions):
+        flame = add_part("cone", f"Flame_{i}", location=(x, y, z), radius1=float(s) * 0.5, radius2=0, depth=float(s) * 2)
+        apply_material(flame, mat)
+        parts.append(flame)
+
+    # Embers (small glowing spheres)
+    mat = create_material("EmberGlow", COLORS["lava_red"], emission=3.0)
+    for i in range(10):
+        x = (i % 3 - 1) * 0.5
+        y = (i // 3 - 1) * 0.4
+        ember = add_part("uv_sphere", f"Ember_{i}", location=(x, y, 0.15), radius=0.08, smooth=True)
+        apply_material(ember, mat)
+        parts.append(ember)
+
+    group_objects(parts, "Campfire")
+    export_asset("campfire")
+
+def create_water_bottle():
+    """Plastic water bottle"""
+    clear_scene()
+    parts = []
+
+    # Bottle body
+    mat = create_material("BottlePlastic", (0.7, 0.85, 0.95, 0.8))
+    body = add_part("cylinder", "Bottle", location=(0, 0, 1), radius=0.4, depth=2, smooth=True)
+    apply_material(body, mat)
+    parts.append(body)
+
+    # Neck
+    neck = add_part("cylinder", "Neck", location=(0, 0, 2.2), radius=0.2, depth=0.4)
+    apply_material(neck, mat)
+    parts.append(neck)
+
+    # Cap
+    cap = add_part("cylinder", "Cap", location=(0, 0, 2.55), radius=0.22, depth=0.25)
+    mat = create_material("CapBlue", COLORS["ocean_blue"])
+    apply_material(cap, mat)
+    parts.append(cap)
+
+    # Water inside (visible through bottle)
+    water = add_part("cylinder", "Water", location=(0, 0, 0.8), radius=0.35, depth=1.2)
+    mat = create_material("WaterBlue", (0.5, 0.7, 0.9, 0.6))
+    apply_material(water, mat)
+    parts.append(water)
+
+    # Label
+    label = add_part("cylinder", "Label", location=(0, 0, 1), radius=0.42, depth=0.8)
+    mat = create_material("LabelWhite", COLORS["cream"])
+    apply_material(label, mat)
+    parts.append(label)
+
+    group_objects(parts, "WaterBottle")
+    export_asset("water_bottle")
+
+# ===========================================
+# 6. SIGNS AND MARKERS
+# ===========================================
+
+# Sign part tables: rows are (shape, name, location, dims, scale,
+# rotation, material, color, emission), driven by _build like the diner.
+WARNING_SIGN_PARTS = [
+    ("cylinder", "Post", (0, 0, 4), {"radius": 0.15, "depth": 8}, None, None, "PostMetal", "steel", 0),
+    # Diamond sign (rotated 45 degrees)
+    ("cube", "Sign", (0, 0.2, 7), None, (3, 0.1, 3), (0, 0, 0.785), "SignYellow", "mustard", 0),
+    # Exclamation mark (simplified)
+    ("cube", "Exclaim", (0, 0.25, 7.2), None, (0.3, 0.05, 1.2), None, "ExclaimBlack", (0.05, 0.05, 0.05), 0),
+    ("cube", "Dot", (0, 0.25, 6.2), None, (0.3, 0.05, 0.3), None, "ExclaimBlack", (0.05, 0.05, 0.05), 0),
+]
+
+ROUTE_66_SIGN_PARTS = [
+    ("cylinder", "Post", (0, 0, 5), {"radius": 0.2, "depth": 10}, None, None, "PostWood", "wood_dark", 0),
+    # Shield shape (simplified as rounded cube)
+    ("cube", "Shield", (0, 0.3, 9), None, (3, 0.15, 3.5), None, "ShieldWhite", "cream", 0),
+    ("cube", "InnerShield", (0, 0.35, 9), None, (2.5, 0.05, 3), None, "InnerBlack", (0.1, 0.1, 0.1), 0),
+] + [
+    # 66 numbers (simplified blocks)
+    ("cube", f"Six_{x}", (x, 0.4, 9), None, (0.6, 0.05, 1.2), None, "NumWhite", "cream", 0)
+    for x in [-0.5, 0.5]
+]
+
+EVACUATION_SIGN_PARTS = [
+    ("cube", "Post", (0, 0, 4), None, (0.3, 0.3, 8), None, "PostSteel", "steel", 0),
+    ("cube", "Panel", (0, 0.2, 7), None, (5, 0.1, 2), None, "PanelGreen", (0.1, 0.5, 0.2), 0),
+    # Arrow, shaft and running figure all share one white
+    ("cone", "Arrow", (1.5, 0.25, 7), {"radius1": 0.5, "radius2": 0, "depth": 1}, None, (0, 0, -1.57), "ArrowWhite", "cream", 0),
+    ("cube", "Shaft", (0, 0.25, 7), None, (2, 0.05, 0.3), None, "ArrowWhite", "cream", 0),
+    ("uv_sphere", "FigureHead", (-1.5, 0.25, 7.3), {"radius": 0.3, "smooth": True}, None, None, "ArrowWhite", "cream", 0),
+    ("cube", "FigureBody", (-1.5, 0.25, 6.7), None, (0.3, 0.05, 0.6), None, "ArrowWhite", "cream", 0),
+]
+
+def create_warning_sign():
+    """Diamond-shaped warning sign"""
+    _build(WARNING_SIGN_PARTS, "WarningSign", "warning_sign")
+
+def create_route_66_sign():
+    """Classic Route 66 highway shield"""
+    _build(ROUTE_66_SIGN_PARTS, "Route66Sign", "route_66_sign")
+
+def create_evacuation_sign():
+    """Emergency evacuation route sign"""
+    _build(EVACUATION_SIGN_PARTS, "EvacuationSign", "evacuation_sign")
+
+# ===========================================
+# 7. VEGETATION
+# ===========================================
+
+def create_dead_tree():
+    """Dead/burnt tree"""
+    clear_scene()
+    parts = []
+
+    # Trunk
+    mat = create_material("DeadWood", (0.2, 0.15, 0.1))
+    trunk = add_part("cone", "Trunk", location=(0, 0, 7.5), radius1=1.5, radius2=0.3, depth=15)
+    apply_material(trunk, mat)
+    parts.append(trunk)
+
+    # Dead branches: columns x, y, z, length, then euler rotation
+    branches = np.array([
+        (0, 0, 10, 5, 0.3, 0.8, 0.3),
+        (0, 0, 12, 4, -0.3, -0.5, 0.4),
+        (0, 0, 8, 3.5, 0.5, 0.2, -0.3),
+        (0, 0, 14, 2.5, -0.4, 0.6, 0.2),
+    ], dtype=np.float32)
+
+    for i, (x, y, z, length, rx, ry, rz) in enumerate(branches):
+        branch = add_part("cone", f"Branch_{i}", location=(x, y, z), radius1=0.2, radius2=0.05, depth=float(length), rotation=(rx, ry, rz))
+        apply_material(branch, mat)
+        parts.append(branch)
+
+    group_objects(parts, "DeadTree")
+    export_asset("dead_tree")
+
+def create_cactus():
+    """Desert saguaro cactus"""
+    clear_scene()
+    parts = []
+
+    # Main body
+    mat = create_material("CactusGreen", (0.2, 0.5, 0.2))
+    body = add_part("cylinder", "Body", location=(0, 0, 6), radius=1, depth=12)
+    apply_material(body, mat)
+    parts.append(body)
+
+    # Arms
+    arms = [
+        (0, 0, 7, 1.57, 0.5, 4),   # Right arm
+        (0, 0, 9, -1.57, -0.4, 3), # Left arm
+    ]
+
+    for i, (x, y, z, rot_y, rot_z, length) in enumerate(arms):
+        # Horizontal section
+        arm_h = add_part("cylinder", f"ArmH_{i}", location=(1.5 * (1 if i == 0 else -1), 0, z), radius=0.6, depth=2, rotation=(0, rot_y, 0))
+        apply_material(arm_h, mat)
+        parts.append(arm_h)
+
+        # Vertical section
+        arm_v = add_part("cylinder", f"ArmV_{i}", location=(2.5 * (1 if i == 0 else -1), 0, z + length/2), radius=0.5, depth=length)
+        apply_material(arm_v, mat)
+        parts.append(arm_v)
+
+    group_objects(parts, "Cactus")
+    export_asset("cactus")
+
+def create_tumbleweed():
+    """Rolling tumbleweed"""
+    clear_scene()
+    parts = []
+
+    # Core sphere (icosphere for organic look)
+    mat = create_material("TumbleCore", COLORS["sand"])
+    core = add_part("ico_sphere", "Core", location=(0, 0, 1.5), radius=1.5, subdivisions=2)
+    apply_material(core, mat)
+    parts.append(core)
+
+    # Spiky branches: random-ish points on the sphere surface, all 20
+    # computed in one vectorized pass
+    idx = np.arange(20)
+    theta = idx / 20 * 2 * np.pi
+    phi = (idx % 5) * 0.6 + 0.3
+    xs = 1.5 * np.sin(phi) * np.cos(theta)
+    ys = 1.5 * np.sin(phi) * np.sin(theta)
+    zs = 1.5 * np.cos(phi) + 1.5
+    lengths = 0.5 + (idx % 3) * 0.3
+    for i in idx:
+        # Point outward
+        stick = add_part("cylinder", f"Stick_{i}", location=(xs[i] * 1.2, ys[i] * 1.2, zs[i]), radius=0.03, depth=float(lengths[i]), rotation=(phi[i] - 1.57, 0, theta[i]))
+        apply_material(stick, mat)
+        parts.append(stick)
+
+    group_objects(parts, "Tumbleweed")
+    export_asset("tumbleweed")
+
+# ===========================================
+# MAIN EXECUTION
+# ===========================================
+
+# Registry of every asset generator, grouped for progress output.  The
+# snake_case names double as CLI handles and match the exported .fbx
+# filenames.
+ASSET_CATEGORIES = [
+    ("Retro 60s California", [
+        ("vintage_diner", create_vintage_diner),
+        ("retro_gas_station", create_retro_gas_station),
+        ("classic_car_57", create_classic_car_57),
+        ("motel_sign", create_motel_sign),
+        ("drive_in_screen", create_drive_in_screen),
+        ("tiki_bar", create_tiki_bar),
+    ]),
+    ("Beach/Coastal", [
+        ("lifeguard_tower", create_lifeguard_tower),
+        ("surfboard", create_surfboard),
+        ("beach_umbrella", create_beach_umbrella),
+        ("pier_section", create_pier_section),
+        ("palm_tree", create_palm_tree),
+    ]),
+    ("Earthquake/Destruction", [
+        ("cracked_earth", create_cracked_earth),
+        ("steam_vent", create_steam_vent),
+        ("rubble_pile", create_rubble_pile),
+        ("damaged_car", create_damaged_car),
+        ("fallen_power_lines", create_fallen_power_lines),
+    ]),
+    ("Horror/Liminal", [
+        ("mannequin", create_mannequin),
+        ("empty_pool", create_empty_pool),
+        ("old_tv", create_old_tv),
+        ("flickering_light", create_flickering_light),
+        ("shopping_cart", create_shopping_cart),
+    ]),
+    ("Survival Props", [
+        ("first_aid_kit", create_first_aid_kit),
+        ("flashlight", create_flashlight),
+        ("camping_tent", create_camping_tent),
+        ("campfire", create_campfire),
+        ("water_bottle", create_water_bottle),
+    ]),
+    ("Signs and Markers", [
+        ("warning_sign", create_warning_sign),
+        ("route_66_sign", create_route_66_sign),
+        ("evacuation_sign", create_evacuation_sign),
+    ]),
+    ("Vegetation", [
+        ("dead_tree", create_dead_tree),
+        ("cactus", create_cactus),
+        ("tumbleweed", create_tumbleweed),
+    ]),
+]
+
+ASSETS = {name: fn for _, group in ASSET_CATEGORIES for name, fn in group}
+
+def asset_digests():
+    """Per-asset digest of the sources that determine each export.
+
+    Each asset's digest combines the hash of its own create_* source
+    with a core hash of everything else (this script minus the create_*
+    bodies, plus blender_utils).  Written next to each .fbx; editing one
+    builder only invalidates that asset, while a change to the shared
+    helpers or part tables still invalidates everything.
+    """
+    here = os.path.dirname(os.path.abspath(__file__))
+    with open(os.path.abspath(__file__)) as f:
+        core = f.read()
+    fn_hashes = {}
+    for name, fn in ASSETS.items():
+        source = inspect.getsource(fn)
+        core = core.replace(source, "")
+        fn_hashes[name] = hashlib.blake2b(source.encode()).hexdigest()[:16]
+    with open(os.path.join(here, "blender_utils.py")) as f:
+        core += f.read()
+    core_hash = hashlib.blake2b(core.encode()).hexdigest()[:16]
+    return {name: f"{core_hash}:{h}" for name, h in fn_hashes.items()}
+
+def parse_args():
+    """Parse arguments after Blender's own (everything past the -- separator)."""
+    argv = sys.argv
+    argv = argv[argv.index("--") + 1:] if "--" in argv else []
+
+    parser = argparse.ArgumentParser(description="Generate the asset arsenal")
+    parser.add_argument("--assets", nargs="+", choices=sorted(ASSETS),
+                        help="Only build these assets (default: all)")
+    parser.add_argument("--jobs", type=int, default=1,
+                        help="Build assets in N parallel Blender processes")
+    return parser.parse_args(argv)
+
+def run_parallel(jobs):
+    """Shard the asset list across background Blender worker processes.
+
+    Each asset build is independent (clear_scene + export), so workers
+    never contend; the only shared state is the output directory.
+    """
+    names = list(ASSETS)
+    shards = [names[i::jobs] for i in range(jobs)]
+    shards = [shard for shard in shards if shard]
+
+    def run_shard(shard):
+        return subprocess.run(
+            [bpy.app.binary_path, "--background",
+             "--python", os.path.abspath(__file__),
+             "--", "--assets", *shard],
+            capture_output=True, text=True,
+        )
+
+    with ThreadPoolExecutor(max_workers=len(shards)) as pool:
+        results = list(pool.map(run_shard, shards))
+
+    failed = False
+    for shard, result in zip(shards, results):
+        if result.returncode != 0:
+            failed = True
+            print(f"Worker for {shard} failed:")
+            print(result.stdout)
+            print(result.stderr)
+    if failed:
+        sys.exit(1)
+
+def main():
+    args = parse_args()
+
+    print("=" * 50)
+    print("FAULTLINE FEAR: ASSET ARSENAL GENERATOR")
+    print("=" * 50)
+
+    ensure_output_dir()
+
+    if args.jobs > 1 and not args.assets:
+        run_parallel(args.jobs)
+    else:
+        selected = set(args.assets) if args.assets else set(ASSETS)
+        digests = asset_digests()
+        step = 0
+        total = sum(1 for _, group in ASSET_CATEGORIES
+                    if any(name in selected for name, _ in group))
+        with fast_build():
+            for category, group in ASSET_CATEGORIES:
+                todo = [(name, fn) for name, fn in group if name in selected]
+                if not todo:
+                    continue
+                step += 1
+                print(f"\n[{step}/{total}] Creating {category} assets...")
+                for name, fn in todo:
+                    fbx_path = os.path.join(OUTPUT_DIR, f"{name}.fbx")
+                    marker_path = f"{fbx_path}.hash"
+                    if os.path.exists(fbx_path) and os.path.exists(marker_path):
+                        with open(marker_path) as f:
+                            if f.read().strip() == digests[name]:
+                                print(f"Up to date: {name}")
+                                continue
+                    fn()
+                    with open(marker_path, "w") as f:
+                        f.write(digests[name])
+
+    print("\n" + "=" * 50)
+    print("ASSET GENERATION COMPLETE!")
+    print(f"Output directory: {OUTPUT_DIR}")
+    print("=" * 50)
+
+if __name__ == "__main__":
+    main()